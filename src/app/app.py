@@ -4,27 +4,24 @@ Modern, modular Streamlit application for stress risk assessment.
 """
 
 import streamlit as st
-import pandas as pd
+from functools import partial
 
-# Import utilities
-from utils.constants import STRESS_LABELS, QUESTION_MAP, SUGGESTION_RULES
-from utils.model import (
-    load_model,
-    get_feature_names,
-    explain_with_coefficients,
-    predict_proba_safe,
-    format_feature_label,
-    make_report_text,
-    set_defaults
-)
+# Import utilities (lightweight only; the model stack is imported after page routing)
 from utils.styles import load_css, risk_badge_html, get_theme_colors
 
 # Import components
 from components.navbar import render_navbar
 from components.sidebar import render_sidebar
-from components.cards import render_info_card, render_header
+from components.cards import render_info_card, render_header, render_result_card, result_content_html
 from components.forms import render_all_questions
-from components.pages import render_about_page, render_results_page
+from components.pages import render_about_page, render_results_page, render_history_page
+from components.templates import fragment_cache_stats
+from components.devpanel import render_profiler_panel
+from utils.profiler import begin_rerun, dev_span
+from utils.metrics import PREDICTIONS, get_metrics_exporter, record_rerun
+
+# Streamlit >= 1.52 builds download payloads on click; older versions need them upfront
+DEFERRED_DOWNLOADS = tuple(int(p) for p in st.__version__.split(".")[:2]) >= (1, 52)
 
 # ========== PAGE CONFIGURATION ==========
 st.set_page_config(
@@ -33,49 +30,105 @@ st.set_page_config(
     layout="wide"
 )
 
+# ========== METRICS ==========
+# Prometheus exposition when AURA_METRICS_PORT / AURA_METRICS_FILE is set (started once per process)
+get_metrics_exporter()
+
+# ========== DEVELOPER PROFILER (?debug=1) ==========
+DEBUG = st.query_params.get("debug") == "1"
+profiler = begin_rerun(DEBUG, __file__)
+
 # ========== THEME INITIALIZATION ==========
 if "theme" not in st.session_state:
     st.session_state["theme"] = "dark"
 
 # ========== LOAD CSS STYLES ==========
-load_css(st.session_state["theme"])
+with dev_span("CSS load"):
+    load_css(st.session_state["theme"])
 
 # ========== RENDER NAVBAR ==========
-render_navbar(st.session_state["theme"])
+with dev_span("navbar"):
+    render_navbar(st.session_state["theme"])
 
 # ========== RENDER SIDEBAR & HANDLE THEME TOGGLE ==========
-new_theme = render_sidebar(st.session_state["theme"])
+with dev_span("sidebar"):
+    new_theme = render_sidebar(st.session_state["theme"])
 if new_theme != st.session_state["theme"]:
     st.session_state["theme"] = new_theme
     st.rerun()
 
-# ========== LOAD MODEL & FEATURES ==========
-model = load_model()
-feature_names = get_feature_names()
+# Debug: fragment cache hit counter and rerun profiler (?debug=1)
+if DEBUG:
+    frag_stats = fragment_cache_stats()
+    st.sidebar.caption(
+        f"Fragment cache: {frag_stats['hits']} hits / {frag_stats['misses']} misses "
+        f"({frag_stats['hit_rate']:.0%}), {frag_stats['size']}/{frag_stats['maxsize']} entries"
+    )
+    # Filled at the end of the rerun, once every phase has been timed
+    dev_panel = st.sidebar.container()
+
+
+def finish_rerun():
+    """Close this rerun's profile and draw the developer panel (?debug=1 only)."""
+    if profiler is not None:
+        profiler.end()
+        render_profiler_panel(profiler, dev_panel)
 
-# Initialize defaults once
-if "initialized" not in st.session_state:
-    set_defaults(feature_names)
-    st.session_state["initialized"] = True
 
 # Initialize page navigation
 if "current_page" not in st.session_state:
     st.session_state["current_page"] = "assessment"
+record_rerun(st.session_state["current_page"])
 
 # ========== MAIN CONTENT ==========
 colors = get_theme_colors(st.session_state["theme"])
 
 # ========== PAGE ROUTING ==========
+# Routed before any model code runs: About and Results never load the model stack
 if st.session_state["current_page"] == "about":
-    render_about_page(st.session_state["theme"])
+    with dev_span("page render"):
+        render_about_page(st.session_state["theme"])
+    finish_rerun()
     st.stop()  # Don't render the rest of the page
     
 elif st.session_state["current_page"] == "results":
-    render_results_page(st.session_state["theme"])
+    with dev_span("page render"):
+        render_results_page(st.session_state["theme"])
+    finish_rerun()
+    st.stop()  # Don't render the rest of the page
+
+elif st.session_state["current_page"] == "history":
+    with dev_span("page render"):
+        render_history_page(st.session_state["theme"])
+    finish_rerun()
     st.stop()  # Don't render the rest of the page
 
 # Otherwise, render the assessment page (default)
 
+# ========== LOAD MODEL & FEATURES ==========
+from utils.model import (  # noqa: E402
+    load_active_model,
+    load_lookup_engine,
+    get_feature_names,
+    score,
+    format_feature_label,
+    set_defaults
+)
+from utils.history import get_history_store, history_token  # noqa: E402
+from utils.reports import REPORT_FORMATS  # noqa: E402
+from utils.preview import sync_live_preview, on_answer_change, clear_live_preview, preview_probabilities  # noqa: E402
+
+# One snapshot per rerun: a hot-reloaded version takes effect on the next interaction
+with dev_span("model load"):
+    model = load_active_model()
+    scorer = model.scorer
+    feature_names = get_feature_names()
+
+# Initialize defaults once
+if "initialized" not in st.session_state:
+    set_defaults(feature_names)
+    st.session_state["initialized"] = True
+
 # Header
 render_header(
     "AURA+",
@@ -95,7 +148,7 @@ render_info_card(
 )
 
 # ========== CONTROL BUTTONS ==========
-c1, c2, c3 = st.columns([1.2, 1, 2])
+c1, c2, c3, c4 = st.columns([1.2, 1, 1, 2])
 with c1:
     if st.button("🔄 Reset All Inputs", use_container_width=True):
         set_defaults(feature_names)
@@ -105,6 +158,9 @@ with c2:
     show_advanced = st.toggle("🔬 Advanced Details", value=False)
 
 with c3:
+    live_preview = st.toggle("⚡ Live Preview", value=False, help="Update the risk estimate as you answer")
+
+with c4:
     st.markdown(
         f"<div style='text-align:right; color: {colors['text_secondary']}; font-size: 0.9rem; padding-top: 0.5rem;'>💡 Tip: Use the ⓘ icons to see what each question means</div>",
         unsafe_allow_html=True
@@ -120,8 +176,29 @@ st.markdown(f"""
 </div>
 """, unsafe_allow_html=True)
 
-# Render all questions using the forms component
-render_all_questions(feature_names, st.session_state["theme"])
+# Live preview: logits are updated per answer change instead of rescoring
+def render_live_preview(engine):
+    preview_class, preview_proba = preview_probabilities(engine)
+    st.markdown(
+        risk_badge_html(preview_class, st.session_state["theme"])
+        + f"<p style='color: {colors['text_secondary']}; font-size: 0.9rem; margin-top: -0.75rem;'>"
+        f"Live estimate: Low={preview_proba[0]:.1%} | Moderate={preview_proba[1]:.1%} | High={preview_proba[2]:.1%}</p>",
+        unsafe_allow_html=True
+    )
+
+
+with dev_span("form rendering"):
+    answer_callback = preview_header = None
+    if live_preview:
+        engine = load_lookup_engine(scorer)
+        sync_live_preview(engine)
+        answer_callback = partial(on_answer_change, engine)
+        preview_header = partial(render_live_preview, engine)
+    else:
+        clear_live_preview()
+
+    # Render all questions using the forms component; answer changes rerun only the questionnaire
+    render_all_questions(feature_names, st.session_state["theme"], on_change=answer_callback, header=preview_header)
 
 st.divider()
 
@@ -154,111 +231,24 @@ if not predict_clicked and 'last_prediction' not in st.session_state:
 if predict_clicked:
     # Collect inputs
     user_input = {feat: st.session_state.get(f"inp_{feat}") for feat in feature_names}
-    user_df = pd.DataFrame([user_input])
 
-    # Make prediction
-    pred = int(model.predict(user_df[feature_names])[0])
-    proba = predict_proba_safe(model, user_df[feature_names])[0]
-    pred_label = STRESS_LABELS[pred]
+    # Single scoring pass; explanation and report are derived from it on demand
+    with dev_span("scoring"):
+        result = score(scorer, user_input, top_k=6, model_version=model.version)
 
-    # Results card with glassmorphism
-    from components.cards import render_result_card
-    
-    result_content = ""
-    
-    # Result header
-    result_content += f"""
-<div class="animate-fade-in" style="text-align: center; margin-bottom: 2rem;">
-<div class="animate-float" style="font-size: 3rem; margin-bottom: 0.5rem;">📊</div>
-<h3 class="animate-stagger-1" style="font-size: 1.8rem; font-weight: 700; color: {colors['text_main']}; margin: 0;">Your Assessment Result</h3>
-<p class="animate-stagger-2" style="color: {colors['text_secondary']}; font-size: 0.9rem; margin-top: 0.5rem;">Based on your responses across all categories</p>
-</div>
-"""
-    
-    # Risk badge
-    result_content += risk_badge_html(pred, st.session_state["theme"])
-
-    # Explanation
-    explanation_bg_opacity = 0.1 if st.session_state["theme"] == "dark" else 0.08
-    explanation_styles = {
-        0: {"bg": f"rgba(124, 255, 178, {explanation_bg_opacity})", "border": "#7CFFB2", "icon": "✅"},
-        1: {"bg": f"rgba(255, 211, 124, {explanation_bg_opacity})", "border": "#FFD37C", "icon": "⚠️"},
-        2: {"bg": f"rgba(255, 138, 138, {explanation_bg_opacity})", "border": "#FF8A8A", "icon": "🚨"}
-    }
-    style = explanation_styles[pred]
-    
-    explanations = {
-        0: f"Your responses suggest a <strong style='color: {colors['text_main']};'>low</strong> stress risk right now. Keep maintaining healthy routines and support systems.",
-        1: f"Your responses suggest a <strong style='color: {colors['text_main']};'>moderate</strong> stress risk. A few areas may be contributing—small changes can help.",
-        2: f"Your responses suggest a <strong style='color: {colors['text_main']};'>high</strong> stress risk. Consider prioritizing support and recovery. If you feel unsafe, seek immediate help."
-    }
-    
-    shadow = "box-shadow: 0 2px 8px rgba(0, 0, 0, 0.06);" if st.session_state["theme"] == "light" else ""
-    result_content += f"""
-<div class="animate-stagger-3 glass-card" style="background: {style['bg']}; padding: 1.25rem; border-radius: 12px; border-left: 4px solid {style['border']}; margin: 1.5rem 0; {shadow}; backdrop-filter: blur(10px);">
-<p style="margin: 0; font-size: 1rem; line-height: 1.7; color: {colors['text_main']};">{style['icon']} {explanations[pred]}</p>
-</div>
-"""
-
-    confidence_bg = "rgba(128, 128, 128, 0.05)" if st.session_state["theme"] == "dark" else "rgba(15, 23, 42, 0.03)"
-    confidence_shadow = "box-shadow: 0 1px 3px rgba(0, 0, 0, 0.06);" if st.session_state["theme"] == "light" else ""
-    result_content += f"""
-<div class="animate-stagger-4 glass-card" style="text-align: center; padding: 1rem; background: {confidence_bg}; border-radius: 10px; margin: 1rem 0; {confidence_shadow}; backdrop-filter: blur(10px);">
-<p style="margin: 0; font-size: 0.9rem; color: {colors['text_secondary']};"><strong>Model Confidence:</strong> Low={proba[0]:.1%} | Moderate={proba[1]:.1%} | High={proba[2]:.1%}</p>
-</div>
-"""
+    # Compact record kept in session state; the card is rendered from it per theme
+    with dev_span("result HTML"):
+        record = result.to_record()
+        render_result_card(result_content_html(record, st.session_state["theme"]), st.session_state["theme"])
 
-    # Get explanations and suggestions
-    pred_class, top_contrib = explain_with_coefficients(model, user_df, feature_names, top_k=6)
-    
-    suggested = []
-    for feat in top_contrib.index:
-        if feat in SUGGESTION_RULES:
-            suggested.append(SUGGESTION_RULES[feat])
-    seen = set()
-    suggested = [s for s in suggested if not (s in seen or seen.add(s))]
-
-    # Suggestions
-    result_content += """
-<div class="animate-stagger-5" style="margin-top: 2rem;">
-<h3 style="font-size: 1.6rem; font-weight: 700; margin-bottom: 1rem;"> Personalized Suggestions</h3>
-</div>
-"""
-    
-    suggestion_bg = "rgba(255, 75, 75, 0.05)" if st.session_state["theme"] == "dark" else "rgba(255, 75, 75, 0.04)"
-    suggestion_shadow = "box-shadow: 0 1px 3px rgba(0, 0, 0, 0.06);" if st.session_state["theme"] == "light" else ""
-    
-    if suggested:
-        for i, s in enumerate(suggested[:5], 1):
-            result_content += f"""
-<div class="glass-card hover-lift animate-stagger-{min(i+4, 9)}" style="background: {suggestion_bg}; padding: 1rem 1.25rem; border-radius: 10px; margin-bottom: 0.75rem; border-left: 3px solid #FF4B4B; {suggestion_shadow}; backdrop-filter: blur(10px);">
-<p style="margin: 0; font-size: 0.95rem; line-height: 1.6; color: {colors['text_main']};"><strong style="color: #FF4B4B;">{i}.</strong> {s}</p>
-</div>
-"""
-    else:
-        result_content += f"""
-<div class="glass-card animate-stagger-5" style="background: {suggestion_bg}; padding: 1rem 1.25rem; border-radius: 10px; border-left: 3px solid #FF4B4B; {suggestion_shadow}; backdrop-filter: blur(10px);">
-<p style="margin: 0; font-size: 0.95rem; line-height: 1.6; color: {colors['text_main']};">• Maintain healthy routines and seek support when needed.</p>
-</div>
-"""
-
-    # Remember message
-    remember_bg = "rgba(33, 150, 243, 0.1)" if st.session_state["theme"] == "dark" else "rgba(33, 150, 243, 0.06)"
-    remember_shadow = "box-shadow: 0 2px 8px rgba(0, 0, 0, 0.06);" if st.session_state["theme"] == "light" else ""
-    result_content += f"""
-<div class="glass-card animate-stagger-5" style="background: {remember_bg}; border-left: 4px solid #2196F3; padding: 1.25rem; border-radius: 12px; margin-top: 1.5rem; {remember_shadow}; backdrop-filter: blur(10px);">
-<div style="display: flex; align-items: start; gap: 0.75rem;">
-<span class="animate-float" style="font-size: 1.3rem;">💙</span>
-<p style="margin: 0; font-size: 0.9rem; line-height: 1.6; color: {colors['text_secondary']};"><strong>Remember:</strong> If symptoms feel overwhelming or persistent, consider speaking with a qualified professional or trusted support person.</p>
-</div>
-</div>
-"""
-    
-    # Render the complete result card
-    render_result_card(result_content, st.session_state["theme"])
-    
     # Save result to session state for viewing later
-    st.session_state["last_prediction"] = result_content
+    st.session_state["last_prediction"] = record
+    PREDICTIONS.inc(record.pred_label)
+
+    # Optional local history: queued here, written in batches by a background thread
+    history_user = history_token()
+    if history_user is not None:
+        get_history_store().record(history_user, record)
 
     # Advanced details
     if show_advanced:
@@ -274,21 +264,26 @@ if predict_clicked:
         st.markdown(f"""
 <div style="background: {advanced_bg}; padding: 1rem 1.25rem; border-radius: 10px; border-left: 3px solid #8a2be2; margin-bottom: 1.5rem; {advanced_shadow}">
 <p style="margin: 0; font-size: 0.9rem; line-height: 1.6; color: {colors['text_secondary']};">These are the strongest signals the model noticed. Positive values generally push toward the predicted class; negative values push away. This is an educational explanation, not a diagnosis.</p>
+<p style="margin: 0.5rem 0 0 0; font-size: 0.8rem; color: {colors['text_secondary']}; opacity: 0.8;">Model version: {result.model_version}</p>
 </div>
 """, unsafe_allow_html=True)
         
-        expl_table = top_contrib.reset_index()
+        expl_table = result.top_contributions.reset_index()
         expl_table.columns = ["Feature", "Contribution"]
         expl_table["Feature"] = expl_table["Feature"].apply(format_feature_label)
         expl_table["Direction"] = expl_table["Contribution"].apply(lambda x: "📈 Increases risk" if x > 0 else "📉 Reduces risk")
         expl_table["Contribution"] = expl_table["Contribution"].round(3)
         st.dataframe(expl_table[["Feature", "Direction", "Contribution"]], use_container_width=True, height=300)
 
-    # Download report
-    report_text = make_report_text(pred_label, proba, top_contrib, suggested[:5])
-    st.download_button(
-        label="⬇️ Download Detailed Report",
-        data=report_text,
-        file_name="aura_plus_stress_report.txt",
-        mime="text/plain",
-    )
+    # Download report: each format is rendered only when its button is used
+    for col, (fmt, spec) in zip(st.columns(len(REPORT_FORMATS)), REPORT_FORMATS.items()):
+        with col:
+            st.download_button(
+                label=f"⬇️ {spec.label} Report",
+                data=partial(result.report, fmt) if DEFERRED_DOWNLOADS else result.report(fmt),
+                file_name=f"aura_plus_stress_report{spec.extension}",
+                mime=spec.mime,
+                use_container_width=True,
+            )
+
+finish_rerun()
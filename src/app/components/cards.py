@@ -4,6 +4,9 @@ Reusable card components for displaying information and results.
 """
 
 import streamlit as st
+from utils.results import PredictionRecord
+from utils.styles import get_theme_colors, risk_badge_html
+from .templates import cached_fragment
 
 
 def render_info_card(title: str, content: str, emoji: str = "ℹ️", theme: str = "dark", card_type: str = "info"):
@@ -17,6 +20,12 @@ def render_info_card(title: str, content: str, emoji: str = "ℹ️", theme: str
         theme: Current theme
         card_type: Card type ('info', 'warning', 'success', 'error')
     """
+    st.markdown(info_card_html(title, content, emoji, theme, card_type), unsafe_allow_html=True)
+
+
+@cached_fragment
+def info_card_html(title: str, content: str, emoji: str, theme: str, card_type: str) -> str:
+    """HTML of an information card (see `render_info_card`), built once per arguments."""
     # Color scheme based on card type
     color_schemes = {
         "info": {
@@ -57,12 +66,17 @@ def render_info_card(title: str, content: str, emoji: str = "ℹ️", theme: str
 </div>
 </div>
 """
-    
-    st.markdown(card_html, unsafe_allow_html=True)
+    return card_html
 
 
 
 def render_header(title: str, subtitle: str = "", theme: str = "dark"):
+    st.markdown(header_html(title, subtitle, theme), unsafe_allow_html=True)
+
+
+@cached_fragment
+def header_html(title: str, subtitle: str, theme: str) -> str:
+    """HTML of the page header (see `render_header`), built once per arguments."""
     subtitle_color = "#b0b8c4" if theme == "dark" else "#64748b"
 
     subtitle_html = ""
@@ -73,7 +87,7 @@ def render_header(title: str, subtitle: str = "", theme: str = "dark"):
             f"{subtitle}</p>"
         )
 
-    st.markdown(
+    return (
         f"""
         <div style="text-align:center; margin: 2rem 0 2.5rem 0;">
             <h1 style="
@@ -91,8 +105,7 @@ def render_header(title: str, subtitle: str = "", theme: str = "dark"):
             </h1>
             {subtitle_html}
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
     )
 
 
@@ -113,3 +126,100 @@ def render_result_card(content: str, theme: str = "dark"):
 """
     
     st.markdown(card_html, unsafe_allow_html=True)
+
+
+@cached_fragment
+def result_content_html(record: PredictionRecord, theme: str = "dark") -> str:
+    """
+    Body of the result card for a prediction record, in the given theme.
+
+    Built once per (record, theme); the assessment page and the Results page
+    both render from the stored record, so the card follows theme changes.
+    """
+    colors = get_theme_colors(theme)
+    pred = record.pred_class
+    proba = record.probabilities
+
+    result_content = ""
+    
+    # Result header
+    result_content += f"""
+<div class="animate-fade-in" style="text-align: center; margin-bottom: 2rem;">
+<div class="animate-float" style="font-size: 3rem; margin-bottom: 0.5rem;">📊</div>
+<h3 class="animate-stagger-1" style="font-size: 1.8rem; font-weight: 700; color: {colors['text_main']}; margin: 0;">Your Assessment Result</h3>
+<p class="animate-stagger-2" style="color: {colors['text_secondary']}; font-size: 0.9rem; margin-top: 0.5rem;">Based on your responses across all categories</p>
+</div>
+"""
+    
+    # Risk badge
+    result_content += risk_badge_html(pred, theme)
+
+    # Explanation
+    explanation_bg_opacity = 0.1 if theme == "dark" else 0.08
+    explanation_styles = {
+        0: {"bg": f"rgba(124, 255, 178, {explanation_bg_opacity})", "border": "#7CFFB2", "icon": "✅"},
+        1: {"bg": f"rgba(255, 211, 124, {explanation_bg_opacity})", "border": "#FFD37C", "icon": "⚠️"},
+        2: {"bg": f"rgba(255, 138, 138, {explanation_bg_opacity})", "border": "#FF8A8A", "icon": "🚨"}
+    }
+    style = explanation_styles[pred]
+    
+    explanations = {
+        0: f"Your responses suggest a <strong style='color: {colors['text_main']};'>low</strong> stress risk right now. Keep maintaining healthy routines and support systems.",
+        1: f"Your responses suggest a <strong style='color: {colors['text_main']};'>moderate</strong> stress risk. A few areas may be contributing—small changes can help.",
+        2: f"Your responses suggest a <strong style='color: {colors['text_main']};'>high</strong> stress risk. Consider prioritizing support and recovery. If you feel unsafe, seek immediate help."
+    }
+    
+    shadow = "box-shadow: 0 2px 8px rgba(0, 0, 0, 0.06);" if theme == "light" else ""
+    result_content += f"""
+<div class="animate-stagger-3 glass-card" style="background: {style['bg']}; padding: 1.25rem; border-radius: 12px; border-left: 4px solid {style['border']}; margin: 1.5rem 0; {shadow}; backdrop-filter: blur(10px);">
+<p style="margin: 0; font-size: 1rem; line-height: 1.7; color: {colors['text_main']};">{style['icon']} {explanations[pred]}</p>
+</div>
+"""
+
+    confidence_bg = "rgba(128, 128, 128, 0.05)" if theme == "dark" else "rgba(15, 23, 42, 0.03)"
+    confidence_shadow = "box-shadow: 0 1px 3px rgba(0, 0, 0, 0.06);" if theme == "light" else ""
+    result_content += f"""
+<div class="animate-stagger-4 glass-card" style="text-align: center; padding: 1rem; background: {confidence_bg}; border-radius: 10px; margin: 1rem 0; {confidence_shadow}; backdrop-filter: blur(10px);">
+<p style="margin: 0; font-size: 0.9rem; color: {colors['text_secondary']};"><strong>Model Confidence:</strong> Low={proba[0]:.1%} | Moderate={proba[1]:.1%} | High={proba[2]:.1%}</p>
+</div>
+"""
+
+    # Suggestions for the top contributors
+    suggested = record.suggestions
+
+    # Suggestions
+    result_content += """
+<div class="animate-stagger-5" style="margin-top: 2rem;">
+<h3 style="font-size: 1.6rem; font-weight: 700; margin-bottom: 1rem;"> Personalized Suggestions</h3>
+</div>
+"""
+    
+    suggestion_bg = "rgba(255, 75, 75, 0.05)" if theme == "dark" else "rgba(255, 75, 75, 0.04)"
+    suggestion_shadow = "box-shadow: 0 1px 3px rgba(0, 0, 0, 0.06);" if theme == "light" else ""
+    
+    if suggested:
+        for i, s in enumerate(suggested[:5], 1):
+            result_content += f"""
+<div class="glass-card hover-lift animate-stagger-{min(i+4, 9)}" style="background: {suggestion_bg}; padding: 1rem 1.25rem; border-radius: 10px; margin-bottom: 0.75rem; border-left: 3px solid #FF4B4B; {suggestion_shadow}; backdrop-filter: blur(10px);">
+<p style="margin: 0; font-size: 0.95rem; line-height: 1.6; color: {colors['text_main']};"><strong style="color: #FF4B4B;">{i}.</strong> {s}</p>
+</div>
+"""
+    else:
+        result_content += f"""
+<div class="glass-card animate-stagger-5" style="background: {suggestion_bg}; padding: 1rem 1.25rem; border-radius: 10px; border-left: 3px solid #FF4B4B; {suggestion_shadow}; backdrop-filter: blur(10px);">
+<p style="margin: 0; font-size: 0.95rem; line-height: 1.6; color: {colors['text_main']};">• Maintain healthy routines and seek support when needed.</p>
+</div>
+"""
+
+    # Remember message
+    remember_bg = "rgba(33, 150, 243, 0.1)" if theme == "dark" else "rgba(33, 150, 243, 0.06)"
+    remember_shadow = "box-shadow: 0 2px 8px rgba(0, 0, 0, 0.06);" if theme == "light" else ""
+    result_content += f"""
+<div class="glass-card animate-stagger-5" style="background: {remember_bg}; border-left: 4px solid #2196F3; padding: 1.25rem; border-radius: 12px; margin-top: 1.5rem; {remember_shadow}; backdrop-filter: blur(10px);">
+<div style="display: flex; align-items: start; gap: 0.75rem;">
+<span class="animate-float" style="font-size: 1.3rem;">💙</span>
+<p style="margin: 0; font-size: 0.9rem; line-height: 1.6; color: {colors['text_secondary']};"><strong>Remember:</strong> If symptoms feel overwhelming or persistent, consider speaking with a qualified professional or trusted support person.</p>
+</div>
+</div>
+"""
+    return result_content
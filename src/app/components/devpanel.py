@@ -0,0 +1,47 @@
+"""
+AURA+ Developer Panel
+Per-phase rerun timings and flamegraph capture, shown with ?debug=1.
+"""
+
+import streamlit as st
+from utils.profiler import RerunProfiler, flamegraph_svg, folded_stacks
+
+
+def phase_table_md(profiler: RerunProfiler) -> str:
+    """Markdown table of last / p50 / p95 milliseconds per phase."""
+    rows = ["| Phase | Last | p50 | p95 | n |", "|---|--:|--:|--:|--:|"]
+    for s in profiler.summary():
+        rows.append(f"| {s.phase} | {s.last_ms:.1f} | {s.p50_ms:.1f} | {s.p95_ms:.1f} | {s.count} |")
+    return "\n".join(rows)
+
+
+def render_profiler_panel(profiler: RerunProfiler, container):
+    """
+    Draw the profiler into `container` (a slot created early in the rerun).
+
+    Called after `profiler.end()`, so the table includes the rerun that is
+    drawing it. Milliseconds; fragment reruns only add to their own phases.
+    """
+    with container.expander("🛠️ Rerun profiler", expanded=True):
+        st.caption(f"{profiler.reruns} full reruns · last {profiler.window} spans per phase (ms)")
+        st.markdown(phase_table_md(profiler))
+
+        reruns = st.number_input("Reruns to sample", min_value=1, max_value=50, value=10, key="dev_profile_reruns")
+        if st.button("🔥 Capture flamegraph", key="dev_profile_capture", use_container_width=True):
+            profiler.capture(int(reruns))
+
+        if profiler.capture_left:
+            done = profiler.capture_total - profiler.capture_left
+            st.caption(f"Sampling every {profiler.sample_ms:g} ms: {done}/{profiler.capture_total} reruns captured")
+        elif profiler.stacks:
+            samples = sum(profiler.stacks.values())
+            st.caption(f"Flamegraph of {profiler.capture_total} reruns ({samples} samples, hover for details)")
+            svg = flamegraph_svg(profiler.stacks)
+            if hasattr(st, "html"):
+                st.html(svg)
+            else:
+                st.markdown(svg, unsafe_allow_html=True)
+            st.download_button("⬇️ Flamegraph (SVG)", svg, file_name="aura_rerun_flamegraph.svg",
+                               mime="image/svg+xml", key="dev_profile_svg")
+            st.download_button("⬇️ Folded stacks", folded_stacks(profiler.stacks), file_name="aura_rerun_stacks.txt",
+                               mime="text/plain", key="dev_profile_folded")
@@ -5,9 +5,16 @@ Form input components for the assessment questionnaire.
 
 import streamlit as st
 from utils.constants import QUESTION_MAP
+from utils.profiler import dev_span
 
+# Streamlit >= 1.37 (1.33 as experimental) reruns a fragment alone when only its own widgets change
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
 
-def render_question_section(section_name: str, feature_names: list, theme: str = "dark"):
+
+SECTIONS = ["Psychological", "Physical", "Sleep", "Environment", "Academic", "Social"]
+
+
+def render_question_section(section_name: str, feature_names: list, theme: str = "dark", on_change=None):
     """
     Render a section of questions in an expander.
     
@@ -15,6 +22,7 @@ def render_question_section(section_name: str, feature_names: list, theme: str =
         section_name: Name of the section (e.g., 'Psychological', 'Physical')
         feature_names: List of all feature names
         theme: Current theme
+        on_change: Optional callback invoked with the feature name when an answer changes
     """
     # Filter questions for this section
     section_features = [
@@ -43,6 +51,7 @@ def render_question_section(section_name: str, feature_names: list, theme: str =
         for i, feat in enumerate(section_features):
             meta = QUESTION_MAP[feat]
             col = cols[i % 2]
+            callback_args = dict(on_change=on_change, args=(feat,)) if on_change else {}
             
             with col:
                 # Add some spacing between inputs
@@ -65,7 +74,8 @@ def render_question_section(section_name: str, feature_names: list, theme: str =
                         value=st.session_state.get(f"inp_{feat}", meta["default"]),
                         key=f"inp_{feat}",
                         help=meta["help"],
-                        format="%d"
+                        format="%d",
+                        **callback_args
                     )
                     
                 elif meta["type"] == "likert":
@@ -79,7 +89,8 @@ def render_question_section(section_name: str, feature_names: list, theme: str =
                         value=st.session_state.get(f"inp_{feat}", meta["default"]),
                         key=f"inp_{feat}",
                         help=meta["help"],
-                        format="%d"
+                        format="%d",
+                        **callback_args
                     )
                     # Show current selection label
                     current_val = st.session_state.get(f"inp_{feat}", meta["default"])
@@ -92,19 +103,44 @@ def render_question_section(section_name: str, feature_names: list, theme: str =
                         format_func=lambda x: "No" if x == 0 else "Yes",
                         index=st.session_state.get(f"inp_{feat}", meta["default"]),
                         key=f"inp_{feat}",
-                        help=meta["help"]
+                        help=meta["help"],
+                        **callback_args
                     )
 
 
-def render_all_questions(feature_names: list, theme: str = "dark"):
+# Changing an answer reruns only the fragment holding it, not the whole app
+@_fragment
+def _section_fragment(section_name: str, feature_names: list, theme: str, on_change):
+    with dev_span("form fragment"):
+        render_question_section(section_name, feature_names, theme, on_change)
+
+
+@_fragment
+def _questionnaire_fragment(feature_names: list, theme: str, on_change, header):
+    with dev_span("form fragment"):
+        header()
+        for section in SECTIONS:
+            render_question_section(section, feature_names, theme, on_change)
+
+
+def render_all_questions(feature_names: list, theme: str = "dark", on_change=None, header=None):
     """
-    Render all question sections.
+    Render all question sections as partial-rerun fragments.
+
+    Each section is its own fragment, so moving a slider reruns that section
+    alone. With a `header` (content derived from the answers, e.g. the live
+    preview) the header and all sections form one fragment instead, which
+    keeps the header in sync without rerunning the rest of the page.
     
     Args:
         feature_names: List of all feature names
         theme: Current theme
+        on_change: Optional per-answer change callback (see `render_question_section`)
+        header: Optional callable drawn above the sections on every questionnaire rerun
     """
-    sections = ["Psychological", "Physical", "Sleep", "Environment", "Academic", "Social"]
-    
-    for section in sections:
-        render_question_section(section, feature_names, theme)
+    if header:
+        _questionnaire_fragment(feature_names, theme, on_change, header)
+        return
+
+    for section in SECTIONS:
+        _section_fragment(section, feature_names, theme, on_change)
@@ -4,6 +4,7 @@ Modern top navigation bar with branding and theme toggle.
 """
 
 import streamlit as st
+from .templates import cached_fragment
 
 
 def render_navbar(theme: str):
@@ -13,6 +14,12 @@ def render_navbar(theme: str):
     Args:
         theme: Current theme ('dark' or 'light')
     """
+    st.markdown(navbar_html(theme), unsafe_allow_html=True)
+
+
+@cached_fragment
+def navbar_html(theme: str) -> str:
+    """HTML of the navigation bar, built once per theme."""
     theme_emoji = "🌙" if theme == "dark" else "☀️"
     theme_text_color = "#b0b8c4" if theme == "dark" else "#64748b"
     navbar_bg = "rgba(15, 20, 35, 0.95)" if theme == "dark" else "rgba(255, 255, 255, 0.95)"
@@ -20,7 +27,7 @@ def render_navbar(theme: str):
     navbar_shadow = "0 4px 16px rgba(0, 0, 0, 0.25)" if theme == "dark" else "0 4px 16px rgba(0, 0, 0, 0.08)"
     
     # Build navbar HTML with proper escaping
-    navbar_html = (
+    html = (
         '<div class="glass-navbar animate-slide-in-left" style="'
         f'position: fixed; top: 0; left: 0; right: 0; height: 65px; '
         f'background: {navbar_bg}; backdrop-filter: blur(20px); '
@@ -41,5 +48,4 @@ def render_navbar(theme: str):
         '</div>'
         '<div style="height: 80px;"></div>'
     )
-    
-    st.markdown(navbar_html, unsafe_allow_html=True)
+    return html
@@ -4,6 +4,47 @@ Enhanced sidebar with navigation, theme toggle, and information cards.
 """
 
 import streamlit as st
+from utils.history import disable_history, history_token
+from .templates import cached_fragment
+
+
+@cached_fragment
+def sidebar_fragments(theme: str) -> dict:
+    """HTML blocks of the sidebar, built once per theme."""
+    sidebar_text_color = "#b0b8c4" if theme == "dark" else "#475569"
+    sidebar_secondary = "#b0b8c4" if theme == "dark" else "#64748b"
+    info_bg = "rgba(255, 75, 75, 0.1)" if theme == "dark" else "rgba(255, 75, 75, 0.06)"
+    info_shadow = "box-shadow: 0 2px 8px rgba(0, 0, 0, 0.06);" if theme == "light" else ""
+
+    return {
+        "branding": f"""
+<div style="text-align: center; padding: 1rem 0;">
+<div style="font-size: 3rem; margin-bottom: 0.5rem;">🧠</div>
+<h1 style="font-size: 1.8rem; font-weight: 800; background: linear-gradient(135deg, #FF4B4B 0%, #FF6B6B 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; margin: 0;">AURA+</h1>
+<p style="color: {sidebar_secondary}; font-size: 0.85rem; margin-top: 0.5rem;">Stress Risk Screening</p>
+</div>
+""",
+        "info": f"""
+<div style="background: {info_bg}; padding: 1rem; border-radius: 10px; border-left: 3px solid #FF4B4B; {info_shadow}">
+<p style="margin: 0; font-size: 0.9rem; line-height: 1.5; color: {sidebar_text_color};"><strong style="color: {sidebar_text_color};">💡 About AURA+</strong><br>Uses AI to predict stress risks based on multi-dimensional patterns. Educational screening tool only.</p>
+</div>
+""",
+        "nav_title": f"""
+<div class="animate-fade-in" style="color: {sidebar_text_color};">
+<p style="font-size: 0.75rem; font-weight: 600; text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.5rem;">Navigation</p>
+</div>
+""",
+        "quick_info": f"""
+<div class="animate-fade-in" style="color: {sidebar_text_color}; font-size: 0.85rem;">
+<p style="margin-bottom: 0.5rem; font-weight: 600;">Quick Info</p>
+<ul style="margin: 0; padding-left: 1.2rem; line-height: 1.8;">
+<li>Educational tool only</li>
+<li>Not a diagnosis</li>
+<li>Seek help if needed</li>
+</ul>
+</div>
+""",
+    }
 
 
 def render_sidebar(theme: str):
@@ -16,18 +57,11 @@ def render_sidebar(theme: str):
     Returns:
         str: Selected theme after toggle
     """
-    sidebar_text_color = "#b0b8c4" if theme == "dark" else "#475569"
-    sidebar_secondary = "#b0b8c4" if theme == "dark" else "#64748b"
+    html = sidebar_fragments(theme)
     
     with st.sidebar:
         # Logo and branding
-        st.markdown(f"""
-<div style="text-align: center; padding: 1rem 0;">
-<div style="font-size: 3rem; margin-bottom: 0.5rem;">🧠</div>
-<h1 style="font-size: 1.8rem; font-weight: 800; background: linear-gradient(135deg, #FF4B4B 0%, #FF6B6B 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; margin: 0;">AURA+</h1>
-<p style="color: {sidebar_secondary}; font-size: 0.85rem; margin-top: 0.5rem;">Stress Risk Screening</p>
-</div>
-""", unsafe_allow_html=True)
+        st.markdown(html["branding"], unsafe_allow_html=True)
         
         st.markdown("<br>", unsafe_allow_html=True)
         
@@ -41,27 +75,17 @@ def render_sidebar(theme: str):
         st.divider()
         
         # Information card
-        info_bg = "rgba(255, 75, 75, 0.1)" if theme == "dark" else "rgba(255, 75, 75, 0.06)"
-        info_shadow = "box-shadow: 0 2px 8px rgba(0, 0, 0, 0.06);" if theme == "light" else ""
-        
-        st.markdown(f"""
-<div style="background: {info_bg}; padding: 1rem; border-radius: 10px; border-left: 3px solid #FF4B4B; {info_shadow}">
-<p style="margin: 0; font-size: 0.9rem; line-height: 1.5; color: {sidebar_text_color};"><strong style="color: {sidebar_text_color};">💡 About AURA+</strong><br>Uses AI to predict stress risks based on multi-dimensional patterns. Educational screening tool only.</p>
-</div>
-""", unsafe_allow_html=True)
+        st.markdown(html["info"], unsafe_allow_html=True)
         
         # Navigation menu
         st.markdown("<br>", unsafe_allow_html=True)
-        st.markdown(f"""
-<div class="animate-fade-in" style="color: {sidebar_text_color};">
-<p style="font-size: 0.75rem; font-weight: 600; text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.5rem;">Navigation</p>
-</div>
-""", unsafe_allow_html=True)
+        st.markdown(html["nav_title"], unsafe_allow_html=True)
         
         # Navigation buttons with modern styling
         nav_buttons = [
             ("📝 New Assessment", "Reset and start a new assessment"),
             ("📊 View Results", "See your latest assessment results"),
+            ("📈 History", "See how your results changed over time"),
             ("ℹ️ About", "Learn more about AURA+")
         ]
         
@@ -78,22 +102,27 @@ def render_sidebar(theme: str):
                 elif "View Results" in label:
                     st.session_state["current_page"] = "results"
                     st.rerun()
+                elif "History" in label:
+                    st.session_state["current_page"] = "history"
+                    st.rerun()
                 elif "About" in label:
                     st.session_state["current_page"] = "about"
                     st.rerun()
         
+        # Opt-in local history, tied to an anonymous token in the URL
+        history_on = st.toggle(
+            "🗂️ Save history on this device",
+            value=history_token() is not None,
+            help="Keep your assessments in a local database to see trends over time",
+        )
+        if history_on and history_token() is None:
+            history_token(create=True)
+        elif not history_on and history_token() is not None:
+            disable_history()
+        
         st.divider()
         
         # Quick stats or info (optional)
-        st.markdown(f"""
-<div class="animate-fade-in" style="color: {sidebar_text_color}; font-size: 0.85rem;">
-<p style="margin-bottom: 0.5rem; font-weight: 600;">Quick Info</p>
-<ul style="margin: 0; padding-left: 1.2rem; line-height: 1.8;">
-<li>Educational tool only</li>
-<li>Not a diagnosis</li>
-<li>Seek help if needed</li>
-</ul>
-</div>
-""", unsafe_allow_html=True)
+        st.markdown(html["quick_info"], unsafe_allow_html=True)
     
     return new_theme
@@ -0,0 +1,50 @@
+"""
+AURA+ HTML Templates
+Process-wide cache of precompiled HTML fragments for the UI components.
+"""
+
+from functools import lru_cache
+
+from utils.constants import FRAGMENT_CACHE_SIZE
+from utils.metrics import register_cache
+
+# Every cached builder, for the combined debug counters
+_BUILDERS = []
+
+
+def cached_fragment(builder):
+    """
+    Memoize a pure HTML builder per (theme, parameters).
+
+    The builder runs once per distinct argument combination; later calls
+    return the stored string from a bounded C-level LRU (about 0.1 µs per
+    hit), shared by every session. Arguments must be hashable, and callers
+    must treat returned containers as read-only.
+    """
+    cached = lru_cache(maxsize=FRAGMENT_CACHE_SIZE)(builder)
+    _BUILDERS.append(cached)
+    return cached
+
+
+def fragment_cache_stats() -> dict:
+    """Hit/miss counters summed over all cached fragment builders."""
+    infos = [builder.cache_info() for builder in _BUILDERS]
+    hits = sum(info.hits for info in infos)
+    misses = sum(info.misses for info in infos)
+    return {
+        "builders": len(infos),
+        "size": sum(info.currsize for info in infos),
+        "maxsize": FRAGMENT_CACHE_SIZE * len(infos),
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+    }
+
+
+register_cache("html_fragments", fragment_cache_stats)
+
+
+def clear_fragment_cache():
+    """Drop every cached fragment (e.g. after editing templates in a dev session)."""
+    for builder in _BUILDERS:
+        builder.cache_clear()
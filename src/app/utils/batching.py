@@ -0,0 +1,139 @@
+"""
+AURA+ Micro-Batching
+Coalesces concurrent scoring requests into vectorized batches.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from queue import Empty, Queue
+
+import numpy as np
+
+from .scoring import top_k_contributions
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """
+    Background worker that scores queued requests in micro-batches.
+
+    A batch is flushed when it reaches `max_batch_size` rows or when the
+    oldest queued request has waited `max_wait_ms`, whichever comes first.
+    A single request larger than `max_batch_size` is scored on its own.
+    """
+
+    def __init__(self, scorer, max_batch_size: int = 256, max_wait_ms: float = 2.0,
+                 top_k: int = 6, latency_window: int = 10_000):
+        self.scorer = scorer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.top_k = top_k
+        self.stats = BatchStats(latency_window)
+        self._queue = Queue()
+        self._thread = threading.Thread(target=self._run, name="aura-batcher", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def submit(self, X) -> Future:
+        """
+        Queue an (m, n_features) block of rows for scoring.
+
+        Returns:
+            Future: Resolves to (pred, probabilities, top_indices, top_values)
+        """
+        future = Future()
+        self._queue.put((np.atleast_2d(X), future, time.perf_counter()))
+        return future
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch, rows = [item], len(item[0])
+            deadline = item[2] + self.max_wait
+
+            while rows < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    nxt = self._queue.get(timeout=remaining)
+                except Empty:
+                    break
+                if nxt is _STOP:
+                    self._queue.put(_STOP)
+                    break
+                batch.append(nxt)
+                rows += len(nxt[0])
+
+            self._score(batch)
+
+    def _score(self, batch):
+        try:
+            X = np.vstack([b[0] for b in batch])
+            pred, proba, contrib = self.scorer.score(X)
+            top_idx, top_val = top_k_contributions(contrib, self.top_k)
+        except Exception as exc:  # surface scoring errors on every waiting request
+            for _, future, _ in batch:
+                future.set_exception(exc)
+            return
+
+        done = time.perf_counter()
+        start = 0
+        for block, future, queued in batch:
+            end = start + len(block)
+            future.set_result((pred[start:end], proba[start:end], top_idx[start:end], top_val[start:end]))
+            self.stats.record_request(len(block), done - queued)
+            start = end
+        self.stats.record_batch()
+
+
+class BatchStats:
+    """Throughput and latency counters for a MicroBatcher."""
+
+    def __init__(self, latency_window: int = 10_000):
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.latencies = deque(maxlen=latency_window)
+        self._lock = threading.Lock()
+
+    def record_request(self, rows: int, latency: float):
+        with self._lock:
+            self.requests += 1
+            self.rows += rows
+            self.latencies.append(latency)
+
+    def record_batch(self):
+        with self._lock:
+            self.batches += 1
+
+    def report(self) -> dict:
+        """Throughput, mean batch size and latency percentiles (ms) since start."""
+        with self._lock:
+            elapsed = time.perf_counter() - self.started
+            lat = np.array(self.latencies) * 1000.0
+            requests, rows, batches = self.requests, self.rows, self.batches
+
+        p50, p95, p99 = np.percentile(lat, [50, 95, 99]) if len(lat) else (0.0, 0.0, 0.0)
+        return {
+            "uptime_s": round(elapsed, 3),
+            "requests": requests,
+            "rows": rows,
+            "batches": batches,
+            "mean_batch_rows": round(rows / batches, 2) if batches else 0.0,
+            "requests_per_s": round(requests / elapsed, 1) if elapsed else 0.0,
+            "rows_per_s": round(rows / elapsed, 1) if elapsed else 0.0,
+            "latency_ms": {"p50": round(p50, 3), "p95": round(p95, 3), "p99": round(p99, 3)},
+        }
@@ -0,0 +1,128 @@
+"""
+AURA+ Columnar Storage
+Memory-mappable column-per-block binary format for the processed dataset.
+"""
+
+import json
+import struct
+from pathlib import Path
+
+import numpy as np
+
+# Layout: MAGIC | format version (u32) | header length (u32) | JSON header
+# | one contiguous block per column, each starting on a BLOCK_ALIGN boundary
+MAGIC = b"AURACOL\x00"
+FORMAT_VERSION = 1
+BLOCK_ALIGN = 64
+_PREFIX = struct.Struct("<8sII")
+
+
+def _align(n: int) -> int:
+    return -(-n // BLOCK_ALIGN) * BLOCK_ALIGN
+
+
+def write_columnar(df, path):
+    """
+    Write a DataFrame of numeric columns in columnar binary form.
+
+    Args:
+        df: DataFrame to store (column order is preserved)
+        path: Output file path
+    """
+    arrays = [np.ascontiguousarray(df[col].to_numpy()) for col in df.columns]
+    for col, arr in zip(df.columns, arrays):
+        if arr.dtype.kind not in "biuf":
+            raise ValueError(f"Column {col!r} has non-numeric dtype {arr.dtype}.")
+    columns = [
+        {"name": str(col), "dtype": arr.dtype.newbyteorder("<").str, "nbytes": arr.nbytes}
+        for col, arr in zip(df.columns, arrays)
+    ]
+
+    # Offsets depend on the header length, which depends on the offsets:
+    # reserve room for them and settle on a fixed point
+    header_len = 0
+    while True:
+        offset = _align(_PREFIX.size + header_len)
+        for meta in columns:
+            meta["offset"] = offset
+            offset = _align(offset + meta["nbytes"])
+        header = json.dumps({"rows": int(len(df)), "columns": columns}).encode("utf-8")
+        if len(header) == header_len:
+            break
+        header_len = len(header)
+
+    with open(path, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header)))
+        f.write(header)
+        for meta, arr in zip(columns, arrays):
+            f.write(b"\x00" * (meta["offset"] - f.tell()))
+            f.write(arr.astype(meta["dtype"], copy=False).tobytes())
+
+
+def is_columnar(path) -> bool:
+    """True if `path` starts with the columnar file magic."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def read_columnar_header(path) -> dict:
+    """Parse only the header: row count plus column names, dtypes and offsets."""
+    with open(path, "rb") as f:
+        magic, version, header_len = _PREFIX.unpack(f.read(_PREFIX.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an AURA+ columnar file.")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported columnar format version {version} in {path}.")
+        return json.loads(f.read(header_len).decode("utf-8"))
+
+
+class ColumnarTable:
+    """
+    Read-only, memory-mapped view of a columnar file.
+
+    Columns are zero-copy NumPy views of the mapping, so only the pages of
+    the columns that are actually touched are read from disk.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        header = read_columnar_header(self.path)
+        self.rows = header["rows"]
+        self._meta = {meta["name"]: meta for meta in header["columns"]}
+        self._buf = np.memmap(self.path, dtype=np.uint8, mode="r")
+
+    @property
+    def columns(self) -> list:
+        return list(self._meta)
+
+    def __contains__(self, name) -> bool:
+        return name in self._meta
+
+    def __getitem__(self, name) -> np.ndarray:
+        meta = self._meta[name]
+        block = self._buf[meta["offset"]:meta["offset"] + meta["nbytes"]]
+        return np.asarray(block).view(meta["dtype"])
+
+    def matrix(self, columns, start: int = 0, stop: int = None) -> np.ndarray:
+        """Stack a row range of `columns` into an (n, len(columns)) array (copies)."""
+        return np.column_stack([self[c][start:stop] for c in columns])
+
+    def to_frame(self, columns=None, start: int = 0, stop: int = None):
+        """Build a pandas DataFrame over a row range of the selected columns."""
+        import pandas as pd
+
+        columns = self.columns if columns is None else columns
+        return pd.DataFrame({c: self[c][start:stop] for c in columns}, columns=columns, copy=False)
+
+    def iter_frames(self, chunk_size: int, columns=None):
+        """Yield consecutive DataFrame chunks of at most `chunk_size` rows."""
+        for start in range(0, self.rows, chunk_size):
+            yield self.to_frame(columns, start, start + chunk_size)
+
+
+def open_columnar(path) -> ColumnarTable:
+    """Memory-map a columnar file written by `write_columnar`."""
+    return ColumnarTable(path)
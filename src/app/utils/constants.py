@@ -3,12 +3,67 @@ AURA+ Constants
 All application constants including question maps, suggestions, and styling configurations.
 """
 
+import os
 from pathlib import Path
 
 # Path Configuration
 ROOT_DIR = Path(__file__).resolve().parents[3]
 MODEL_PATH = ROOT_DIR / "models" / "baseline_logistic_model.joblib"
+COMPILED_MODEL_PATH = ROOT_DIR / "models" / "baseline_logistic_model.bin"
 DATA_PATH = ROOT_DIR / "data" / "processed" / "stress_clean.csv"
+COLUMNAR_DATA_PATH = ROOT_DIR / "data" / "processed" / "stress_clean.col"
+FEATURE_MANIFEST_PATH = ROOT_DIR / "models" / "feature_manifest.json"
+MODEL_REGISTRY_PATH = ROOT_DIR / "models" / "registry.json"
+HISTORY_DB_PATH = ROOT_DIR / "data" / "history" / "assessments.db"
+
+# Target column of the processed dataset
+TARGET_COLUMN = "stress_level"
+
+# Valid value ranges enforced by src/data/02_clean_prepare.py
+LIKERT_RANGE = (1, 5)
+FEATURE_RANGES = {
+    "anxiety_level": (0, 21),
+    "self_esteem": (0, 30),
+    "mental_health_history": (0, 1),
+    "depression": (0, 27),
+    **{
+        col: LIKERT_RANGE
+        for col in [
+            "sleep_quality", "breathing_problem", "noise_level",
+            "living_conditions", "safety", "basic_needs",
+            "academic_performance", "study_load",
+            "teacher_relationship", "career_concerns",
+            "social_support", "peer_pressure",
+            "extracurriculars", "bullying", "headache", "blood_pressure",
+        ]
+    },
+}
+
+# Scored results kept in the process-wide LRU cache
+SCORE_CACHE_SIZE = 4096
+
+# Precompiled HTML fragments kept per (component, theme, parameters)
+FRAGMENT_CACHE_SIZE = 256
+
+# Assessment history writer: rows per transaction and max delay before a commit
+HISTORY_BATCH_SIZE = 512
+HISTORY_FLUSH_MS = 500
+
+# Developer profiler (?debug=1): spans kept per phase and stack sampling interval
+PROFILER_WINDOW = 200
+PROFILER_SAMPLE_MS = 2
+
+# Metrics exposition (Prometheus text format): off unless a port or a file is configured
+METRICS_HOST = os.environ.get("AURA_METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.environ.get("AURA_METRICS_PORT", "0"))
+METRICS_FILE = os.environ.get("AURA_METRICS_FILE", "")
+METRICS_INTERVAL_S = float(os.environ.get("AURA_METRICS_INTERVAL_S", "15"))
+METRICS_SESSION_TTL_S = 300
+
+# Offline pipeline tracing: one JSON-lines file per script. tracemalloc is opt-in
+# (AURA_TRACE_MALLOC=1): it slows allocation-heavy steps such as to_csv >10x
+TRACE_DIR = ROOT_DIR / "reports" / "traces"
+TRACE_MALLOC = os.environ.get("AURA_TRACE_MALLOC", "0") == "1"
 
 # Stress Level Labels
 STRESS_LABELS = {0: "Low", 1: "Moderate", 2: "High"}
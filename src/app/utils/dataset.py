@@ -0,0 +1,187 @@
+"""
+AURA+ Dataset Loading
+Questionnaire datasets as validated uint8 arrays (CSV or columnar input).
+"""
+
+import csv
+import io
+import os
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from .columnar import is_columnar, open_columnar
+from .constants import FEATURE_RANGES, STRESS_LABELS, TARGET_COLUMN
+
+TARGET_RANGE = (min(STRESS_LABELS), max(STRESS_LABELS))
+
+
+class QuestionnaireData(NamedTuple):
+    """
+    One block of questionnaire rows.
+
+    `X` is (n, n_features) uint8 in `feature_names` order. `y` is the uint8
+    target when the input has one. `passthrough` holds every non-feature
+    column unchanged (including the raw target).
+    """
+
+    X: np.ndarray
+    y: Optional[np.ndarray]
+    feature_names: list
+    passthrough: pd.DataFrame
+
+    def to_frame(self) -> pd.DataFrame:
+        """Features and target as a uint8 DataFrame, followed by other columns."""
+        df = pd.DataFrame(self.X, columns=self.feature_names, index=self.passthrough.index, copy=False)
+        if self.y is not None:
+            df[TARGET_COLUMN] = self.y
+        extra = self.passthrough.drop(columns=[TARGET_COLUMN], errors="ignore")
+        return pd.concat([df, extra], axis=1) if len(extra.columns) else df
+
+
+def to_uint8(values, feature_names, ranges=FEATURE_RANGES) -> np.ndarray:
+    """
+    Validate answers against their ranges and narrow them to uint8.
+
+    Args:
+        values: (n, n_features) integer array in `feature_names` order
+        feature_names: Column names of `values`
+        ranges: Mapping of feature name to inclusive (min, max)
+
+    Raises:
+        ValueError: If any column has non-integer or out-of-range answers
+    """
+    values = np.asarray(values)
+    if values.dtype.kind == "f" and not np.array_equal(values, np.floor(values)):
+        raise ValueError("Questionnaire answers must be whole numbers.")
+
+    lows = np.array([ranges[f][0] for f in feature_names])
+    highs = np.array([ranges[f][1] for f in feature_names])
+    bad = ((values < lows) | (values > highs)).sum(axis=0)
+    if bad.any():
+        details = ", ".join(
+            f"{f} ({n} outside {ranges[f][0]}–{ranges[f][1]})"
+            for f, n in zip(feature_names, bad) if n
+        )
+        raise ValueError(f"Out-of-range answers: {details}")
+    return values.astype(np.uint8)
+
+
+def from_frame(df, feature_names, ranges=FEATURE_RANGES) -> QuestionnaireData:
+    """Split a DataFrame into validated uint8 features, target and pass-through columns."""
+    missing = [f for f in feature_names if f not in df.columns]
+    if missing:
+        raise ValueError(f"Missing feature columns: {missing}")
+
+    X = to_uint8(df[feature_names].to_numpy(), feature_names, ranges)
+    y = None
+    if TARGET_COLUMN in df.columns:
+        y = to_uint8(df[[TARGET_COLUMN]].to_numpy(), [TARGET_COLUMN], {TARGET_COLUMN: TARGET_RANGE})[:, 0]
+    return QuestionnaireData(X, y, list(feature_names), df.drop(columns=feature_names))
+
+
+def default_feature_names(path) -> list:
+    """Feature columns of a dataset: every column with a known valid range."""
+    if is_columnar(path):
+        columns = open_columnar(path).columns
+    else:
+        columns = pd.read_csv(path, nrows=0).columns
+    return [c for c in columns if c in FEATURE_RANGES]
+
+
+def iter_questionnaire(path, chunk_size, feature_names=None, start=0, end=None, ranges=FEATURE_RANGES):
+    """
+    Stream a CSV or columnar dataset as QuestionnaireData chunks.
+
+    Feature columns are parsed as int16 (so overflow is caught by validation,
+    not silently wrapped) and kept as uint8 afterwards.
+
+    Args:
+        path: CSV or columnar file
+        chunk_size: Rows per chunk
+        feature_names: Features to extract (default: `default_feature_names`)
+        start, end: Partition bounds from `partition_questionnaire` - row
+            indices for columnar files, byte offsets for CSV
+
+    Yields:
+        QuestionnaireData: One validated chunk at a time
+    """
+    feature_names = feature_names or default_feature_names(path)
+
+    if is_columnar(path):
+        table = open_columnar(path)
+        end = table.rows if end is None else end
+        for a in range(start, end, chunk_size):
+            yield from_frame(table.to_frame(None, a, min(a + chunk_size, end)), feature_names, ranges)
+        return
+
+    dtypes = {f: np.int16 for f in feature_names}
+    if start == 0 and end is None:
+        reader = pd.read_csv(path, dtype=dtypes, chunksize=chunk_size)
+    else:
+        with open(path, encoding="utf-8") as f:
+            names = next(csv.reader([f.readline()]))
+        source = io.BufferedReader(_RangeReader(path, start, end))
+        reader = pd.read_csv(source, header=None, names=names, dtype=dtypes, chunksize=chunk_size)
+    for chunk in reader:
+        yield from_frame(chunk, feature_names, ranges)
+
+
+def load_questionnaire(path, feature_names=None, ranges=FEATURE_RANGES) -> QuestionnaireData:
+    """Load a whole dataset as validated uint8 arrays (1 byte per answer)."""
+    blocks = list(iter_questionnaire(path, 1_000_000, feature_names, ranges=ranges))
+    if len(blocks) == 1:
+        return blocks[0]
+    return QuestionnaireData(
+        np.concatenate([b.X for b in blocks]),
+        None if blocks[0].y is None else np.concatenate([b.y for b in blocks]),
+        blocks[0].feature_names,
+        pd.concat([b.passthrough for b in blocks], ignore_index=True),
+    )
+
+
+def partition_questionnaire(path, n_parts) -> list:
+    """
+    Split a dataset into up to `n_parts` (start, end) ranges for `iter_questionnaire`.
+
+    Columnar files split by rows. CSV files split by bytes on line breaks
+    (assumes no quoted newlines, which holds for numeric exports).
+    """
+    if is_columnar(path):
+        n_rows = open_columnar(path).rows
+        bounds = [n_rows * i // n_parts for i in range(n_parts + 1)]
+    else:
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            f.readline()
+            bounds = [f.tell()]
+            for i in range(1, n_parts):
+                f.seek(max(bounds[-1], size * i // n_parts))
+                f.readline()
+                if f.tell() >= size:
+                    break
+                bounds.append(f.tell())
+        bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+class _RangeReader(io.RawIOBase):
+    """Read-only view of the byte range [start, end) of a file."""
+
+    def __init__(self, path, start, end):
+        self._f = open(path, "rb")
+        self._f.seek(start)
+        self._left = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buf):
+        n = self._f.readinto(memoryview(buf)[:max(0, min(len(buf), self._left))])
+        self._left -= n
+        return n
+
+    def close(self):
+        self._f.close()
+        super().close()
@@ -0,0 +1,258 @@
+"""
+AURA+ Assessment History
+Optional local SQLite store of past assessments, for trends over time.
+
+Rows are written by a background thread in batched transactions, so
+recording an assessment never waits on disk. Readers use their own
+connections; in WAL mode they do not block the writer.
+"""
+
+import secrets
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from queue import Empty, Queue
+from typing import NamedTuple
+
+import streamlit as st
+
+from .constants import HISTORY_DB_PATH, HISTORY_BATCH_SIZE, HISTORY_FLUSH_MS
+from .metrics import cache_resource
+from .results import PredictionRecord
+
+TOKEN_PARAM = "u"
+SECONDS_PER_DAY = 86_400
+
+_STOP = object()
+
+# One compact row per assessment. top_k packs the feature indices (uint8)
+# followed by their contributions (float32); suggestion_ids is one byte per id.
+# The user index covers the trend columns, so trend queries never touch the table.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assessments (
+    id INTEGER PRIMARY KEY,
+    user_token TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    model_version TEXT NOT NULL,
+    pred_class INTEGER NOT NULL,
+    p_low REAL NOT NULL,
+    p_moderate REAL NOT NULL,
+    p_high REAL NOT NULL,
+    top_k BLOB NOT NULL,
+    suggestion_ids BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_assessments_user_time
+    ON assessments (user_token, created_at, pred_class, p_low, p_moderate, p_high);
+CREATE INDEX IF NOT EXISTS idx_assessments_time ON assessments (created_at);
+"""
+
+INSERT = """
+INSERT INTO assessments (user_token, created_at, model_version, pred_class,
+                         p_low, p_moderate, p_high, top_k, suggestion_ids)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class TrendPoint(NamedTuple):
+    """Assessments of one user aggregated over one day."""
+
+    day: int  # days since the epoch, in the caller's UTC offset
+    count: int
+    mean_probabilities: tuple
+    class_counts: tuple
+
+
+class HistoryEntry(NamedTuple):
+    created_at: int
+    record: PredictionRecord
+
+
+def pack_top_k(record: PredictionRecord) -> bytes:
+    return array("B", record.top_indices).tobytes() + array("f", record.top_values).tobytes()
+
+
+def unpack_top_k(blob: bytes) -> tuple:
+    """(top_indices, top_values) from a `pack_top_k` blob."""
+    k = len(blob) // 5
+    values = array("f")
+    values.frombytes(blob[k:])
+    return tuple(blob[:k]), tuple(values)
+
+
+def record_to_row(user_token: str, record: PredictionRecord, created_at: int) -> tuple:
+    return (
+        user_token, created_at, record.model_version, record.pred_class,
+        *record.probabilities, pack_top_k(record), bytes(record.suggestion_ids),
+    )
+
+
+def connect(path) -> sqlite3.Connection:
+    """Open the history database in WAL mode, creating the schema if needed."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+class HistoryStore:
+    """
+    Append-only assessment history with a batching background writer.
+
+    `record()` only enqueues; the writer commits up to `batch_size` rows per
+    transaction, at most `flush_ms` after the first of them was queued.
+    """
+
+    def __init__(self, path, batch_size: int = 512, flush_ms: float = 500.0):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_wait = flush_ms / 1000.0
+        self.rows_written = 0
+        self.rows_dropped = 0
+        self.batches_written = 0
+        self.last_error = None
+        self._writer = connect(self.path)
+        self._local = threading.local()
+        self._queue = Queue()
+        self._thread = threading.Thread(target=self._run, name="aura-history", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Write everything queued so far, then stop the writer."""
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._writer.close()
+
+    def record(self, user_token: str, record: PredictionRecord, created_at: int = None):
+        """Queue one assessment for `user_token` (timestamp defaults to now)."""
+        created_at = int(time.time()) if created_at is None else int(created_at)
+        self._queue.put(record_to_row(user_token, record, created_at))
+
+    def record_rows(self, rows):
+        """Queue pre-built `record_to_row` tuples (bulk imports, benchmarks)."""
+        for row in rows:
+            self._queue.put(row)
+
+    def flush(self):
+        """Block until every queued row is committed (read-your-writes)."""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            batch = [item]
+            deadline = time.perf_counter() + self.flush_wait
+            stop = False
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    nxt = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except Empty:
+                    break
+                if nxt is _STOP:
+                    stop = True
+                    break
+                batch.append(nxt)
+
+            self._write(batch)
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                self._queue.task_done()
+                return
+
+    def _write(self, batch):
+        try:
+            with self._writer:
+                self._writer.executemany(INSERT, batch)
+        except sqlite3.Error as exc:  # history is best-effort: never take the app down
+            self.rows_dropped += len(batch)
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            return
+        self.rows_written += len(batch)
+        self.batches_written += 1
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._local.conn = conn
+        return conn
+
+    def count(self, user_token: str) -> int:
+        return self._reader().execute(
+            "SELECT COUNT(*) FROM assessments WHERE user_token = ?", (user_token,)
+        ).fetchone()[0]
+
+    def daily_trend(self, user_token: str, days: int = 90, utc_offset_s: int = 0, now: int = None) -> list:
+        """
+        Per-day mean probabilities and class counts over the last `days` days.
+
+        Served entirely from the (user_token, created_at, ...) covering index.
+        """
+        now = int(time.time()) if now is None else int(now)
+        since = now - days * SECONDS_PER_DAY
+        rows = self._reader().execute(
+            """
+            SELECT (created_at + ?) / ? AS day, COUNT(*),
+                   AVG(p_low), AVG(p_moderate), AVG(p_high),
+                   SUM(pred_class = 0), SUM(pred_class = 1), SUM(pred_class = 2)
+            FROM assessments
+            WHERE user_token = ? AND created_at >= ?
+            GROUP BY day ORDER BY day
+            """,
+            (utc_offset_s, SECONDS_PER_DAY, user_token, since),
+        ).fetchall()
+        return [TrendPoint(r[0], r[1], tuple(r[2:5]), tuple(r[5:8])) for r in rows]
+
+    def recent(self, user_token: str, limit: int = 20) -> list:
+        """Latest assessments of `user_token`, newest first."""
+        rows = self._reader().execute(
+            """
+            SELECT created_at, model_version, pred_class, p_low, p_moderate, p_high, top_k, suggestion_ids
+            FROM assessments WHERE user_token = ?
+            ORDER BY created_at DESC LIMIT ?
+            """,
+            (user_token, limit),
+        ).fetchall()
+        entries = []
+        for created_at, version, pred, p0, p1, p2, top_k, suggestion_ids in rows:
+            indices, values = unpack_top_k(top_k)
+            record = PredictionRecord(version, pred, (p0, p1, p2), indices, values, tuple(suggestion_ids))
+            entries.append(HistoryEntry(created_at, record))
+        return entries
+
+
+@cache_resource("history_store")
+def get_history_store() -> HistoryStore:
+    """Process-wide history store, started on first use."""
+    return HistoryStore(HISTORY_DB_PATH, HISTORY_BATCH_SIZE, HISTORY_FLUSH_MS).start()
+
+
+def history_token(create: bool = False):
+    """
+    Anonymous user token of this browser, kept in the `?u=` query parameter.
+
+    History is enabled exactly when the URL carries a token, so a bookmarked
+    link keeps its history across sessions. With `create`, a new random
+    token is added to the URL if there is none yet.
+    """
+    token = st.query_params.get(TOKEN_PARAM)
+    if token is None and create:
+        token = secrets.token_urlsafe(12)
+        st.query_params[TOKEN_PARAM] = token
+    return token
+
+
+def disable_history():
+    """Stop recording for this browser (stored rows are kept)."""
+    st.query_params.pop(TOKEN_PARAM, None)
@@ -0,0 +1,105 @@
+"""
+AURA+ Lookup-Table Scoring
+Additive scoring engine for the discrete questionnaire input space.
+"""
+
+import numpy as np
+
+from .scoring import BatchExplanation, CompiledModel, softmax, top_k_contributions
+
+
+class LookupTableScorer:
+    """
+    Precomputed per-feature, per-value, per-class logit contributions.
+
+    Row `base[f] + v` of `table` holds feature f's contribution to every class
+    logit when it takes value v, so a score is the bias plus the sum of one
+    row per feature, and the explanation is those same rows.
+    """
+
+    def __init__(self, table, base, lows, highs, bias, feature_names, classes, checksum=""):
+        self.table = table
+        self.base = base
+        self.lows = lows
+        self.highs = highs
+        self.bias = bias
+        self.feature_names = list(feature_names)
+        self.classes = list(classes)
+        self.checksum = checksum
+
+    @classmethod
+    def from_compiled(cls, compiled: CompiledModel, ranges: dict) -> "LookupTableScorer":
+        """
+        Tabulate a compiled model over each feature's valid value range.
+
+        Args:
+            compiled: Folded logistic regression
+            ranges: Mapping of feature name to inclusive (min, max) integer range
+
+        Returns:
+            LookupTableScorer: Engine with the same outputs as `compiled`
+        """
+        lows = np.array([ranges[f][0] for f in compiled.feature_names], dtype=np.intp)
+        highs = np.array([ranges[f][1] for f in compiled.feature_names], dtype=np.intp)
+        sizes = highs - lows + 1
+        offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+
+        # Feature index and value of every table row
+        feat = np.repeat(np.arange(len(sizes)), sizes)
+        value = np.arange(sizes.sum()) - offsets[feat] + lows[feat]
+
+        table = (value - compiled.mean[feat])[:, np.newaxis] * compiled.weights[feat]
+        bias = compiled.bias + compiled.mean @ compiled.weights
+        return cls(
+            np.ascontiguousarray(table), offsets - lows, lows, highs, bias,
+            compiled.feature_names, compiled.classes, compiled.fingerprint,
+        )
+
+    @property
+    def n_classes(self) -> int:
+        return self.table.shape[1]
+
+    def rows(self, X):
+        """
+        Table entries for each answer: shape (n, n_features, n_classes).
+
+        Raises:
+            ValueError: If an answer is not an integer inside its valid range
+        """
+        X = np.atleast_2d(X)
+        if not np.issubdtype(X.dtype, np.integer):
+            if not np.array_equal(X, np.floor(X)):
+                raise ValueError("Lookup-table scoring needs integer answers.")
+            X = X.astype(np.intp)
+        if (X < self.lows).any() or (X > self.highs).any():
+            raise ValueError("Answer outside the valid range of its feature.")
+        return self.table[X + self.base]
+
+    def logits(self, X):
+        return self.rows(X).sum(axis=1) + self.bias
+
+    def predict_proba(self, X):
+        """Class probabilities with shape (n, n_classes)."""
+        return softmax(self.logits(X))
+
+    def score(self, X):
+        """
+        Score a batch from one gather.
+
+        Returns:
+            tuple: (predicted_class, probabilities, contributions), matching
+            `CompiledModel.score`
+        """
+        rows = self.rows(X)
+        logits = rows.sum(axis=1) + self.bias
+        pred = np.argmax(logits, axis=1)
+        # Binary models explain with the single coefficient row, as the pipeline did
+        cols = pred if self.n_classes > 2 else np.ones_like(pred)
+        contrib = np.take_along_axis(rows, cols[:, np.newaxis, np.newaxis], axis=2)[:, :, 0]
+        return pred, softmax(logits), contrib
+
+    def explain(self, X, top_k: int = 6) -> BatchExplanation:
+        """Top-k explanation for every row, as `scoring.explain_batch` returns."""
+        pred, _, contrib = self.score(X)
+        idx, values = top_k_contributions(contrib, top_k)
+        return BatchExplanation(pred, idx, values)
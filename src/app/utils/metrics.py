@@ -0,0 +1,372 @@
+"""
+AURA+ Metrics
+Always-on counters and latency histograms, exposed in Prometheus text format.
+
+Recording an event is one lock round-trip and an integer add (about a
+microsecond), so instrumentation stays on in production. Cache statistics
+and session counts are only read when metrics are collected. Exposition is
+off unless `AURA_METRICS_PORT` or `AURA_METRICS_FILE` is set (see
+`get_metrics_exporter`).
+
+Plain Python only (no NumPy), so every page can report without loading the
+model stack.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+
+import streamlit as st
+
+from .constants import (
+    METRICS_FILE, METRICS_HOST, METRICS_INTERVAL_S, METRICS_PORT, METRICS_SESSION_TTL_S
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; from a score-cache hit (~10 µs) to a cold sklearn call
+LATENCY_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=()) -> str:
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter, optionally split by label values (passed positionally)."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels):
+        return self._values.get(labels, 0)
+
+    def lines(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus `le` semantics) per label values."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, buckets=LATENCY_BUCKETS, labelnames=()):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        self.labelnames = tuple(labelnames)
+        self._series = {}  # labels -> [count per bucket..., count above the last bucket, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels):
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[i] += 1
+            series[-1] += value
+
+    def lines(self):
+        with self._lock:
+            items = sorted((labels, list(series)) for labels, series in self._series.items())
+        for labels, series in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), series):
+                cumulative += count
+                le = (("le", _number(bound) if bound == float("inf") else repr(bound)),)
+                yield f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(series[-1])}"
+            yield f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}"
+
+
+class Collected:
+    """Gauge or counter whose (label values, value) samples come from a callback at collection time."""
+
+    def __init__(self, name: str, help: str, kind: str, labelnames, collect):
+        self.name = name
+        self.help = help
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self.collect = collect
+
+    def lines(self):
+        for labels, value in self.collect():
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = {}
+
+    def register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        out = []
+        for metric in self._metrics.values():
+            out.append(f"# HELP {metric.name} {metric.help}")
+            out.append(f"# TYPE {metric.name} {metric.kind}")
+            out.extend(metric.lines())
+        return "\n".join(out) + "\n"
+
+
+class SessionTracker:
+    """Browser sessions seen within the last `ttl_s` seconds."""
+
+    def __init__(self, ttl_s: float = METRICS_SESSION_TTL_S):
+        self.ttl_s = ttl_s
+        self._seen = {}
+
+    def touch(self, session_id: str):
+        self._seen[session_id] = time.monotonic()
+
+    def active(self) -> int:
+        cutoff = time.monotonic() - self.ttl_s
+        for session_id, seen in list(self._seen.items()):
+            if seen < cutoff:
+                self._seen.pop(session_id, None)
+        return len(self._seen)
+
+
+REGISTRY = MetricsRegistry()
+
+PREDICTION_LATENCY = REGISTRY.register(Histogram(
+    "aura_prediction_latency_seconds", "Wall time of one scoring call, by code path.", labelnames=("path",)
+))
+PREDICTIONS = REGISTRY.register(Counter(
+    "aura_predictions_total", "Predictions shown to users, by predicted risk class.", ("risk_class",)
+))
+PAGE_RERUNS = REGISTRY.register(Counter(
+    "aura_page_reruns_total", "Full script reruns, by routed page.", ("page",)
+))
+SESSIONS = SessionTracker()
+REGISTRY.register(Collected(
+    "aura_active_sessions", f"Sessions with a rerun in the last {METRICS_SESSION_TTL_S} seconds.", "gauge", (),
+    lambda: [((), SESSIONS.active())],
+))
+
+# name -> callable returning a mapping with "hits" and "misses"
+_CACHES = {}
+
+
+def _cache_samples(field):
+    def collect():
+        for name, stats in list(_CACHES.items()):
+            yield (name,), stats()[field]
+    return collect
+
+
+def _cache_ratios():
+    for name, stats in list(_CACHES.items()):
+        s = stats()
+        lookups = s["hits"] + s["misses"]
+        yield (name,), s["hits"] / lookups if lookups else 0.0
+
+
+REGISTRY.register(Collected("aura_cache_hits_total", "Cache lookups served from the cache.", "counter",
+                            ("cache",), _cache_samples("hits")))
+REGISTRY.register(Collected("aura_cache_misses_total", "Cache lookups that computed the value.", "counter",
+                            ("cache",), _cache_samples("misses")))
+REGISTRY.register(Collected("aura_cache_hit_ratio", "Hits over lookups since process start.", "gauge",
+                            ("cache",), _cache_ratios))
+
+
+def register_cache(name: str, stats):
+    """Export a cache's counters; `stats()` returns a mapping with "hits" and "misses"."""
+    _CACHES[name] = stats
+
+
+def timed(path: str):
+    """Decorator recording each call's latency in `aura_prediction_latency_seconds{path=...}`."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PREDICTION_LATENCY.observe(time.perf_counter() - start, path)
+        return wrapper
+    return decorator
+
+
+def cache_resource(name: str, **cache_kwargs):
+    """
+    `st.cache_resource` that also exports its hit/miss counts as cache `name`.
+
+    Misses are counted inside the cached body, calls around it; the returned
+    function keeps `.clear()`.
+    """
+    def decorator(func):
+        counts = {"calls": 0, "misses": 0}
+        lock = threading.Lock()
+
+        @wraps(func)
+        def body(*args, **kwargs):
+            with lock:
+                counts["misses"] += 1
+            return func(*args, **kwargs)
+
+        cached = st.cache_resource(**cache_kwargs)(body)
+
+        @wraps(func)
+        def call(*args, **kwargs):
+            with lock:
+                counts["calls"] += 1
+            return cached(*args, **kwargs)
+
+        call.clear = cached.clear
+        register_cache(name, lambda: {"hits": counts["calls"] - counts["misses"], "misses": counts["misses"]})
+        return call
+    return decorator
+
+
+def record_rerun(page: str):
+    """Count a full rerun of `page` and mark the current browser session active."""
+    PAGE_RERUNS.inc(page)
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:  # pragma: no cover - very old Streamlit
+        return
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        SESSIONS.touch(ctx.session_id)
+
+
+class MetricsExporter:
+    """
+    Serves `REGISTRY` on http://host:port/metrics and/or rewrites `path` every `interval_s`.
+
+    Both run on daemon threads. A port that cannot be bound or a failed file
+    write is kept in `last_error`; file writes are retried every interval.
+    """
+
+    def __init__(self, registry=REGISTRY, host: str = "127.0.0.1", port: int = 0, path: str = "",
+                 interval_s: float = 15.0):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.path = path
+        self.interval_s = interval_s
+        self.last_error = None
+        self.server = None
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        if self.port:
+            try:
+                self.server = self._make_server()
+            except OSError as exc:  # e.g. port taken by another app process: keep the app running
+                self.last_error = f"{type(exc).__name__}: {exc}"
+            else:
+                self.port = self.server.server_address[1]
+                self._spawn(self.server.serve_forever, "aura-metrics-http")
+        if self.path:
+            self._spawn(self._write_loop, "aura-metrics-file")
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+        for thread in self._threads:
+            thread.join()
+        if self.path:
+            self.write()
+
+    def write(self):
+        """Atomically replace `path` with the current exposition."""
+        tmp = f"{self.path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(self.registry.render())
+            os.replace(tmp, self.path)
+            self.last_error = None
+        except OSError as exc:
+            self.last_error = f"{type(exc).__name__}: {exc}"
+
+    def _write_loop(self):
+        while not self._stop.is_set():
+            self.write()
+            self._stop.wait(self.interval_s)
+
+    def _spawn(self, target, name):
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _make_server(self):
+        # Imported here: most processes never serve metrics over HTTP
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # keep the Streamlit log clean
+                pass
+
+        server = ThreadingHTTPServer((self.host, self.port), Handler)
+        server.daemon_threads = True
+        return server
+
+
+@st.cache_resource
+def get_metrics_exporter():
+    """
+    Process-wide exporter, started on first use when a port or file is configured.
+
+    Returns:
+        MetricsExporter or None (exposition disabled)
+    """
+    if not METRICS_PORT and not METRICS_FILE:
+        return None
+    return MetricsExporter(REGISTRY, METRICS_HOST, METRICS_PORT, METRICS_FILE, METRICS_INTERVAL_S).start()
@@ -1,34 +1,100 @@
 """
 AURA+ Model Utilities
 Functions for loading models, making predictions, and explaining results.
+
+pandas and joblib are imported inside the functions that need them, so
+importing this module (and scoring with the compiled model) stays cheap.
 """
 
 import streamlit as st
-import pandas as pd
 import numpy as np
-import joblib
-from datetime import datetime
-from .constants import MODEL_PATH, DATA_PATH, STRESS_LABELS, QUESTION_MAP, SUGGESTION_RULES
+from dataclasses import dataclass
+from functools import cached_property
+from .constants import (
+    MODEL_PATH, COMPILED_MODEL_PATH, MODEL_REGISTRY_PATH, DATA_PATH, COLUMNAR_DATA_PATH, FEATURE_MANIFEST_PATH,
+    TARGET_COLUMN, FEATURE_RANGES, STRESS_LABELS, QUESTION_MAP, SCORE_CACHE_SIZE
+)
+from .cache import LRUCache
+from .columnar import read_columnar_header
+from .lut import LookupTableScorer
+from .metrics import cache_resource, register_cache, timed
+from .registry import ModelRegistry, ModelSnapshot
+from .reports import format_feature_label, make_report_text, render_report  # noqa: F401 (re-exported)
+from .results import SUGGESTION_TEXTS, PredictionRecord, suggestion_ids_for
+from .schema import read_feature_manifest, manifest_feature_names
+from .scoring import BatchExplanation, top_k_contributions
+
+# Process-wide cache of ScoreResult, keyed by packed answers + model fingerprint
+SCORE_CACHE = LRUCache(maxsize=SCORE_CACHE_SIZE)
+register_cache("score", SCORE_CACHE.stats)
 
 
-@st.cache_resource
+@cache_resource("load_model")
 def load_model():
     """Load the trained logistic regression model."""
+    import joblib
+
     if not MODEL_PATH.exists():
         st.error("Model file not found. Train baseline first: python src/models/01_train_baseline.py")
         st.stop()
     return joblib.load(MODEL_PATH)
 
 
+@cache_resource("model_registry")
+def get_model_registry():
+    """
+    Process-wide model registry.
+
+    Follows `models/registry.json` when present; otherwise serves the single
+    exported artifact (or the folded joblib pipeline) as "unversioned".
+    """
+    if not MODEL_REGISTRY_PATH.exists() and not COMPILED_MODEL_PATH.exists() and not MODEL_PATH.exists():
+        st.error("Model file not found. Train baseline first: python src/models/01_train_baseline.py")
+        st.stop()
+    return ModelRegistry(MODEL_REGISTRY_PATH, COMPILED_MODEL_PATH, MODEL_PATH)
+
+
+def load_active_model() -> ModelSnapshot:
+    """
+    Snapshot of the active model version.
+
+    Call once per rerun and use the snapshot throughout, so a version swap
+    in the background never mixes two models within one page render.
+    """
+    return get_model_registry().current()
+
+
+def load_compiled_model():
+    """Load the NumPy-only scorer of the active model version."""
+    return load_active_model().scorer
+
+
+@cache_resource("feature_manifest")
+def load_feature_manifest():
+    """Load the feature manifest once per process (None if it has not been built)."""
+    if not FEATURE_MANIFEST_PATH.exists():
+        return None
+    return read_feature_manifest(FEATURE_MANIFEST_PATH)
+
+
 def get_feature_names():
-    """Get feature names from the processed dataset."""
-    if not DATA_PATH.exists():
-        st.error("Processed dataset not found. Run cleaning first.")
+    """Get feature names from the feature manifest, or the processed dataset header."""
+    manifest = load_feature_manifest()
+    if manifest is not None:
+        return manifest_feature_names(manifest)
+    if COLUMNAR_DATA_PATH.exists():
+        columns = [c["name"] for c in read_columnar_header(COLUMNAR_DATA_PATH)["columns"]]
+    elif DATA_PATH.exists():
+        import pandas as pd
+
+        columns = pd.read_csv(DATA_PATH, nrows=0).columns
+    else:
+        st.error("Feature manifest and processed dataset not found. Run cleaning first.")
         st.stop()
-    df = pd.read_csv(DATA_PATH)
-    return [c for c in df.columns if c != "stress_level"]
+    return [c for c in columns if c != TARGET_COLUMN]
 
 
+@timed("explain_with_coefficients")
 def explain_with_coefficients(pipeline, user_df, feature_names, top_k=6):
     """
     Explain prediction using model coefficients.
@@ -42,6 +108,8 @@ def explain_with_coefficients(pipeline, user_df, feature_names, top_k=6):
     Returns:
         tuple: (predicted_class, top_contributions)
     """
+    import pandas as pd
+
     scaler = pipeline.named_steps["scaler"]
     model = pipeline.named_steps["model"]
 
@@ -64,51 +132,208 @@ def explain_with_coefficients(pipeline, user_df, feature_names, top_k=6):
     return pred_class, expl.head(top_k)
 
 
-def format_feature_label(feat: str) -> str:
-    """Convert feature name to human-friendly label."""
-    meta = QUESTION_MAP.get(feat)
-    if meta:
-        return meta["label"]
-    return feat.replace("_", " ").title()
+def explain_with_coefficients_batch(pipeline, X, top_k=6) -> BatchExplanation:
+    """
+    Vectorized `explain_with_coefficients` for an (n, n_features) matrix.
 
+    Args:
+        pipeline: Trained sklearn pipeline
+        X: Array or DataFrame of unscaled inputs in training feature order
+        top_k: Number of top contributors to return per row
 
-def make_report_text(pred_label, probs, top_contrib, suggestions):
+    Returns:
+        BatchExplanation: Predicted classes plus (n, top_k) feature indices
+        and contributions, ordered by absolute contribution
     """
-    Generate downloadable text report.
-    
+    scaler = pipeline.named_steps["scaler"]
+    model = pipeline.named_steps["model"]
+
+    # Scale once and predict from the scaled matrix
+    x_scaled = scaler.transform(X)
+    pred_class = model.predict(x_scaled).astype(int)
+
+    coef = np.atleast_2d(model.coef_)
+    rows = coef[pred_class] if coef.shape[0] > 1 else coef[np.zeros_like(pred_class)]
+    indices, values = top_k_contributions(x_scaled * rows, top_k)
+    return BatchExplanation(pred_class, indices, values)
+
+
+@dataclass(frozen=True, eq=False)
+class ScoreResult:
+    """
+    Immutable outcome of a single `score()` call.
+
+    Class, probabilities and the full contribution vector are filled in by
+    one scoring pass; the explanation Series, suggestions and report text are
+    derived on first access and then cached on the instance.
+    """
+
+    pred_class: int
+    probabilities: np.ndarray
+    contributions: np.ndarray
+    feature_names: tuple
+    top_k: int = 6
+    model_version: str = ""
+
+    @property
+    def pred_label(self) -> str:
+        return STRESS_LABELS[self.pred_class]
+
+    @cached_property
+    def top_indices(self) -> tuple:
+        """Feature indices of the top-k contributors, by |contribution|."""
+        idx, _ = top_k_contributions(self.contributions[np.newaxis, :], self.top_k)
+        return tuple(int(i) for i in idx[0])
+
+    @cached_property
+    def top_contributions(self):
+        """Top-k contributions in the same shape `explain_with_coefficients` returns."""
+        import pandas as pd
+
+        idx = list(self.top_indices)
+        return pd.Series(self.contributions[idx], index=[self.feature_names[i] for i in idx])
+
+    @cached_property
+    def suggestion_ids(self) -> tuple:
+        """Ids of the unique suggestions for the top contributors, in contribution order."""
+        return suggestion_ids_for(self.feature_names[i] for i in self.top_indices)
+
+    @cached_property
+    def suggestions(self) -> list:
+        """Unique suggestions for the top contributors, in contribution order."""
+        return [SUGGESTION_TEXTS[i] for i in self.suggestion_ids]
+
+    def to_record(self) -> PredictionRecord:
+        """Compact, theme-independent copy for session state (see `utils.results`)."""
+        return PredictionRecord(
+            model_version=self.model_version,
+            pred_class=self.pred_class,
+            probabilities=tuple(float(p) for p in self.probabilities),
+            top_indices=self.top_indices,
+            top_values=tuple(float(self.contributions[i]) for i in self.top_indices),
+            suggestion_ids=self.suggestion_ids,
+        )
+
+    @cached_property
+    def report_text(self) -> str:
+        return self.report("txt")
+
+    def report(self, fmt: str = "txt") -> str:
+        """Downloadable report in one of `utils.reports.REPORT_FORMATS`, rendered on call."""
+        return render_report(self.to_record(), self.feature_names, fmt)
+
+
+def pack_answers(values) -> bytes:
+    """
+    Pack an answer vector into a compact cache key.
+
+    Questionnaire answers are small non-negative integers and fit in one byte
+    each; anything else falls back to the float64 bytes.
+    """
+    arr = np.asarray(values)
+    if np.issubdtype(arr.dtype, np.integer) and arr.size and arr.min() >= 0 and arr.max() <= 255:
+        return arr.astype(np.uint8).tobytes()
+    return b"f" + arr.astype(np.float64).tobytes()
+
+
+@timed("score")
+def score(scorer, user_input: dict, top_k=6, model_version="") -> ScoreResult:
+    """
+    Score one questionnaire in a single pass.
+
+    Identical answer sets for the same model are served from `SCORE_CACHE`
+    without touching the scorer.
+
     Args:
-        pred_label: Predicted stress level label
-        probs: Probability distribution
-        top_contrib: Top contributing features
-        suggestions: List of suggestions
-        
+        scorer: CompiledModel from `load_compiled_model()`
+        user_input: Mapping of feature name to answer
+        top_k: Number of top contributors the result explains
+        model_version: Registry version of `scorer`, recorded on the result
+
     Returns:
-        str: Formatted report text
-    """
-    now = datetime.now().strftime("%Y-%m-%d %H:%M")
-    lines = []
-    lines.append("AURA+ — Stress Risk Screening Report")
-    lines.append(f"Generated: {now}")
-    lines.append("")
-    lines.append("Disclaimer: Educational screening only; not a diagnosis or medical advice.")
-    lines.append("")
-    lines.append(f"Predicted risk level: {pred_label}")
-    lines.append(f"Model confidence (approx.): Low={probs[0]:.2f}, Moderate={probs[1]:.2f}, High={probs[2]:.2f}")
-    lines.append("")
-    lines.append("Top contributing factors:")
-    for feat, val in top_contrib.items():
-        direction = "increases risk" if val > 0 else "reduces risk"
-        lines.append(f"- {format_feature_label(feat)}: {direction} (score={val:.3f})")
-    lines.append("")
-    lines.append("General suggestions:")
-    if suggestions:
-        for s in suggestions:
-            lines.append(f"- {s}")
+        ScoreResult: Read-only result shared by the result card, the
+        Advanced Details table and the report
+    """
+    values = [user_input[feat] for feat in scorer.feature_names]
+    key = (scorer.fingerprint, model_version, top_k, pack_answers(values))
+    cached = SCORE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    x = np.array([values], dtype=np.float64)
+    pred, proba, contrib = scorer.score(x)
+
+    probabilities, contributions = proba[0], contrib[0]
+    probabilities.setflags(write=False)
+    contributions.setflags(write=False)
+    result = ScoreResult(
+        pred_class=int(scorer.classes[pred[0]]),
+        probabilities=probabilities,
+        contributions=contributions,
+        feature_names=tuple(scorer.feature_names),
+        top_k=top_k,
+        model_version=model_version,
+    )
+    SCORE_CACHE.put(key, result)
+    return result
+
+
+def score_cache_stats() -> dict:
+    """Hit/miss/eviction counters of the process-wide score cache."""
+    return SCORE_CACHE.stats()
+
+
+@cache_resource("lookup_engine", max_entries=4)
+def _build_lookup_engine(_scorer, fingerprint: str):
+    manifest = load_feature_manifest()
+    if manifest is not None:
+        ranges = {feat["name"]: (feat["min"], feat["max"]) for feat in manifest["features"]}
     else:
-        lines.append("- Maintain healthy routines and seek support when needed.")
-    lines.append("")
-    lines.append("If you feel unsafe or at risk of self-harm, seek immediate local emergency help.")
-    return "\n".join(lines)
+        ranges = FEATURE_RANGES
+    return LookupTableScorer.from_compiled(_scorer, ranges)
+
+
+def load_lookup_engine(scorer=None):
+    """
+    Build the lookup-table engine over the manifest's valid answer ranges.
+
+    Args:
+        scorer: CompiledModel to tabulate (default: the active version);
+            engines are cached per model fingerprint
+    """
+    scorer = scorer if scorer is not None else load_compiled_model()
+    return _build_lookup_engine(scorer, scorer.fingerprint)
+
+
+def predict_proba_lut(engine, X):
+    """
+    Drop-in for `predict_proba_safe` backed by a LookupTableScorer.
+
+    Args:
+        engine: LookupTableScorer from `load_lookup_engine()`
+        X: array-like or DataFrame of integer answers (unscaled)
+
+    Returns:
+        np.ndarray: probability estimates with shape (n_samples, n_classes)
+    """
+    if hasattr(X, "columns"):  # DataFrame: select the engine's feature order
+        X = X[engine.feature_names]
+    return engine.predict_proba(np.asarray(X))
+
+
+def explain_with_lut(engine, user_df, feature_names, top_k=6):
+    """
+    Drop-in for `explain_with_coefficients` backed by a LookupTableScorer.
+
+    Returns:
+        tuple: (predicted_class, top_contributions)
+    """
+    import pandas as pd
+
+    pred, _, contrib = engine.score(user_df[engine.feature_names].to_numpy())
+    expl = pd.Series(contrib[0], index=engine.feature_names).reindex(feature_names)
+    expl = expl.sort_values(key=np.abs, ascending=False)
+    return int(engine.classes[pred[0]]), expl.head(top_k)
 
 
 def set_defaults(feature_names):
@@ -119,6 +344,7 @@ def set_defaults(feature_names):
         st.session_state[f"inp_{feat}"] = default
 
 
+@timed("predict_proba_safe")
 def predict_proba_safe(pipeline, X):
     """
     Robustly compute probability estimates for a sklearn pipeline where the
@@ -0,0 +1,72 @@
+"""
+AURA+ Live Preview
+Incremental risk estimate kept in session state while the questionnaire changes.
+"""
+
+import streamlit as st
+import numpy as np
+
+from .scoring import softmax
+
+LOGITS_KEY = "preview_logits"
+VALUES_KEY = "preview_values"
+MODEL_KEY = "preview_model"
+
+
+def _apply_delta(engine, feat: str):
+    """Move the stored logits by one feature's table-row difference: O(classes)."""
+    new = st.session_state.get(f"inp_{feat}")
+    old = st.session_state[VALUES_KEY].get(feat)
+    if new == old:
+        return
+    f = engine.feature_names.index(feat)
+    base = engine.base[f]
+    st.session_state[LOGITS_KEY] = st.session_state[LOGITS_KEY] + (
+        engine.table[base + new] - engine.table[base + old]
+    )
+    st.session_state[VALUES_KEY][feat] = new
+
+
+def sync_live_preview(engine):
+    """
+    Make the preview logits match the current answers.
+
+    The first call scores the full answer vector once; later calls only apply
+    deltas for answers that changed outside a widget callback (e.g. Reset).
+    A different model version (hot reload) starts over from a full score.
+    """
+    if st.session_state.get(MODEL_KEY) != engine.checksum:
+        clear_live_preview()
+    if LOGITS_KEY not in st.session_state:
+        values = {feat: st.session_state.get(f"inp_{feat}") for feat in engine.feature_names}
+        x = np.array([[values[feat] for feat in engine.feature_names]])
+        st.session_state[LOGITS_KEY] = engine.logits(x)[0]
+        st.session_state[VALUES_KEY] = values
+        st.session_state[MODEL_KEY] = engine.checksum
+        return
+    for feat in engine.feature_names:
+        _apply_delta(engine, feat)
+
+
+def on_answer_change(engine, feat: str):
+    """Widget `on_change` callback for `inp_<feat>`."""
+    if LOGITS_KEY in st.session_state and st.session_state.get(MODEL_KEY) == engine.checksum:
+        _apply_delta(engine, feat)
+
+
+def clear_live_preview():
+    """Drop the preview state so the next sync rescores from scratch."""
+    st.session_state.pop(LOGITS_KEY, None)
+    st.session_state.pop(VALUES_KEY, None)
+    st.session_state.pop(MODEL_KEY, None)
+
+
+def preview_probabilities(engine):
+    """
+    Current preview estimate.
+
+    Returns:
+        tuple: (predicted_class, probabilities)
+    """
+    proba = softmax(st.session_state[LOGITS_KEY][np.newaxis, :])[0]
+    return int(engine.classes[int(np.argmax(proba))]), proba
@@ -0,0 +1,232 @@
+"""
+AURA+ Developer Profiler
+Per-phase rerun timings and on-demand sampling flamegraphs (?debug=1).
+
+Nothing is recorded unless the developer panel is enabled; a span outside
+it costs one session-state lookup. Plain Python only, so every page can be
+profiled without loading the model stack.
+"""
+
+import math
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager, nullcontext
+from html import escape
+from typing import NamedTuple
+from zlib import crc32
+
+import streamlit as st
+
+from .constants import PROFILER_SAMPLE_MS, PROFILER_WINDOW
+
+SESSION_KEY = "dev_profiler"
+TOTAL = "total"
+
+_NULL_SPAN = nullcontext()
+
+
+class PhaseStats(NamedTuple):
+    phase: str
+    count: int
+    last_ms: float
+    p50_ms: float
+    p95_ms: float
+
+
+def percentile(values, q: float) -> float:
+    """Nearest-rank percentile of a non-empty sequence."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+class StackSampler:
+    """
+    Samples one thread's Python stack from a background thread.
+
+    Stacks are folded into "outer;...;inner" strings (the flamegraph.pl /
+    speedscope format) and counted. With `root_file`, frames above the first
+    frame of that file (the Streamlit runner) are dropped. CPU-bound code is
+    sampled at most once per interpreter switch interval (5 ms by default).
+    """
+
+    def __init__(self, thread_id: int, interval_ms: float = PROFILER_SAMPLE_MS, root_file: str = None):
+        self.thread_id = thread_id
+        self.interval = interval_ms / 1000.0
+        self.root_file = os.path.abspath(root_file) if root_file else None
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="aura-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if self._stop.is_set():  # woke by timeout while stop() was already waiting on us
+                break
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[self._fold(frame)] += 1
+
+    def _fold(self, frame) -> str:
+        frames = []
+        while frame is not None:
+            frames.append(frame.f_code)
+            frame = frame.f_back
+        frames.reverse()
+        if self.root_file is not None:
+            for i, code in enumerate(frames):
+                if code.co_filename == self.root_file:
+                    frames = frames[i:]
+                    break
+        return ";".join(f"{c.co_name} ({os.path.basename(c.co_filename)}:{c.co_firstlineno})" for c in frames)
+
+
+class RerunProfiler:
+    """
+    Rolling per-phase timings of one session's reruns.
+
+    `begin()` and `end()` bracket a full rerun; `span(phase)` times one phase
+    inside it (or inside a fragment rerun). The last `window` spans of every
+    phase are kept. `capture(n)` samples the stacks of the next `n` full
+    reruns for a flamegraph.
+    """
+
+    def __init__(self, window: int = PROFILER_WINDOW, sample_ms: float = PROFILER_SAMPLE_MS):
+        self.window = window
+        self.sample_ms = sample_ms
+        self.spans = {}
+        self.last = {}
+        self.reruns = 0
+        self.stacks = Counter()
+        self.capture_left = 0
+        self.capture_total = 0
+        self._start = None
+        self._sampler = None
+
+    def begin(self, root_file: str = None):
+        if self._sampler is not None:  # previous rerun was interrupted (st.rerun, new input)
+            self._finish_sample()
+        self.last = {}
+        self._start = time.perf_counter()
+        if self.capture_left:
+            self._sampler = StackSampler(threading.get_ident(), self.sample_ms, root_file).start()
+
+    def end(self):
+        if self._start is None:
+            return
+        self.add(TOTAL, (time.perf_counter() - self._start) * 1000)
+        self._start = None
+        self.reruns += 1
+        if self._sampler is not None:
+            self._finish_sample()
+
+    @contextmanager
+    def span(self, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, (time.perf_counter() - start) * 1000)
+
+    def add(self, phase: str, ms: float):
+        window = self.spans.get(phase)
+        if window is None:
+            window = self.spans[phase] = deque(maxlen=self.window)
+        window.append(ms)
+        self.last[phase] = self.last.get(phase, 0.0) + ms
+
+    def capture(self, reruns: int):
+        """Sample the next `reruns` full reruns (replaces the previous flamegraph)."""
+        self.stacks = Counter()
+        self.capture_left = self.capture_total = reruns
+
+    def _finish_sample(self):
+        self.stacks.update(self._sampler.stop())
+        self._sampler = None
+        self.capture_left = max(0, self.capture_left - 1)
+
+    def summary(self) -> list:
+        """PhaseStats per phase in first-seen order, `total` last."""
+        stats = [
+            PhaseStats(phase, len(values), self.last.get(phase, 0.0), percentile(values, 50), percentile(values, 95))
+            for phase, values in self.spans.items() if values
+        ]
+        return sorted(stats, key=lambda s: s.phase == TOTAL)
+
+
+def begin_rerun(enabled: bool, root_file: str = None):
+    """
+    Start profiling this rerun when `enabled`, else drop the session profiler.
+
+    Returns:
+        RerunProfiler or None
+    """
+    if not enabled:
+        st.session_state.pop(SESSION_KEY, None)
+        return None
+    profiler = st.session_state.get(SESSION_KEY)
+    if profiler is None:
+        profiler = st.session_state[SESSION_KEY] = RerunProfiler()
+    profiler.begin(root_file)
+    return profiler
+
+
+def dev_span(phase: str):
+    """Context manager timing `phase` when the developer profiler is on (no-op otherwise)."""
+    profiler = st.session_state.get(SESSION_KEY)
+    return profiler.span(phase) if profiler is not None else _NULL_SPAN
+
+
+def folded_stacks(stacks: Counter) -> str:
+    """Collapsed-stack text ("a;b;c 12" per line) for flamegraph.pl or speedscope."""
+    return "\n".join(f"{stack} {count}" for stack, count in stacks.most_common())
+
+
+def flamegraph_svg(stacks: Counter, width: int = 1200, row_height: int = 17) -> str:
+    """Self-contained SVG flamegraph (root at the top) of folded stacks."""
+    root = {"count": 0, "children": {}}
+    for stack, count in stacks.items():
+        node = root
+        node["count"] += count
+        for frame in stack.split(";"):
+            node = node["children"].setdefault(frame, {"count": 0, "children": {}})
+            node["count"] += count
+
+    total = root["count"] or 1
+    rects = []
+    max_depth = 0
+
+    def layout(node, x, depth):
+        nonlocal max_depth
+        for name, child in sorted(node["children"].items()):
+            w = child["count"] / total * width
+            if w >= 0.5:
+                max_depth = max(max_depth, depth)
+                hue = 10 + crc32(name.encode()) % 45
+                label = escape(name if len(name) * 7 <= w - 6 else name[: max(0, int((w - 6) / 7) - 1)] + "…")
+                rects.append(
+                    f'<g><title>{escape(name)} — {child["count"]} samples ({child["count"] / total:.1%})</title>'
+                    f'<rect x="{x:.1f}" y="{depth * row_height}" width="{w:.1f}" height="{row_height - 1}" '
+                    f'fill="hsl({hue},85%,60%)" rx="2"/>'
+                    + (f'<text x="{x + 3:.1f}" y="{depth * row_height + 12}">{label}</text>' if w > 30 else "")
+                    + "</g>"
+                )
+                layout(child, x, depth + 1)
+            x += w
+
+    layout(root, 0.0, 0)
+    height = (max_depth + 1) * row_height
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" width="100%" '
+        f'font-family="monospace" font-size="11">{"".join(rects)}</svg>'
+    )
@@ -0,0 +1,167 @@
+"""
+AURA+ Model Registry
+Versioned model artifacts with a manifest-selected active version and hot reload.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from .scoring import CompiledModel, load_scorer
+
+# Manifest layout (models/registry.json):
+# {"active": "<version>",
+#  "versions": {"<version>": {"artifact": "<path>", "pipeline": "<path>", "sha256": "...", "created": "..."}}}
+# Paths are relative to the manifest's directory.
+REGISTRY_FORMAT = 1
+
+
+class ModelSnapshot(NamedTuple):
+    """One loaded model version; never mutated after it is published."""
+
+    version: str
+    scorer: CompiledModel
+    loaded_at: float
+
+
+def read_registry(path) -> dict:
+    """Parse a registry manifest."""
+    with open(path, "r", encoding="utf-8") as f:
+        registry = json.load(f)
+    if registry.get("active") not in registry.get("versions", {}):
+        raise ValueError(f"Active version {registry.get('active')!r} is not listed in {path}.")
+    return registry
+
+
+def write_registry(registry: dict, path):
+    """Atomically replace a registry manifest (readers see the old or the new file, never half of one)."""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(registry, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def register_version(path, version: str, artifact, pipeline=None, sha256: str = "", activate: bool = True) -> dict:
+    """
+    Add (or overwrite) a version entry and optionally make it active.
+
+    Args:
+        path: Registry manifest path (created if missing)
+        version: Version label
+        artifact: Compiled model artifact
+        pipeline: Optional sklearn pipeline the artifact was folded from
+        sha256: Payload checksum of the artifact
+        activate: Point `active` at the new version
+
+    Returns:
+        dict: The updated manifest
+    """
+    path = Path(path)
+    registry = read_registry(path) if path.exists() else {"format": REGISTRY_FORMAT, "versions": {}}
+    entry = {
+        "artifact": os.path.relpath(artifact, path.parent),
+        "sha256": sha256,
+        "created": datetime.now().isoformat(timespec="seconds"),
+    }
+    if pipeline is not None:
+        entry["pipeline"] = os.path.relpath(pipeline, path.parent)
+    registry["versions"][version] = entry
+    if activate or "active" not in registry:
+        registry["active"] = version
+    write_registry(registry, path)
+    return registry
+
+
+class ModelRegistry:
+    """
+    Serves the active model version and swaps in new ones without downtime.
+
+    `current()` stats the manifest on every call (one syscall). When the
+    manifest changes to a different version, the new artifact is loaded on a
+    background thread while callers keep getting the previous snapshot; the
+    swap is a single reference assignment, so a caller holding a snapshot
+    keeps scoring against one consistent model.
+    """
+
+    def __init__(self, path, fallback_path=None, fallback_pipeline=None):
+        self.path = Path(path)
+        self.fallback_path = fallback_path
+        self.fallback_pipeline = fallback_pipeline
+        self.last_error: Optional[str] = None
+        self._lock = threading.Lock()
+        self._loading = None
+
+        self._stamp = self._manifest_stamp()
+        if self._stamp is None:
+            scorer = load_scorer(fallback_path, fallback_pipeline)
+            self._snapshot = ModelSnapshot("unversioned", scorer, time.time())
+        else:
+            registry = read_registry(self.path)
+            self._snapshot = self._load(registry["active"], registry["versions"][registry["active"]])
+
+    @property
+    def version(self) -> str:
+        return self._snapshot.version
+
+    def current(self) -> ModelSnapshot:
+        """The newest fully loaded snapshot; starts a reload if the manifest changed."""
+        stamp = self._manifest_stamp()
+        if stamp is not None and stamp != self._stamp:
+            self._schedule_reload(stamp)
+        return self._snapshot
+
+    def wait_for_reload(self, timeout: float = None) -> bool:
+        """Block until an in-progress background load finishes (for scripts and tests)."""
+        thread = self._loading
+        if thread is not None:
+            thread.join(timeout)
+        return self._loading is None
+
+    def _manifest_stamp(self):
+        try:
+            info = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return info.st_mtime_ns, info.st_size
+
+    def _schedule_reload(self, stamp):
+        with self._lock:
+            if self._loading is not None or stamp == self._stamp:
+                return
+            self._stamp = stamp
+            self._loading = threading.Thread(target=self._reload, name="aura-model-reload", daemon=True)
+            self._loading.start()
+
+    def _reload(self):
+        try:
+            registry = read_registry(self.path)
+            version = registry["active"]
+            entry = registry["versions"][version]
+            current = self._snapshot
+            if version != current.version or entry.get("sha256", current.scorer.checksum) != current.scorer.checksum:
+                self._snapshot = self._load(version, entry)
+            self.last_error = None
+        except Exception as exc:  # keep serving the previous version
+            self.last_error = f"{type(exc).__name__}: {exc}"
+        finally:
+            with self._lock:
+                self._loading = None
+            # The manifest may have changed again while this load was running
+            stamp = self._manifest_stamp()
+            if stamp is not None and stamp != self._stamp:
+                self._schedule_reload(stamp)
+
+    def _load(self, version: str, entry: dict) -> ModelSnapshot:
+        base = self.path.parent
+        pipeline = base / entry["pipeline"] if entry.get("pipeline") else None
+        scorer = load_scorer(base / entry["artifact"], pipeline)
+        expected = entry.get("sha256")
+        if expected and scorer.fingerprint != expected:
+            raise ValueError(f"Model {version} does not match its registry checksum.")
+        return ModelSnapshot(version, scorer, time.time())
@@ -0,0 +1,222 @@
+"""
+AURA+ Reports
+Downloadable assessment reports (TXT, HTML, JSON) rendered from a PredictionRecord.
+
+Plain Python only (no NumPy), so reports render on demand in the app and
+in batch worker processes alike.
+"""
+
+import html
+import json
+from datetime import datetime
+from string import Template
+from typing import NamedTuple
+
+from .constants import QUESTION_MAP
+from .results import PredictionRecord
+
+DISCLAIMER = "Educational screening only; not a diagnosis or medical advice."
+SAFETY_NOTE = "If you feel unsafe or at risk of self-harm, seek immediate local emergency help."
+DEFAULT_SUGGESTION = "Maintain healthy routines and seek support when needed."
+MAX_SUGGESTIONS = 5
+
+
+class ReportFormat(NamedTuple):
+    label: str
+    extension: str
+    mime: str
+
+
+REPORT_FORMATS = {
+    "txt": ReportFormat("Text", ".txt", "text/plain"),
+    "html": ReportFormat("HTML", ".html", "text/html"),
+    "json": ReportFormat("JSON", ".json", "application/json"),
+}
+
+
+class ReportContext(NamedTuple):
+    """Everything a report template shows, already resolved to display values."""
+
+    generated: str
+    model_version: str
+    pred_label: str
+    probabilities: tuple
+    factors: tuple  # (feature name, contribution) pairs, strongest first
+    suggestions: tuple
+    subject: str = ""  # student / respondent id in cohort exports
+
+
+def format_feature_label(feat: str) -> str:
+    """Convert feature name to human-friendly label."""
+    meta = QUESTION_MAP.get(feat)
+    if meta:
+        return meta["label"]
+    return feat.replace("_", " ").title()
+
+
+def report_context(record: PredictionRecord, feature_names, generated: str = None, subject: str = "") -> ReportContext:
+    """
+    Resolve a record against the feature order of the model that produced it.
+
+    Args:
+        record: Prediction to report on
+        feature_names: Feature order of `record.model_version`
+        generated: Timestamp shown on the report (default: now, to the minute)
+        subject: Optional respondent id printed on the report
+    """
+    return ReportContext(
+        generated=generated or datetime.now().strftime("%Y-%m-%d %H:%M"),
+        model_version=record.model_version,
+        pred_label=record.pred_label,
+        probabilities=record.probabilities,
+        factors=tuple((feature_names[i], v) for i, v in zip(record.top_indices, record.top_values)),
+        suggestions=tuple(record.suggestions[:MAX_SUGGESTIONS]),
+        subject=subject,
+    )
+
+
+def _direction(value) -> str:
+    return "increases risk" if value > 0 else "reduces risk"
+
+
+def render_text(ctx: ReportContext) -> str:
+    """Plain-text report (the original download format)."""
+    probs = ctx.probabilities
+    lines = ["AURA+ — Stress Risk Screening Report", f"Generated: {ctx.generated}"]
+    if ctx.subject:
+        lines.append(f"Student: {ctx.subject}")
+    if ctx.model_version:
+        lines.append(f"Model version: {ctx.model_version}")
+    lines += [
+        "",
+        f"Disclaimer: {DISCLAIMER}",
+        "",
+        f"Predicted risk level: {ctx.pred_label}",
+        f"Model confidence (approx.): Low={probs[0]:.2f}, Moderate={probs[1]:.2f}, High={probs[2]:.2f}",
+        "",
+        "Top contributing factors:",
+    ]
+    for feat, val in ctx.factors:
+        lines.append(f"- {format_feature_label(feat)}: {_direction(val)} (score={val:.3f})")
+    lines += ["", "General suggestions:"]
+    lines += [f"- {s}" for s in ctx.suggestions or (DEFAULT_SUGGESTION,)]
+    lines += ["", SAFETY_NOTE]
+    return "\n".join(lines)
+
+
+# Standalone, printable page: inline styles only, no scripts or external assets
+HTML_PAGE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>AURA+ Stress Risk Screening Report$title_suffix</title>
+<style>
+body{font-family:system-ui,-apple-system,"Segoe UI",sans-serif;color:#0f172a;max-width:42rem;margin:2rem auto;padding:0 1rem;line-height:1.6}
+h1{font-size:1.5rem;margin-bottom:0}.meta{color:#64748b;font-size:.9rem}
+.level{font-size:1.2rem;padding:.75rem 1rem;border-left:4px solid #FF4B4B;background:#fff5f5}
+table{border-collapse:collapse;width:100%}td,th{text-align:left;padding:.35rem .5rem;border-bottom:1px solid #e2e8f0}
+.note{font-size:.85rem;color:#475569}
+</style>
+</head>
+<body>
+<h1>AURA+ — Stress Risk Screening Report</h1>
+<p class="meta">$meta</p>
+<p class="note"><strong>Disclaimer:</strong> $disclaimer</p>
+<p class="level">Predicted risk level: <strong>$pred_label</strong></p>
+<p>Model confidence (approx.): Low=$p_low, Moderate=$p_moderate, High=$p_high</p>
+<h2>Top contributing factors</h2>
+<table>
+<tr><th>Factor</th><th>Effect</th><th>Score</th></tr>
+$factor_rows
+</table>
+<h2>General suggestions</h2>
+<ol>
+$suggestion_items
+</ol>
+<p class="note">$safety_note</p>
+</body>
+</html>
+""")
+
+
+def render_html(ctx: ReportContext) -> str:
+    """Self-contained HTML report."""
+    esc = html.escape
+    meta = [f"Generated: {esc(ctx.generated)}"]
+    if ctx.subject:
+        meta.append(f"Student: {esc(ctx.subject)}")
+    if ctx.model_version:
+        meta.append(f"Model version: {esc(ctx.model_version)}")
+    probs = ctx.probabilities
+    return HTML_PAGE.substitute(
+        title_suffix=f" — {esc(ctx.subject)}" if ctx.subject else "",
+        meta=" · ".join(meta),
+        disclaimer=esc(DISCLAIMER),
+        pred_label=esc(ctx.pred_label),
+        p_low=f"{probs[0]:.2f}", p_moderate=f"{probs[1]:.2f}", p_high=f"{probs[2]:.2f}",
+        factor_rows="\n".join(
+            f"<tr><td>{esc(format_feature_label(feat))}</td><td>{_direction(val)}</td><td>{val:.3f}</td></tr>"
+            for feat, val in ctx.factors
+        ),
+        suggestion_items="\n".join(f"<li>{esc(s)}</li>" for s in ctx.suggestions or (DEFAULT_SUGGESTION,)),
+        safety_note=esc(SAFETY_NOTE),
+    )
+
+
+def render_json(ctx: ReportContext) -> str:
+    """Machine-readable report with full-precision values."""
+    doc = {
+        "generated": ctx.generated,
+        "model_version": ctx.model_version,
+        "predicted_risk_level": ctx.pred_label,
+        "probabilities": dict(zip(("low", "moderate", "high"), ctx.probabilities)),
+        "top_factors": [
+            {"feature": feat, "label": format_feature_label(feat), "contribution": val, "effect": _direction(val)}
+            for feat, val in ctx.factors
+        ],
+        "suggestions": list(ctx.suggestions),
+        "disclaimer": DISCLAIMER,
+    }
+    if ctx.subject:
+        doc = {"student": ctx.subject, **doc}
+    return json.dumps(doc, ensure_ascii=False, indent=2)
+
+
+RENDERERS = {"txt": render_text, "html": render_html, "json": render_json}
+
+
+def render_report(record: PredictionRecord, feature_names, fmt: str = "txt", generated: str = None, subject: str = "") -> str:
+    """
+    Render one report in a `REPORT_FORMATS` format.
+
+    Raises:
+        ValueError: If `fmt` is not a known format
+    """
+    renderer = RENDERERS.get(fmt)
+    if renderer is None:
+        raise ValueError(f"Unknown report format {fmt!r}; expected one of {', '.join(RENDERERS)}")
+    return renderer(report_context(record, feature_names, generated, subject))
+
+
+def make_report_text(pred_label, probs, top_contrib, suggestions, model_version=""):
+    """
+    Generate downloadable text report.
+
+    Args:
+        pred_label: Predicted stress level label
+        probs: Probability distribution
+        top_contrib: Top contributing features
+        suggestions: List of suggestions
+        model_version: Registry version that produced the prediction
+
+    Returns:
+        str: Formatted report text
+    """
+    return render_text(ReportContext(
+        generated=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        model_version=model_version,
+        pred_label=pred_label,
+        probabilities=tuple(probs),
+        factors=tuple(top_contrib.items()),
+        suggestions=tuple(suggestions),
+    ))
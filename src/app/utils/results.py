@@ -0,0 +1,51 @@
+"""
+AURA+ Result Records
+Compact, theme-independent record of a prediction, kept in session state.
+
+Plain Python only (no NumPy), so the Results page can render a record
+without loading the model stack.
+"""
+
+from dataclasses import dataclass
+
+from .constants import STRESS_LABELS, SUGGESTION_RULES
+
+# Stable small-integer ids for the suggestion texts (SUGGESTION_RULES order)
+SUGGESTION_IDS = {feat: i for i, feat in enumerate(SUGGESTION_RULES)}
+SUGGESTION_TEXTS = tuple(SUGGESTION_RULES.values())
+
+
+def suggestion_ids_for(features) -> tuple:
+    """Ids of the unique suggestions for `features` (strongest contributor first)."""
+    ids = []
+    for feat in features:
+        sid = SUGGESTION_IDS.get(feat)
+        if sid is not None and sid not in ids:
+            ids.append(sid)
+    return tuple(ids)
+
+
+@dataclass(frozen=True, slots=True)
+class PredictionRecord:
+    """
+    What a prediction needs to be shown again: no markup, no arrays.
+
+    Feature indices refer to the feature order of the model version that
+    produced the record. Instances are hashable, so rendered HTML can be
+    cached per (record, theme).
+    """
+
+    model_version: str
+    pred_class: int
+    probabilities: tuple
+    top_indices: tuple
+    top_values: tuple
+    suggestion_ids: tuple
+
+    @property
+    def pred_label(self) -> str:
+        return STRESS_LABELS[self.pred_class]
+
+    @property
+    def suggestions(self) -> list:
+        return [SUGGESTION_TEXTS[i] for i in self.suggestion_ids]
@@ -0,0 +1,79 @@
+"""
+AURA+ Feature Schema
+Feature manifest written by the data pipeline and read by the app at startup.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+
+from .constants import FEATURE_RANGES, QUESTION_MAP, TARGET_COLUMN
+
+MANIFEST_VERSION = 1
+
+
+def file_sha256(path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def build_feature_manifest(df, data_path) -> dict:
+    """
+    Describe the training features of a cleaned dataset.
+
+    Args:
+        df: Cleaned DataFrame, including the target column
+        data_path: Path the DataFrame was saved to (hashed for provenance)
+
+    Returns:
+        dict: Manifest with feature order, dtype, valid range and section
+    """
+    features = []
+    for col in df.columns:
+        if col == TARGET_COLUMN:
+            continue
+        lo, hi = FEATURE_RANGES.get(col, (int(df[col].min()), int(df[col].max())))
+        features.append({
+            "name": col,
+            "dtype": str(df[col].dtype),
+            "min": lo,
+            "max": hi,
+            "section": QUESTION_MAP.get(col, {}).get("section"),
+        })
+
+    return {
+        "version": MANIFEST_VERSION,
+        "target": TARGET_COLUMN,
+        "rows": int(len(df)),
+        "data_sha256": file_sha256(data_path),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "features": features,
+    }
+
+
+def write_feature_manifest(manifest: dict, path):
+    """Write a manifest as pretty-printed JSON."""
+    Path(path).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+
+def read_feature_manifest(path) -> dict:
+    """
+    Read and validate a feature manifest.
+
+    Raises:
+        ValueError: If the manifest version is not supported
+    """
+    manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported feature manifest version in {path}.")
+    return manifest
+
+
+def manifest_feature_names(manifest: dict) -> list:
+    """Feature names in training order."""
+    return [feat["name"] for feat in manifest["features"]]
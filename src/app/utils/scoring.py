@@ -0,0 +1,359 @@
+"""
+AURA+ Compiled Scoring
+NumPy-only scorer with the scaler folded into the logistic regression weights.
+"""
+
+import hashlib
+import json
+import struct
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+# Artifact layout: MAGIC | format version (u32) | header length (u32) | JSON header
+# | zero padding up to PAYLOAD_ALIGN | float64 payload (weights, bias, mean)
+MAGIC = b"AURAMDL\x00"
+FORMAT_VERSION = 1
+PAYLOAD_ALIGN = 64
+_PREFIX = struct.Struct("<8sII")
+
+
+class CompiledModel:
+    """
+    Folded logistic regression: logits = X @ weights + bias.
+
+    `weights` has shape (n_features, n_classes) and already includes the
+    scaler's 1/scale; `mean` is kept so per-feature contributions match the
+    scaled-space explanation of the original pipeline.
+    """
+
+    def __init__(self, weights, bias, mean, feature_names, classes, checksum=""):
+        self.weights = weights
+        self.bias = bias
+        self.mean = mean
+        self.feature_names = list(feature_names)
+        self.classes = list(classes)
+        self.checksum = checksum
+
+    @property
+    def fingerprint(self) -> str:
+        """SHA-256 of the weights; identifies the model in cache keys."""
+        if not self.checksum:
+            self.checksum = hashlib.sha256(_payload_bytes(self)).hexdigest()
+        return self.checksum
+
+    @property
+    def n_features(self) -> int:
+        return self.weights.shape[0]
+
+    @property
+    def n_classes(self) -> int:
+        return self.weights.shape[1]
+
+    def logits(self, X):
+        """Raw class scores for an (n, n_features) input."""
+        return np.asarray(X) @ self.weights + self.bias
+
+    def predict_proba(self, X):
+        """Softmax class probabilities with shape (n, n_classes)."""
+        return softmax(self.logits(X))
+
+    def contributions(self, X, pred):
+        """
+        Per-feature contributions towards each row's class in `pred`.
+
+        Args:
+            X: (n, n_features) unscaled inputs
+            pred: (n,) class indices
+
+        Returns:
+            np.ndarray: (n, n_features) contribution matrix
+        """
+        # Binary models explain with the single coefficient row, as the pipeline did
+        cols = pred if self.n_classes > 2 else np.ones_like(pred)
+        return (np.asarray(X) - self.mean) * self.weights.T[cols]
+
+    def score(self, X):
+        """
+        Score a batch in one pass.
+
+        Args:
+            X: (n, n_features) unscaled inputs in `feature_names` order; compact
+                uint8 answers are accepted as-is and only up-cast by the matmul
+
+        Returns:
+            tuple: (predicted_class, probabilities, contributions)
+        """
+        X = np.atleast_2d(X)
+        logits = self.logits(X)
+        pred = np.argmax(logits, axis=1)
+        return pred, softmax(logits), self.contributions(X, pred)
+
+
+class BatchExplanation(NamedTuple):
+    """Compact top-k explanation for a batch of rows."""
+
+    pred_class: np.ndarray  # (n,) predicted class indices
+    indices: np.ndarray  # (n, k) feature indices, by |contribution| descending
+    values: np.ndarray  # (n, k) matching contributions
+
+
+def top_k_contributions(contributions, k: int):
+    """
+    Largest-magnitude contributions per row.
+
+    Uses argpartition to select the k candidates in O(n_features) per row and
+    only sorts those k.
+
+    Args:
+        contributions: (n, n_features) contribution matrix
+        k: Number of features to keep per row
+
+    Returns:
+        tuple: (indices, values), both (n, k) and ordered by |value| descending
+    """
+    n_features = contributions.shape[1]
+    k = min(k, n_features)
+    magnitude = np.abs(contributions)
+    if k < n_features:
+        idx = np.argpartition(-magnitude, k - 1, axis=1)[:, :k]
+    else:
+        idx = np.broadcast_to(np.arange(n_features), magnitude.shape)
+    order = np.argsort(-np.take_along_axis(magnitude, idx, axis=1), axis=1, kind="stable")
+    idx = np.take_along_axis(idx, order, axis=1)
+    return idx, np.take_along_axis(contributions, idx, axis=1)
+
+
+def explain_batch(compiled: CompiledModel, X, top_k: int = 6) -> BatchExplanation:
+    """
+    Explain every row of an (n, n_features) matrix in one pass.
+
+    Args:
+        compiled: Scorer to explain
+        X: Unscaled inputs in `compiled.feature_names` order
+        top_k: Number of contributors to keep per row
+
+    Returns:
+        BatchExplanation: Predicted classes with top-k index/value arrays
+    """
+    X = np.atleast_2d(X)
+    pred = np.argmax(compiled.logits(X), axis=1)
+    idx, values = top_k_contributions(compiled.contributions(X, pred), top_k)
+    return BatchExplanation(pred, idx, values)
+
+
+def softmax(logits):
+    """Row-wise softmax of an (n, n_classes) logit matrix."""
+    exp = np.exp(logits - np.max(logits, axis=1, keepdims=True))
+    return exp / np.sum(exp, axis=1, keepdims=True)
+
+
+def compile_pipeline(pipeline, feature_names=None) -> CompiledModel:
+    """
+    Fold a fitted scaler + logistic regression pipeline into a CompiledModel.
+
+    Args:
+        pipeline: sklearn Pipeline with an optional 'scaler' and a 'model' step
+        feature_names: Feature order; defaults to the pipeline's feature_names_in_
+
+    Returns:
+        CompiledModel: Equivalent NumPy-only scorer
+    """
+    scaler = pipeline.named_steps.get("scaler")
+    model = pipeline.named_steps["model"]
+
+    if feature_names is None:
+        feature_names = list(getattr(pipeline, "feature_names_in_", []))
+
+    coef = np.atleast_2d(np.asarray(model.coef_, dtype=np.float64))
+    intercept = np.atleast_1d(np.asarray(model.intercept_, dtype=np.float64))
+    n_features = coef.shape[1]
+
+    mean = getattr(scaler, "mean_", None)
+    scale = getattr(scaler, "scale_", None)
+    mean = np.zeros(n_features) if mean is None else np.asarray(mean, dtype=np.float64)
+    scale = np.ones(n_features) if scale is None else np.asarray(scale, dtype=np.float64)
+
+    weights = (coef / scale).T
+    bias = intercept - mean @ weights
+
+    # Binary models expose one logit; prepend a zero class so softmax == sigmoid
+    if weights.shape[1] == 1:
+        weights = np.hstack([np.zeros_like(weights), weights])
+        bias = np.concatenate([[0.0], bias])
+
+    classes = [int(c) for c in getattr(model, "classes_", range(weights.shape[1]))]
+    return CompiledModel(
+        np.ascontiguousarray(weights), bias, mean, feature_names, classes
+    )
+
+
+def export_compiled_model(compiled: CompiledModel, path, source: str = "") -> str:
+    """
+    Write a compiled model as a checksummed, memory-mappable artifact.
+
+    Args:
+        compiled: Model to export
+        path: Output file path
+        source: Optional description of the originating artifact
+
+    Returns:
+        str: SHA-256 checksum of the payload
+    """
+    payload = _payload_bytes(compiled)
+    checksum = hashlib.sha256(payload).hexdigest()
+
+    header = json.dumps({
+        "features": compiled.feature_names,
+        "classes": compiled.classes,
+        "n_features": compiled.n_features,
+        "n_classes": compiled.n_classes,
+        "dtype": "<f8",
+        "sha256": checksum,
+        "source": source,
+        "created": datetime.now().isoformat(timespec="seconds"),
+    }).encode("utf-8")
+
+    offset = _payload_offset(len(header))
+    padding = b"\x00" * (offset - _PREFIX.size - len(header))
+
+    with open(path, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header)))
+        f.write(header)
+        f.write(padding)
+        f.write(payload)
+
+    compiled.checksum = checksum
+    return checksum
+
+
+def open_compiled_model(path, verify: bool = True) -> CompiledModel:
+    """
+    Memory-map a compiled model artifact.
+
+    Args:
+        path: Artifact path written by `export_compiled_model`
+        verify: Check the payload against the stored SHA-256
+
+    Returns:
+        CompiledModel: Scorer backed by read-only views of the file
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        magic, version, header_len = _PREFIX.unpack(f.read(_PREFIX.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a compiled AURA+ model.")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported compiled model version {version} in {path}.")
+        header = json.loads(f.read(header_len).decode("utf-8"))
+
+    n_features, n_classes = header["n_features"], header["n_classes"]
+    # Plain ndarray view: keeps the mapping zero-copy without memmap subclass overhead
+    payload = np.asarray(np.memmap(
+        path,
+        dtype=header["dtype"],
+        mode="r",
+        offset=_payload_offset(header_len),
+        shape=(n_features * n_classes + n_classes + n_features,),
+    ))
+
+    if verify and hashlib.sha256(payload.tobytes()).hexdigest() != header["sha256"]:
+        raise ValueError(f"Checksum mismatch for compiled model {path}.")
+
+    split = n_features * n_classes
+    return CompiledModel(
+        weights=payload[:split].reshape(n_features, n_classes),
+        bias=payload[split:split + n_classes],
+        mean=payload[split + n_classes:],
+        feature_names=header["features"],
+        classes=header["classes"],
+        checksum=header["sha256"],
+    )
+
+
+def load_scorer(compiled_path, pipeline_path=None) -> CompiledModel:
+    """
+    Open the compiled artifact, or fold the joblib pipeline if it is missing.
+
+    Args:
+        compiled_path: Path of the exported artifact
+        pipeline_path: Fallback sklearn pipeline (.joblib)
+
+    Returns:
+        CompiledModel: Ready-to-use scorer
+    """
+    if Path(compiled_path).exists():
+        return open_compiled_model(compiled_path)
+    if pipeline_path is None or not Path(pipeline_path).exists():
+        raise FileNotFoundError(f"No compiled model at {compiled_path} and no pipeline to compile.")
+    import joblib
+
+    return compile_pipeline(joblib.load(pipeline_path))
+
+
+def share_compiled_model(compiled: CompiledModel):
+    """
+    Copy a model's weights into a shared-memory segment for worker processes.
+
+    Args:
+        compiled: Model to share
+
+    Returns:
+        tuple: (SharedMemory, spec) - the caller owns the segment and must
+        close/unlink it; `spec` is a small picklable dict for `attach_compiled_model`
+    """
+    from multiprocessing import shared_memory
+
+    payload = _payload_bytes(compiled)
+    shm = shared_memory.SharedMemory(create=True, size=len(payload))
+    shm.buf[:len(payload)] = payload
+    spec = {
+        "name": shm.name,
+        "features": compiled.feature_names,
+        "classes": compiled.classes,
+        "n_features": compiled.n_features,
+        "n_classes": compiled.n_classes,
+        "checksum": compiled.fingerprint,
+    }
+    return shm, spec
+
+
+def attach_compiled_model(spec: dict):
+    """
+    Build a CompiledModel on views of a segment created by `share_compiled_model`.
+
+    Returns:
+        tuple: (SharedMemory, CompiledModel) - keep the segment referenced
+        for as long as the model is used
+    """
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=spec["name"])
+
+    n_features, n_classes = spec["n_features"], spec["n_classes"]
+    split = n_features * n_classes
+    payload = np.ndarray((split + n_classes + n_features,), dtype="<f8", buffer=shm.buf)
+    compiled = CompiledModel(
+        weights=payload[:split].reshape(n_features, n_classes),
+        bias=payload[split:split + n_classes],
+        mean=payload[split + n_classes:],
+        feature_names=spec["features"],
+        classes=spec["classes"],
+        checksum=spec["checksum"],
+    )
+    return shm, compiled
+
+
+def _payload_bytes(compiled: CompiledModel) -> bytes:
+    return np.concatenate([
+        np.asarray(compiled.weights, dtype="<f8").ravel(),
+        np.asarray(compiled.bias, dtype="<f8"),
+        np.asarray(compiled.mean, dtype="<f8"),
+    ]).tobytes()
+
+
+def _payload_offset(header_len: int) -> int:
+    end = _PREFIX.size + header_len
+    return -(-end // PAYLOAD_ALIGN) * PAYLOAD_ALIGN
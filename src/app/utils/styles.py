@@ -3,37 +3,104 @@ AURA+ Style Utilities
 Functions for loading CSS and generating styled components.
 """
 
-import streamlit as st
+import hashlib
+import re
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
+
+import streamlit as st
 from .constants import BADGE_STYLES, STRESS_LABELS
+from .metrics import register_cache
 
+CSS_DIR = Path(__file__).parent.parent / "static" / "css"
+THEMES = ("dark", "light")
 
-def load_css(theme: str = "dark"):
+# Streamlit >= 1.33 sends style-only st.html to the event container, outside the page layout
+_INJECT_HTML = hasattr(st, "html")
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+_CSS_DECLARATION_COLON = re.compile(r"(?<=[\w-]):\s+")
+
+
+class CssBundle(NamedTuple):
+    """Minified stylesheet of one theme, ready to inject."""
+    theme: str
+    digest: str
+    html: str
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace (strings and parentheses are left intact)."""
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_WHITESPACE.sub(" ", css)
+    css = _CSS_PUNCTUATION.sub(r"\1", css)
+    css = _CSS_DECLARATION_COLON.sub(":", css)
+    return css.replace(";}", "}").strip()
+
+
+def build_css_bundle(theme: str) -> CssBundle:
     """
-    Load all CSS files from the static directory.
-    
-    Args:
-        theme: Current theme ('dark' or 'light')
+    Concatenate and minify the stylesheets of one theme.
+
+    Files are read in cascade order: base, theme, components, animations.
+    The digest is a content hash of the minified CSS, so it only changes
+    when a stylesheet does.
     """
-    css_dir = Path(__file__).parent.parent / "static" / "css"
-    
-    # Load CSS files in order: base, theme, components, animations
     css_files = ["base.css", f"{theme}.css", "components.css", "animations.css"]
-    
-    css_content = ""
+
+    sources = []
     for css_file in css_files:
-        css_path = css_dir / css_file
+        css_path = CSS_DIR / css_file
         if css_path.exists():
-            with open(css_path, "r", encoding="utf-8") as f:
-                css_content += f.read() + "\n"
-    
-    # Inject CSS
-    if css_content:
-        st.markdown(f"""
-            <style>
-            {css_content}
-            </style>
-        """, unsafe_allow_html=True)
+            sources.append(css_path.read_text(encoding="utf-8"))
+
+    css = minify_css("\n".join(sources))
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+    html = f'<style data-bundle="{theme}-{digest}">{css}</style>' if css else ""
+    return CssBundle(theme, digest, html)
+
+
+@lru_cache(maxsize=1)
+def css_bundles() -> dict:
+    """Bundles of every theme, built once per process and shared by all sessions."""
+    return {theme: build_css_bundle(theme) for theme in THEMES}
+
+
+register_cache("css_bundles", lambda: css_bundles.cache_info()._asdict())
+
+
+def get_css_bundle(theme: str) -> CssBundle:
+    """Prebuilt bundle of `theme` (unknown themes are built on demand, uncached)."""
+    bundles = css_bundles()
+    return bundles[theme] if theme in bundles else build_css_bundle(theme)
+
+
+def load_css(theme: str = "dark"):
+    """
+    Inject the prebuilt CSS bundle of the current theme.
+
+    Streamlit drops elements a rerun does not emit again, so the bundle is
+    emitted on every rerun. Its bytes are identical for a given theme, which
+    lets Streamlit's message cache replace it with a hash reference once the
+    browser holds it: the full stylesheet crosses the WebSocket once per
+    session and theme. The digest of the last injected bundle is kept in
+    session state as ``css_bundle``.
+
+    Args:
+        theme: Current theme ('dark' or 'light')
+    """
+    bundle = get_css_bundle(theme)
+    if not bundle.html:
+        return
+
+    if _INJECT_HTML:
+        st.html(bundle.html)
+    else:
+        st.markdown(bundle.html, unsafe_allow_html=True)
+    st.session_state["css_bundle"] = bundle.digest
 
 
 def risk_badge_html(level_int: int, theme: str = "dark") -> str:
@@ -0,0 +1,178 @@
+"""
+AURA+ Pipeline Tracing
+Stage spans for the offline data scripts, as JSON lines plus a per-run summary.
+
+Each span records wall time, process CPU time, rows processed, the process
+peak RSS when the span ends and, with AURA_TRACE_MALLOC=1, the tracemalloc
+peak of Python-tracked allocations above the level at span start (off by
+default: it distorts the timings of allocation-heavy stages). Spans nest; a
+parent's peak covers its children. Records from every run are appended to
+one file per script, so runs over growing survey exports can be compared
+stage by stage.
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+try:
+    import resource
+except ImportError:  # Windows: no peak RSS
+    resource = None
+
+from .constants import TRACE_DIR, TRACE_MALLOC
+
+ROOT_SPAN = "run"
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, KiB elsewhere
+    return peak / 1e6 if sys.platform == "darwin" else peak * 1024 / 1e6
+
+
+class Span:
+    """One traced stage. Set `rows` inside the block once the row count is known."""
+
+    def __init__(self, seq: int, name: str, parent, depth: int, rows=None, attrs=None):
+        self.seq = seq
+        self.name = name
+        self.parent = parent
+        self.depth = depth
+        self.rows = rows
+        self.attrs = attrs or {}
+        self.started = datetime.now()
+        self.wall_s = 0.0
+        self.cpu_s = 0.0
+        self.rss_peak_mb = None
+        self.py_peak_mb = None
+        self.error = None
+        self._malloc_base = 0
+        self._malloc_peak = 0
+
+    def record(self, run_id: str, script: str) -> dict:
+        out = {
+            "run": run_id,
+            "script": script,
+            "span": self.name,
+            "parent": self.parent,
+            "depth": self.depth,
+            "start": self.started.isoformat(timespec="milliseconds"),
+            "wall_s": round(self.wall_s, 6),
+            "cpu_s": round(self.cpu_s, 6),
+            "rows": self.rows,
+            "rss_peak_mb": None if self.rss_peak_mb is None else round(self.rss_peak_mb, 2),
+            "py_peak_mb": None if self.py_peak_mb is None else round(self.py_peak_mb, 2),
+        }
+        if self.attrs:
+            out["attrs"] = self.attrs
+        if self.error:
+            out["error"] = self.error
+        return out
+
+
+class Tracer:
+    """
+    Traces one run of an offline script.
+
+    Use as a context manager around the whole run (recorded as the `run`
+    span), with `span(name, rows=..., **attrs)` around each stage. Finished
+    spans are appended to `path` (default `reports/traces/<script>.jsonl`) as
+    they close, so a failing run still leaves its completed stages and the
+    failed one, with `error` set. The summary table is printed on exit.
+    """
+
+    def __init__(self, script: str, path=None, trace_malloc: bool = TRACE_MALLOC):
+        self.script = script
+        self.path = Path(path) if path else TRACE_DIR / f"{script}.jsonl"
+        self.trace_malloc = trace_malloc
+        self.run_id = f"{datetime.now():%Y%m%dT%H%M%S}-{uuid4().hex[:6]}"
+        self.spans = []
+        self._stack = []
+        self._seq = 0
+        self._out = None
+        self._root = None
+        self._owns_malloc = False
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._out = open(self.path, "a", encoding="utf-8")
+        if self.trace_malloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_malloc = True
+        self._root = self.span(ROOT_SPAN)
+        self._root.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self._root.__exit__(exc_type, exc, tb)
+        finally:
+            self._out.close()
+            if self._owns_malloc:
+                tracemalloc.stop()
+            print(f"\n--- Trace {self.run_id} ({self.path}) ---")
+            print(self.summary_table())
+        return False
+
+    @contextmanager
+    def span(self, name: str, rows=None, **attrs):
+        parent = self._stack[-1] if self._stack else None
+        span = Span(self._seq, name, parent.name if parent else None, len(self._stack), rows, attrs)
+        self._seq += 1
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            if parent is not None:  # keep the parent's peak so far before resetting it
+                parent._malloc_peak = max(parent._malloc_peak, peak)
+            tracemalloc.reset_peak()
+            span._malloc_base = span._malloc_peak = current
+        self._stack.append(span)
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            span.wall_s = time.perf_counter() - start
+            span.cpu_s = time.process_time() - cpu_start
+            if tracing and tracemalloc.is_tracing():
+                span._malloc_peak = max(span._malloc_peak, tracemalloc.get_traced_memory()[1])
+                span.py_peak_mb = (span._malloc_peak - span._malloc_base) / 1e6
+                if parent is not None:
+                    parent._malloc_peak = max(parent._malloc_peak, span._malloc_peak)
+            span.rss_peak_mb = peak_rss_mb()
+            self._stack.pop()
+            self.spans.append(span)
+            self._write(span)
+
+    def _write(self, span: Span):
+        if self._out is not None:
+            self._out.write(json.dumps(span.record(self.run_id, self.script)) + "\n")
+            self._out.flush()
+
+    def summary_table(self) -> str:
+        """Fixed-width table of this run's spans in start order, children indented."""
+        def num(value, fmt):
+            return "-" if value is None else format(value, fmt)
+
+        lines = [f"{'stage':<28}{'wall s':>9}{'cpu s':>9}{'rows':>12}{'rows/s':>13}{'peak RSS MB':>13}"
+                 f"{'py peak MB':>12}"]
+        for span in sorted(self.spans, key=lambda s: s.seq):
+            rate = span.rows / span.wall_s if span.rows is not None and span.wall_s > 0 else None
+            name = "  " * span.depth + span.name + (" ❌" if span.error else "")
+            lines.append(
+                f"{name:<28}{span.wall_s:>9.3f}{span.cpu_s:>9.3f}{num(span.rows, ','):>12}{num(rate, ',.0f'):>13}"
+                f"{num(span.rss_peak_mb, '.1f'):>13}{num(span.py_peak_mb, '.1f'):>12}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,153 @@
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+APP_RELPATH = Path("src") / "app" / "app.py"
+
+PAGES = ["assessment", "about", "results"]
+HEAVY_MODULES = ["numpy", "pandas", "pyarrow", "joblib", "sklearn", "scipy"]
+MARKER = "--- aura startup: render ---"
+IMPORT_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Cold-start and first-render cost per page, traced with -X importtime."
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh processes per page (median is reported)")
+    parser.add_argument("--compare", metavar="REV", help="Also measure a git revision (e.g. HEAD~1) and print deltas")
+    parser.add_argument("--top", type=int, default=8, help="Slowest imports listed per page")
+    parser.add_argument("--json", type=Path, help="Also write the raw measurements to this file")
+    parser.add_argument("--child", nargs=2, metavar=("APP", "PAGE"), help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def run_child(app_path, page):
+    """Render one page in this (fresh) process; the harness is imported before the marker."""
+    from streamlit.testing.v1 import AppTest
+
+    before = set(sys.modules)
+    print(MARKER, file=sys.stderr, flush=True)
+    start = time.perf_counter()
+    at = AppTest.from_file(app_path, default_timeout=120)
+    at.session_state["current_page"] = page
+    at.run()
+    render_s = time.perf_counter() - start
+
+    loaded = {name.split(".")[0] for name in set(sys.modules) - before}
+    print(json.dumps({
+        "render_s": render_s,
+        "errors": [str(e.value) for e in at.exception],
+        "heavy": [m for m in HEAVY_MODULES if m in loaded],
+    }))
+
+
+def measure_page(app_path, page):
+    """One fresh interpreter: wall time, render time and the imports the page triggered."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", __file__, "--child", str(app_path), page],
+        capture_output=True, text=True, cwd=app_path.parent,
+    )
+    process_s = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{page} page failed:\n{proc.stderr[-2000:]}")
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    stderr = proc.stderr
+    after_marker = stderr[stderr.index(MARKER):] if MARKER in stderr else ""
+    self_us, top_level = 0, {}
+    for match in IMPORT_LINE.finditer(after_marker):
+        self_us += int(match.group(1))
+        if len(match.group(3)) <= 1:  # top-level import: cumulative includes its children
+            name = match.group(4)
+            top_level[name] = top_level.get(name, 0) + int(match.group(2))
+
+    result.update(process_s=process_s, imports_s=self_us / 1e6, top_imports=top_level)
+    return result
+
+
+def measure_tree(root: Path, repeat: int) -> dict:
+    app_path = root / APP_RELPATH
+    report = {}
+    for page in PAGES:
+        runs = [measure_page(app_path, page) for _ in range(repeat)]
+        report[page] = {
+            "render_ms": statistics.median(r["render_s"] for r in runs) * 1000,
+            "imports_ms": statistics.median(r["imports_s"] for r in runs) * 1000,
+            "process_ms": statistics.median(r["process_s"] for r in runs) * 1000,
+            "heavy": runs[-1]["heavy"],
+            "errors": runs[-1]["errors"],
+            "top_imports": runs[-1]["top_imports"],
+        }
+    return report
+
+
+def export_revision(rev: str, dest: Path):
+    """Extract a committed tree (code, models and processed data) without touching the checkout."""
+    archive = subprocess.run(["git", "archive", rev], cwd=ROOT_DIR, capture_output=True, check=True).stdout
+    with tempfile.TemporaryFile() as buf:
+        buf.write(archive)
+        buf.seek(0)
+        with tarfile.open(fileobj=buf) as tar:
+            tar.extractall(dest)
+
+
+def print_report(title: str, report: dict, top: int):
+    print(f"\n--- {title} ---")
+    print(f"{'page':<12}{'first render':>14}{'app imports':>14}{'process':>12}  heavy modules loaded")
+    for page, r in report.items():
+        heavy = ", ".join(r["heavy"]) or "-"
+        print(f"{page:<12}{r['render_ms']:>12.0f}ms{r['imports_ms']:>12.0f}ms{r['process_ms']:>10.0f}ms  {heavy}")
+        for err in r["errors"]:
+            print(f"{'':<12}⚠️ {err}")
+    for page, r in report.items():
+        slowest = sorted(r["top_imports"].items(), key=lambda kv: kv[1], reverse=True)[:top]
+        print(f"\nSlowest imports on first render ({page}):")
+        for name, us in slowest:
+            print(f"  {us / 1000:>8.1f}ms  {name}")
+
+
+def print_comparison(before: dict, after: dict, rev: str):
+    print(f"\n--- {rev} -> working tree ---")
+    print(f"{'page':<12}{'first render':>24}{'app imports':>24}")
+    for page in PAGES:
+        b, a = before[page], after[page]
+        print(
+            f"{page:<12}{b['render_ms']:>8.0f} -> {a['render_ms']:>5.0f}ms ({a['render_ms'] - b['render_ms']:+.0f})"
+            f"{b['imports_ms']:>8.0f} -> {a['imports_ms']:>5.0f}ms ({a['imports_ms'] - b['imports_ms']:+.0f})"
+        )
+
+
+def main():
+    args = parse_args()
+    if args.child:
+        run_child(*args.child)
+        return
+
+    results = {"python": sys.version.split()[0], "repeat": args.repeat}
+    results["working_tree"] = measure_tree(ROOT_DIR, args.repeat)
+    print_report("Working tree", results["working_tree"], args.top)
+
+    if args.compare:
+        with tempfile.TemporaryDirectory() as tmp:
+            export_revision(args.compare, Path(tmp))
+            results[args.compare] = measure_tree(Path(tmp), args.repeat)
+        print_report(args.compare, results[args.compare], args.top)
+        print_comparison(results[args.compare], results["working_tree"], args.compare)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print("\n✅ Measurements saved to:", args.json)
+
+
+if __name__ == "__main__":
+    main()
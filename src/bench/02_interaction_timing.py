@@ -0,0 +1,259 @@
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+APP_RELPATH = Path("src") / "app" / "app.py"
+
+SLIDER_KEY = "inp_anxiety_level"
+LIVE_PREVIEW_LABEL = "⚡ Live Preview"
+
+RUN_MARKER = "--- aura rerun ms:"
+
+# `streamlit run` with the script body of every rerun (full or fragment) timed inside the server
+BOOTSTRAP = f"""
+import sys, time
+from streamlit.runtime.scriptrunner import script_runner
+from streamlit.web import cli
+
+_exec = script_runner.exec_func_with_error_handling
+
+def timed_exec(func, ctx):
+    start = time.perf_counter()
+    try:
+        return _exec(func, ctx)
+    finally:
+        print("{RUN_MARKER}", (time.perf_counter() - start) * 1000, file=sys.stderr, flush=True)
+
+script_runner.exec_func_with_error_handling = timed_exec
+sys.argv = ["streamlit", "run", *sys.argv[1:]]
+sys.exit(cli.main())
+"""
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Server script time per questionnaire interaction, driven over the Streamlit websocket like a browser."
+    )
+    parser.add_argument("--interactions", type=int, default=30, help="Slider moves per scenario (median is reported)")
+    parser.add_argument("--compare", metavar="REV", help="Also measure a git revision (e.g. HEAD~1) and print deltas")
+    parser.add_argument("--json", type=Path, help="Also write the raw measurements to this file")
+    return parser.parse_args()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(app_path: Path, port: int, log) -> subprocess.Popen:
+    """Headless, instrumented `streamlit run` of one tree; returns once the health endpoint answers."""
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-c", BOOTSTRAP, str(app_path),
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--server.enableXsrfProtection", "false",
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=app_path.parent, stdout=subprocess.DEVNULL, stderr=log,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError(f"Streamlit server for {app_path} did not start")
+
+
+class Session:
+    """Minimal browser stand-in: tracks widget states and the client-side message cache."""
+
+    def __init__(self, ws, log):
+        self.ws = ws
+        self.log = log
+        self.widgets = {}  # id -> (kind, value, fragment_id, label)
+        self.cached_hashes = set()
+
+    async def rerun(self, fragment_id: str = "") -> dict:
+        """Send one rerun request; time it until the server reports the script finished."""
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.fragment_id = fragment_id
+        state.cached_message_hashes.extend(sorted(self.cached_hashes))
+        for widget_id, (kind, value, _, _) in self.widgets.items():
+            widget = state.widget_states.widgets.add()
+            widget.id = widget_id
+            if kind == "slider":
+                widget.double_array_value.data.extend(value)
+            else:
+                widget.bool_value = value
+
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        received, elements = 0, 0
+        while True:
+            raw = await self.ws.recv()
+            received += len(raw)
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            kind = fwd.WhichOneof("type")
+            if fwd.metadata.cacheable:
+                self.cached_hashes.add(fwd.hash)
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                elements += 1
+                self._track(fwd)
+            elif kind == "ref_hash":
+                elements += 1
+            elif kind == "script_finished":
+                break
+        round_trip_ms = (time.perf_counter() - start) * 1000
+        return {"script_ms": self._script_ms(), "ms": round_trip_ms, "bytes": received, "elements": elements}
+
+    def _script_ms(self) -> float:
+        """Script time the server logged for the run that just finished."""
+        self.log.seek(0)
+        runs = [line for line in self.log.read().splitlines() if line.startswith(RUN_MARKER)]
+        return float(runs[-1][len(RUN_MARKER):])
+
+    def _track(self, fwd):
+        element = fwd.delta.new_element
+        kind = element.WhichOneof("type")
+        if kind == "slider":
+            proto = element.slider
+            previous = self.widgets.get(proto.id)
+            value = previous[1] if previous else list(proto.default)
+        elif kind == "checkbox":
+            proto = element.checkbox
+            previous = self.widgets.get(proto.id)
+            value = previous[1] if previous else proto.default
+        else:
+            return
+        self.widgets[proto.id] = (kind, value, fwd.delta.fragment_id, proto.label)
+
+    def find(self, kind: str, predicate) -> str:
+        for widget_id, (k, _, _, label) in self.widgets.items():
+            if k == kind and predicate(widget_id, label):
+                return widget_id
+        raise LookupError(f"No {kind} widget matched")
+
+    def set(self, widget_id: str, value):
+        kind, _, fragment_id, label = self.widgets[widget_id]
+        self.widgets[widget_id] = (kind, value, fragment_id, label)
+        return fragment_id
+
+
+async def run_scenario(port: int, log, interactions: int, live_preview: bool) -> dict:
+    async with websockets.connect(
+        f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"], max_size=None
+    ) as ws:
+        session = Session(ws, log)
+        first = await session.rerun()
+        if live_preview:
+            toggle = session.find("checkbox", lambda _, label: label == LIVE_PREVIEW_LABEL)
+            session.set(toggle, True)
+            await session.rerun()
+
+        slider = session.find("slider", lambda widget_id, _: widget_id.endswith(SLIDER_KEY))
+        runs = []
+        for i in range(interactions):
+            fragment_id = session.set(slider, [float(6 + i % 2)])
+            runs.append(await session.rerun(fragment_id))
+
+    return {
+        "first_ms": first["script_ms"],
+        "first_kb": first["bytes"] / 1000,
+        "script_ms": statistics.median(r["script_ms"] for r in runs),
+        "p90_ms": statistics.quantiles([r["script_ms"] for r in runs], n=10)[-1],
+        "round_trip_ms": statistics.median(r["ms"] for r in runs),
+        "kb": statistics.median(r["bytes"] for r in runs) / 1000,
+        "elements": statistics.median(r["elements"] for r in runs),
+        "fragment": bool(session.widgets[slider][2]),
+    }
+
+
+def measure_tree(root: Path, interactions: int) -> dict:
+    port = free_port()
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as log:
+        proc = start_server(root / APP_RELPATH, port, log)
+        try:
+            return {
+                "slider": asyncio.run(run_scenario(port, log, interactions, live_preview=False)),
+                "slider + live preview": asyncio.run(run_scenario(port, log, interactions, live_preview=True)),
+            }
+        finally:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+
+def export_revision(rev: str, dest: Path):
+    """Extract a committed tree (code, models and processed data) without touching the checkout."""
+    archive = subprocess.run(["git", "archive", rev], cwd=ROOT_DIR, capture_output=True, check=True).stdout
+    with tempfile.TemporaryFile() as buf:
+        buf.write(archive)
+        buf.seek(0)
+        with tarfile.open(fileobj=buf) as tar:
+            tar.extractall(dest)
+
+
+def print_report(title: str, report: dict):
+    print(f"\n--- {title} ---")
+    print(f"{'scenario':<24}{'script time':>13}{'p90':>10}{'round trip':>12}{'sent':>11}{'elements':>10}  rerun scope")
+    for name, r in report.items():
+        scope = "fragment" if r["fragment"] else "full script"
+        print(
+            f"{name:<24}{r['script_ms']:>11.2f}ms{r['p90_ms']:>8.2f}ms{r['round_trip_ms']:>10.1f}ms"
+            f"{r['kb']:>9.1f}KB{r['elements']:>10.0f}  {scope}"
+        )
+    first = next(iter(report.values()))
+    print(f"(first page load: {first['first_ms']:.0f}ms script time, {first['first_kb']:.1f}KB sent)")
+
+
+def print_comparison(before: dict, after: dict, rev: str):
+    print(f"\n--- {rev} -> working tree ---")
+    print(f"{'scenario':<24}{'script time':>28}{'sent':>26}")
+    for name in after:
+        b, a = before[name], after[name]
+        print(
+            f"{name:<24}{b['script_ms']:>8.2f} -> {a['script_ms']:>5.2f}ms ({b['script_ms'] / a['script_ms']:.1f}x less)"
+            f"{b['kb']:>8.1f} -> {a['kb']:>5.1f}KB ({b['kb'] / a['kb']:.1f}x less)"
+        )
+
+
+def main():
+    args = parse_args()
+    results = {"python": sys.version.split()[0], "interactions": args.interactions}
+    results["working_tree"] = measure_tree(ROOT_DIR, args.interactions)
+    print_report("Working tree", results["working_tree"])
+
+    if args.compare:
+        with tempfile.TemporaryDirectory() as tmp:
+            export_revision(args.compare, Path(tmp))
+            results[args.compare] = measure_tree(Path(tmp), args.interactions)
+        print_report(args.compare, results[args.compare])
+        print_comparison(results[args.compare], results["working_tree"], args.compare)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print("\n✅ Measurements saved to:", args.json)
+
+
+if __name__ == "__main__":
+    main()
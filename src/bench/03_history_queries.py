@@ -0,0 +1,100 @@
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from utils.history import HistoryStore, record_to_row  # noqa: E402
+from utils.results import PredictionRecord  # noqa: E402
+
+DAY = 86_400
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Write throughput and trend-query latency of the assessment history store."
+    )
+    parser.add_argument("--rows", type=int, default=2_000_000, help="Assessments to generate")
+    parser.add_argument("--users", type=int, default=50_000, help="Distinct user tokens")
+    parser.add_argument("--heavy-rows", type=int, default=20_000, help="Extra rows for one very active user")
+    parser.add_argument("--days", type=int, default=365, help="Spread of generated timestamps")
+    parser.add_argument("--queries", type=int, default=200, help="Timed queries per kind (median is reported)")
+    parser.add_argument("--db", type=Path, help="Database path (default: a temporary file)")
+    return parser.parse_args()
+
+
+def synthetic_rows(n: int, users: list, now: int, days: int, rng: random.Random):
+    for _ in range(n):
+        p = [rng.random() for _ in range(3)]
+        total = sum(p)
+        probs = tuple(x / total for x in p)
+        record = PredictionRecord(
+            "v1", max(range(3), key=probs.__getitem__), probs,
+            tuple(rng.sample(range(20), 6)), tuple(rng.uniform(-1, 1) for _ in range(6)),
+            tuple(rng.sample(range(12), 3)),
+        )
+        yield record_to_row(rng.choice(users), record, now - rng.randrange(days * DAY))
+
+
+def timed(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(0)
+    now = int(time.time())
+    users = [f"user{i:07d}" for i in range(args.users)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = args.db or Path(tmp) / "history.db"
+        store = HistoryStore(db).start()
+
+        start = time.perf_counter()
+        store.record_rows(synthetic_rows(args.rows, users, now, args.days, rng))
+        store.record_rows(synthetic_rows(args.heavy_rows, ["heavy"], now, args.days, rng))
+        store.flush()
+        elapsed = time.perf_counter() - start
+        total = args.rows + args.heavy_rows
+        print(f"Wrote {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s, "
+              f"{store.batches_written:,} transactions, {db.stat().st_size / 1e6:.0f} MB)")
+
+        sample = rng.sample(users, min(args.queries, len(users)))
+        it = iter(sample * 2)
+        print(f"\n{'query':<34}{'typical user':>14}{'heavy user':>14}")
+        for name, fn in [
+            ("daily_trend (90 days)", lambda u: store.daily_trend(u, days=90, now=now)),
+            ("daily_trend (365 days)", lambda u: store.daily_trend(u, days=365, now=now)),
+            ("recent (20)", lambda u: store.recent(u, limit=20)),
+            ("count", store.count),
+        ]:
+            typical = timed(lambda: fn(next(it, sample[0])), args.queries)
+            heavy = timed(lambda: fn("heavy"), args.queries)
+            print(f"{name:<34}{typical:>12.3f}ms{heavy:>12.3f}ms")
+            it = iter(sample * 2)
+
+        print("\nQuery plans:")
+        conn = sqlite3.connect(db)
+        for sql in [
+            "SELECT (created_at + 0) / 86400 AS day, COUNT(*), AVG(p_high) FROM assessments "
+            "WHERE user_token = 'heavy' AND created_at >= 0 GROUP BY day ORDER BY day",
+            "SELECT * FROM assessments WHERE user_token = 'heavy' ORDER BY created_at DESC LIMIT 20",
+        ]:
+            for row in conn.execute("EXPLAIN QUERY PLAN " + sql):
+                print("  ", row[-1])
+        conn.close()
+        store.stop()
+
+
+if __name__ == "__main__":
+    main()
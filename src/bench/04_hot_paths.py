@@ -0,0 +1,313 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+APP_DIR = ROOT_DIR / "src" / "app"
+sys.path.insert(0, str(APP_DIR))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from utils.constants import FEATURE_RANGES  # noqa: E402
+
+SIZES = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+PACKAGES = ["numpy", "pandas", "sklearn", "joblib", "streamlit"]
+THEME = "dark"
+
+
+class Case(NamedTuple):
+    name: str
+    rows: int
+    fn: Callable
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.rows}]"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Time the inference, report and rendering hot paths; store JSON and flag regressions."
+    )
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)),
+                        help="Comma-separated batch sizes for the batch cases")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed samples per case (median is reported)")
+    parser.add_argument("--runs", type=int, default=50, help="Script runs per component case")
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this text")
+    parser.add_argument("--json", type=Path, help="Write results and machine metadata to this file")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE",
+                        help="Compare against an earlier --json file; exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative slowdown of the median that counts as a regression (default 10%%)")
+    args = parser.parse_args()
+    args.sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    return args
+
+
+def machine_metadata() -> dict:
+    """Enough about the machine, interpreter and tree to tell whether two runs are comparable."""
+    packages = {}
+    for name in PACKAGES:
+        try:
+            packages[name] = __import__(name).__version__
+        except ImportError:
+            packages[name] = None
+
+    def git(*cmd):
+        proc = subprocess.run(["git", *cmd], cwd=ROOT_DIR, capture_output=True, text=True)
+        return proc.stdout.strip() if proc.returncode == 0 else None
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or None,
+        "cpu_count": os.cpu_count(),
+        "packages": packages,
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+    }
+
+
+def synthetic_answers(n: int, feature_names, seed: int = 0) -> np.ndarray:
+    """(n, n_features) uint8 answers drawn uniformly from each question's valid range."""
+    rng = np.random.default_rng(seed)
+    lows = np.array([FEATURE_RANGES[f][0] for f in feature_names])
+    highs = np.array([FEATURE_RANGES[f][1] for f in feature_names])
+    return rng.integers(lows, highs + 1, size=(n, len(feature_names))).astype(np.uint8)
+
+
+def inference_cases(sizes) -> list:
+    """Model loading, scoring, explanation and report cases, timed in-process."""
+    from utils.model import (
+        SCORE_CACHE, explain_with_coefficients, explain_with_coefficients_batch, get_feature_names,
+        load_compiled_model, load_feature_manifest, load_model, make_report_text, predict_proba_safe, score,
+    )
+    from utils.reports import REPORT_FORMATS, render_report
+
+    def load_model_cold():
+        load_model.clear()
+        return load_model()
+
+    def feature_names_cold():
+        load_feature_manifest.clear()
+        return get_feature_names()
+
+    pipeline = load_model()
+    scorer = load_compiled_model()
+    feature_names = get_feature_names()
+    one = pd.DataFrame(synthetic_answers(1, feature_names), columns=feature_names)
+    answers = dict(zip(feature_names, (int(v) for v in one.iloc[0])))
+    result = score(scorer, answers)
+    record = result.to_record()
+
+    def score_uncached():
+        SCORE_CACHE.clear()
+        return score(scorer, answers)
+
+    cases = [
+        Case("load_model (cold)", 1, load_model_cold),
+        Case("load_model (cached)", 1, load_model),
+        Case("get_feature_names (cold)", 1, feature_names_cold),
+        Case("get_feature_names (cached)", 1, get_feature_names),
+        Case("explain_with_coefficients", 1, lambda: explain_with_coefficients(pipeline, one, feature_names)),
+        Case("score (cache miss)", 1, score_uncached),
+        Case("score (cache hit)", 1, lambda: score(scorer, answers)),
+        Case("make_report_text", 1, lambda: make_report_text(
+            result.pred_label, result.probabilities, result.top_contributions, result.suggestions[:5], "v1"
+        )),
+    ]
+    cases += [
+        Case(f"render_report ({fmt})", 1, lambda fmt=fmt: render_report(record, feature_names, fmt))
+        for fmt in REPORT_FORMATS
+    ]
+
+    for n in sizes:
+        X = synthetic_answers(n, feature_names, seed=n)
+        df = pd.DataFrame(X, columns=feature_names)
+        cases += [
+            Case("predict_proba_safe", n, lambda df=df: predict_proba_safe(pipeline, df)),
+            Case("explain_with_coefficients_batch", n, lambda X=X: explain_with_coefficients_batch(pipeline, X)),
+            Case("CompiledModel.score", n, lambda X=X: scorer.score(X)),
+        ]
+    return cases
+
+
+def measure(fn, repeat: int) -> dict:
+    """timeit-style: calibrate loops to >= 0.2 s, then take `repeat` samples (seconds per call)."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    samples = [t / number for t in timer.repeat(repeat, number)]
+    return {"number": number, "samples": samples}
+
+
+# Each component is rendered in a real script run (widgets, fragments and
+# deltas included); only the call itself is inside the timed region.
+COMPONENT_SCRIPT = """
+import sys, time
+sys.path.insert(0, {app_dir!r})
+import streamlit as st
+from utils.results import PredictionRecord
+{imports}
+st.session_state.setdefault("theme", {theme!r})
+st.session_state.setdefault("current_page", "assessment")
+st.session_state.setdefault("last_prediction", {record!r})
+{setup}
+start = time.perf_counter()
+{call}
+st.session_state.setdefault("bench_s", []).append(time.perf_counter() - start)
+"""
+
+COLD = "from components.templates import clear_fragment_cache; clear_fragment_cache()"
+
+COMPONENT_CASES = [
+    # name, imports, per-run setup, timed call
+    ("load_css", "from utils.styles import load_css, css_bundles", "", "load_css(THEME)"),
+    ("load_css (cold)", "from utils.styles import load_css, css_bundles", "css_bundles.cache_clear()", "load_css(THEME)"),
+    ("render_navbar", "from components.navbar import render_navbar", "", "render_navbar(THEME)"),
+    ("render_sidebar", "from components.sidebar import render_sidebar", "", "render_sidebar(THEME)"),
+    ("render_header", "from components.cards import render_header", "", 'render_header("AURA+", "A premium educational screening tool", THEME)'),
+    ("render_info_card", "from components.cards import render_info_card", "", 'render_info_card("Title", "Body text", "ℹ️", THEME)'),
+    ("render_result_card", "from components.cards import render_result_card, result_content_html", "",
+     "render_result_card(result_content_html(st.session_state['last_prediction'], THEME), THEME)"),
+    ("render_result_card (cold)", "from components.cards import render_result_card, result_content_html", COLD,
+     "render_result_card(result_content_html(st.session_state['last_prediction'], THEME), THEME)"),
+    ("render_all_questions", "from components.forms import render_all_questions\nfrom utils.model import get_feature_names",
+     "names = get_feature_names()", "render_all_questions(names, THEME)"),
+    ("render_about_page", "from components.pages import render_about_page", "", "render_about_page(THEME)"),
+    ("render_results_page", "from components.pages import render_results_page", "", "render_results_page(THEME)"),
+    ("render_history_page", "from components.pages import render_history_page", "", "render_history_page(THEME)"),
+    ("render_about_page (cold)", "from components.pages import render_about_page", COLD, "render_about_page(THEME)"),
+]
+
+
+def measure_component(imports: str, setup: str, call: str, record, runs: int) -> dict:
+    """Time one component over `runs` script runs of a single AppTest session (first run is warm-up)."""
+    from streamlit.testing.v1 import AppTest
+
+    script = COMPONENT_SCRIPT.format(
+        app_dir=str(APP_DIR), imports=imports + f"\nTHEME = {THEME!r}", theme=THEME,
+        record=record, setup=setup, call=call,
+    )
+    at = AppTest.from_string(script, default_timeout=120)
+    for _ in range(runs + 1):
+        at.run()
+        if at.exception:
+            raise RuntimeError(f"{call} failed: {at.exception[0].value}")
+    return {"number": 1, "samples": at.session_state["bench_s"][1:]}
+
+
+def summarize(case_name: str, rows: int, measured: dict) -> dict:
+    samples = measured["samples"]
+    median = statistics.median(samples)
+    return {
+        "name": case_name,
+        "rows": rows,
+        "number": measured["number"],
+        "repeat": len(samples),
+        "median_s": median,
+        "min_s": min(samples),
+        "stdev_s": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "rows_per_s": rows / median if median else None,
+    }
+
+
+def fmt_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def print_result(key: str, r: dict):
+    rate = f"{r['rows_per_s']:>14,.0f} rows/s" if r["rows"] > 1 else ""
+    spread = r["stdev_s"] / r["median_s"] if r["median_s"] else 0.0
+    print(f"{key:<44}{fmt_time(r['median_s']):>10}{fmt_time(r['min_s']):>10}{spread:>8.0%}{rate}")
+
+
+def run_benchmarks(args) -> dict:
+    results = {}
+    print(f"{'case [rows]':<44}{'median':>10}{'best':>10}{'±':>8}")
+
+    for case in inference_cases(args.sizes):
+        if args.filter in case.name:
+            results[case.key] = summarize(case.name, case.rows, measure(case.fn, args.repeat))
+            print_result(case.key, results[case.key])
+
+    from utils.model import get_feature_names, load_compiled_model, score
+
+    feature_names = get_feature_names()
+    answers = dict(zip(feature_names, (int(v) for v in synthetic_answers(1, feature_names)[0])))
+    record = score(load_compiled_model(), answers).to_record()
+    for name, imports, setup, call in COMPONENT_CASES:
+        if args.filter in name:
+            key = f"{name}[1]"
+            results[key] = summarize(name, 1, measure_component(imports, setup, call, record, args.runs))
+            print_result(key, results[key])
+    return results
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """Print per-case median changes; returns the keys that slowed down by more than `threshold`."""
+    before, after = baseline["meta"], current["meta"]
+    for field in ("platform", "processor", "cpu_count", "python"):
+        if before.get(field) != after.get(field):
+            print(f"⚠️ Baseline {field} differs: {before.get(field)} -> {after.get(field)}")
+
+    regressions = []
+    print(f"\n--- baseline {(before.get('commit') or '?')[:10]} -> current (threshold {threshold:.0%}) ---")
+    print(f"{'case [rows]':<44}{'baseline':>10}{'current':>10}{'change':>9}")
+    for key, a in current["results"].items():
+        b = baseline["results"].get(key)
+        if b is None:
+            continue
+        change = a["median_s"] / b["median_s"] - 1
+        flag = ""
+        if change > threshold:
+            flag = "  ❌ regression"
+            regressions.append(key)
+        elif change < -threshold:
+            flag = "  ✅ faster"
+        print(f"{key:<44}{fmt_time(b['median_s']):>10}{fmt_time(a['median_s']):>10}{change:>+9.1%}{flag}")
+    return regressions
+
+
+def main():
+    args = parse_args()
+    # Bare-mode calls (no `streamlit run`) warn on every cache and session-state access
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").disabled = True
+    # The batch explanation passes arrays to a scaler fitted on a DataFrame, as the app does
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+    current = {"meta": machine_metadata(), "sizes": args.sizes, "repeat": args.repeat, "runs": args.runs}
+    start = time.perf_counter()
+    current["results"] = run_benchmarks(args)
+    print(f"\n{len(current['results'])} cases in {time.perf_counter() - start:.0f}s")
+
+    if args.json:
+        args.json.write_text(json.dumps(current, indent=2), encoding="utf-8")
+        print("✅ Results saved to:", args.json)
+
+    if args.compare:
+        regressions = compare(json.loads(args.compare.read_text(encoding="utf-8")), current, args.threshold)
+        if regressions:
+            raise SystemExit(f"❌ {len(regressions)} case(s) slower than baseline by more than {args.threshold:.0%}")
+        print("✅ No regressions beyond the threshold")
+
+
+if __name__ == "__main__":
+    main()
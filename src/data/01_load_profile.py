@@ -1,36 +1,51 @@
-import pandas as pd
-
-PATH = "data/raw/stress_raw.csv"
-
-def main():
-    df = pd.read_csv(PATH)
+import sys
+from pathlib import Path
 
-    print("\n✅ Loaded:", PATH)
-    print("Shape (rows, cols):", df.shape)
-
-    print("\n--- Columns ---")
-    print(df.columns.tolist())
-
-    print("\n--- First 5 rows ---")
-    print(df.head())
+import pandas as pd
 
-    print("\n--- Data types ---")
-    print(df.dtypes)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
 
-    print("\n--- Missing values (top 15) ---")
-    missing = df.isna().sum().sort_values(ascending=False)
-    print(missing.head(15))
+from utils.tracing import Tracer  # noqa: E402
 
-    # Target distribution
-    if "stress_level" in df.columns:
-        print("\n--- Target distribution: stress_level ---")
-        print(df["stress_level"].value_counts(dropna=False).sort_index())
-    else:
-        print("\n⚠️ Target column 'stress_level' not found. Check column names.")
+PATH = "data/raw/stress_raw.csv"
 
-    # Quick stats (for numeric columns)
-    print("\n--- Numeric summary (quick) ---")
-    print(df.describe().T.head(15))
+def main():
+    with Tracer(Path(__file__).stem) as trace:
+        with trace.span("read_csv", path=PATH) as span:
+            df = pd.read_csv(PATH)
+            span.rows = len(df)
+
+        print("\n✅ Loaded:", PATH)
+        print("Shape (rows, cols):", df.shape)
+
+        print("\n--- Columns ---")
+        print(df.columns.tolist())
+
+        print("\n--- First 5 rows ---")
+        print(df.head())
+
+        print("\n--- Data types ---")
+        print(df.dtypes)
+
+        print("\n--- Missing values (top 15) ---")
+        with trace.span("missing_values", rows=len(df)):
+            missing = df.isna().sum().sort_values(ascending=False)
+        print(missing.head(15))
+
+        # Target distribution
+        if "stress_level" in df.columns:
+            print("\n--- Target distribution: stress_level ---")
+            with trace.span("target_distribution", rows=len(df)):
+                counts = df["stress_level"].value_counts(dropna=False).sort_index()
+            print(counts)
+        else:
+            print("\n⚠️ Target column 'stress_level' not found. Check column names.")
+
+        # Quick stats (for numeric columns)
+        print("\n--- Numeric summary (quick) ---")
+        with trace.span("describe", rows=len(df)):
+            summary = df.describe().T
+        print(summary.head(15))
 
 if __name__ == "__main__":
     main()
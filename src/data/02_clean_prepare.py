@@ -1,42 +1,58 @@
+import sys
+from pathlib import Path
+
 import pandas as pd
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from utils.columnar import write_columnar  # noqa: E402
+from utils.constants import FEATURE_MANIFEST_PATH, FEATURE_RANGES  # noqa: E402
+from utils.dataset import from_frame  # noqa: E402
+from utils.schema import build_feature_manifest, write_feature_manifest  # noqa: E402
+from utils.tracing import Tracer  # noqa: E402
+
 RAW_PATH = "data/raw/stress_raw.csv"
 OUT_PATH = "data/processed/stress_clean.csv"
+COLUMNAR_OUT_PATH = "data/processed/stress_clean.col"
 
 def main():
-    df = pd.read_csv(RAW_PATH)
-
-    # 1. Column rename (minor polish)
-    rename_map = {
-        "teacher_student_relationship": "teacher_relationship",
-        "future_career_concerns": "career_concerns",
-        "extracurricular_activities": "extracurriculars"
-    }
-    df = df.rename(columns=rename_map)
-
-    # 2. Basic validation (clip out-of-range values)
-    df["anxiety_level"] = df["anxiety_level"].clip(0, 21)
-    df["self_esteem"] = df["self_esteem"].clip(0, 30)
-    df["depression"] = df["depression"].clip(0, 27)
-
-    likert_cols = [
-        "sleep_quality", "breathing_problem", "noise_level",
-        "living_conditions", "safety", "basic_needs",
-        "academic_performance", "study_load",
-        "teacher_relationship", "career_concerns",
-        "social_support", "peer_pressure",
-        "extracurriculars", "bullying", "headache", "blood_pressure"
-    ]
-
-    for col in likert_cols:
-        if col in df.columns:
-            df[col] = df[col].clip(1, 5)
-
-    # 3. Save cleaned data
-    df.to_csv(OUT_PATH, index=False)
-
-    print("✅ Cleaned dataset saved to:", OUT_PATH)
-    print("Final shape:", df.shape)
+    with Tracer(Path(__file__).stem) as trace:
+        with trace.span("read_csv", path=RAW_PATH) as span:
+            df = pd.read_csv(RAW_PATH)
+            span.rows = len(df)
+
+        # 1. Column rename (minor polish)
+        rename_map = {
+            "teacher_student_relationship": "teacher_relationship",
+            "future_career_concerns": "career_concerns",
+            "extracurricular_activities": "extracurriculars"
+        }
+        with trace.span("rename", rows=len(df)):
+            df = df.rename(columns=rename_map)
+
+        # 2. Basic validation (clip out-of-range values)
+        with trace.span("clip_ranges", rows=len(df)):
+            for col, (lo, hi) in FEATURE_RANGES.items():
+                if col in df.columns:
+                    df[col] = df[col].clip(lo, hi)
+
+        # 3. Save cleaned data
+        with trace.span("write_csv", rows=len(df), path=OUT_PATH):
+            df.to_csv(OUT_PATH, index=False)
+
+        print("✅ Cleaned dataset saved to:", OUT_PATH)
+        print("Final shape:", df.shape)
+
+        # Memory-mappable columnar copy (uint8 answers) for EDA, training and batch scoring
+        features = [c for c in df.columns if c in FEATURE_RANGES]
+        with trace.span("write_columnar", rows=len(df), path=COLUMNAR_OUT_PATH):
+            write_columnar(from_frame(df, features).to_frame(), COLUMNAR_OUT_PATH)
+        print("✅ Columnar copy saved to:", COLUMNAR_OUT_PATH)
+
+        # 4. Feature manifest next to the model (lets the app skip reading the dataset)
+        with trace.span("feature_manifest", rows=len(df)):
+            write_feature_manifest(build_feature_manifest(df, OUT_PATH), FEATURE_MANIFEST_PATH)
+        print("✅ Feature manifest saved to:", FEATURE_MANIFEST_PATH)
 
 if __name__ == "__main__":
     main()
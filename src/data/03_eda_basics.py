@@ -1,10 +1,16 @@
 # src/data/03_eda_basics.py
 
-import pandas as pd
+import sys
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from utils.dataset import load_questionnaire  # noqa: E402
+from utils.tracing import Tracer  # noqa: E402
+
 DATA_PATH = "data/processed/stress_clean.csv"
+COLUMNAR_PATH = "data/processed/stress_clean.col"
 
 def ensure_dirs():
     """
@@ -27,50 +33,58 @@ def ensure_dirs():
 def main():
     reports_dir, figures_dir = ensure_dirs()
 
-    df = pd.read_csv(DATA_PATH)
-
-    # 1) Target distribution plot
-    ax = df["stress_level"].value_counts().sort_index().plot(kind="bar")
-    ax.set_title("Stress Level Distribution (0=Low, 1=Moderate, 2=High)")
-    ax.set_xlabel("stress_level")
-    ax.set_ylabel("count")
-    plt.tight_layout()
-    plt.savefig(figures_dir / "target_distribution.png")
-    plt.close()
-
-    # 2) Correlation with target (quick ranking)
-    corr = df.corr(numeric_only=True)["stress_level"].sort_values(ascending=False)
-    corr.to_csv(reports_dir / "stress_level_correlations.csv")
-
-    top_pos = corr.head(10)
-    top_neg = corr.tail(10)
-
-    print("\n✅ Saved:", figures_dir / "target_distribution.png")
-    print("✅ Saved:", reports_dir / "stress_level_correlations.csv")
-
-    print("\n--- Top positively correlated with stress_level ---")
-    print(top_pos)
-
-    print("\n--- Top negatively correlated with stress_level ---")
-    print(top_neg)
-
-    # 3) Compare means by stress_level for a few key features
-    key_features = [
-        "anxiety_level",
-        "depression",
-        "self_esteem",
-        "sleep_quality",
-        "social_support",
-        "peer_pressure",
-    ]
-    existing = [c for c in key_features if c in df.columns]
-
-    group_means = df.groupby("stress_level")[existing].mean()
-    group_means.to_csv(reports_dir / "group_means_by_stress_level.csv")
-
-    print("\n✅ Saved:", reports_dir / "group_means_by_stress_level.csv")
-    print("\n--- Group means (by stress_level) ---")
-    print(group_means)
+    with Tracer(Path(__file__).stem) as trace:
+        # uint8 answers, validated against the cleaning ranges; prefer the columnar copy
+        source = COLUMNAR_PATH if Path(COLUMNAR_PATH).exists() else DATA_PATH
+        with trace.span("load", path=source) as span:
+            df = load_questionnaire(source).to_frame()
+            span.rows = len(df)
+
+        # 1) Target distribution plot
+        with trace.span("plot_target_distribution", rows=len(df)):
+            ax = df["stress_level"].value_counts().sort_index().plot(kind="bar")
+            ax.set_title("Stress Level Distribution (0=Low, 1=Moderate, 2=High)")
+            ax.set_xlabel("stress_level")
+            ax.set_ylabel("count")
+            plt.tight_layout()
+            plt.savefig(figures_dir / "target_distribution.png")
+            plt.close()
+
+        # 2) Correlation with target (quick ranking)
+        with trace.span("correlation", rows=len(df)):
+            corr = df.corr(numeric_only=True)["stress_level"].sort_values(ascending=False)
+            corr.to_csv(reports_dir / "stress_level_correlations.csv")
+
+        top_pos = corr.head(10)
+        top_neg = corr.tail(10)
+
+        print("\n✅ Saved:", figures_dir / "target_distribution.png")
+        print("✅ Saved:", reports_dir / "stress_level_correlations.csv")
+
+        print("\n--- Top positively correlated with stress_level ---")
+        print(top_pos)
+
+        print("\n--- Top negatively correlated with stress_level ---")
+        print(top_neg)
+
+        # 3) Compare means by stress_level for a few key features
+        key_features = [
+            "anxiety_level",
+            "depression",
+            "self_esteem",
+            "sleep_quality",
+            "social_support",
+            "peer_pressure",
+        ]
+        existing = [c for c in key_features if c in df.columns]
+
+        with trace.span("group_means", rows=len(df)):
+            group_means = df.groupby("stress_level")[existing].mean()
+            group_means.to_csv(reports_dir / "group_means_by_stress_level.csv")
+
+        print("\n✅ Saved:", reports_dir / "group_means_by_stress_level.csv")
+        print("\n--- Group means (by stress_level) ---")
+        print(group_means)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,209 @@
+import argparse
+import os
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import StratifiedKFold
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT_DIR / "src" / "app"))
+
+from utils.constants import COLUMNAR_DATA_PATH, DATA_PATH, MODEL_PATH  # noqa: E402
+from utils.dataset import load_questionnaire  # noqa: E402
+
+REPORTS_DIR = ROOT_DIR / "reports"
+COEFFICIENTS_FILE = "logreg_coefficients_by_class.csv"
+LEADERBOARD_FILE = "logreg_search_leaderboard.csv"
+
+SEED = 42
+FOLDS = 5
+MAX_ITER = 1000
+C_GRID = "0.01,0.03,0.1,0.3,1,3,10"
+PENALTIES = ("l2", "l1")
+CLASS_WEIGHTS = ("none", "balanced")
+METRICS = {
+    "f1_macro": lambda y, p: f1_score(y, p, average="macro"),
+    "accuracy": accuracy_score,
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Train the scaler + logistic regression pipeline with a parallel cross-validated search."
+    )
+    default_data = COLUMNAR_DATA_PATH if COLUMNAR_DATA_PATH.exists() else DATA_PATH
+    parser.add_argument("--data", type=Path, default=default_data, help="Processed CSV or columnar (.col) dataset")
+    parser.add_argument("--output", type=Path, default=MODEL_PATH, help="Winning pipeline (.joblib)")
+    parser.add_argument("--reports-dir", type=Path, default=REPORTS_DIR,
+                        help=f"Where {COEFFICIENTS_FILE} and {LEADERBOARD_FILE} are written")
+    parser.add_argument("--C", default=C_GRID, help="Comma-separated inverse regularisation strengths")
+    parser.add_argument("--penalties", default=",".join(PENALTIES), help="Comma-separated penalties (l1, l2)")
+    parser.add_argument("--class-weights", default=",".join(CLASS_WEIGHTS),
+                        help="Comma-separated class weightings (none, balanced)")
+    parser.add_argument("--folds", type=int, default=FOLDS, help="Stratified cross-validation folds")
+    parser.add_argument("--metric", choices=list(METRICS), default="f1_macro", help="Selection metric")
+    parser.add_argument("--seed", type=int, default=SEED, help="Seed for the fold split and the solvers")
+    parser.add_argument("--workers", type=int, default=0, help="Search processes (0 = all cores)")
+    args = parser.parse_args()
+
+    try:
+        args.C = [float(c) for c in args.C.split(",") if c.strip()]
+    except ValueError:
+        parser.error(f"--C must be comma-separated numbers, got {args.C!r}")
+    args.penalties = [p.strip() for p in args.penalties.split(",") if p.strip()]
+    args.class_weights = [w.strip() for w in args.class_weights.split(",") if w.strip()]
+    if not args.C or any(c <= 0 for c in args.C):
+        parser.error("--C values must be positive")
+    if not args.penalties or set(args.penalties) - {"l1", "l2"}:
+        parser.error(f"unknown penalty in {','.join(args.penalties) or '(none)'}")
+    if not args.class_weights or set(args.class_weights) - {"none", "balanced"}:
+        parser.error(f"unknown class weighting in {','.join(args.class_weights) or '(none)'}")
+    return args
+
+
+def penalty_params(penalty: str) -> dict:
+    """LogisticRegression arguments for `penalty` (scikit-learn >= 1.8 expresses it as `l1_ratio`)."""
+    solver = "lbfgs" if penalty == "l2" else "saga"
+    if LogisticRegression().get_params().get("penalty") == "deprecated":
+        return {"l1_ratio": 0.0 if penalty == "l2" else 1.0, "solver": solver}
+    return {"penalty": penalty, "solver": solver}
+
+
+def make_pipeline(C: float, penalty: str, class_weight: str, seed: int) -> Pipeline:
+    """The app's pipeline: standardised answers into a multinomial logistic regression."""
+    model = LogisticRegression(
+        C=C,
+        class_weight=None if class_weight == "none" else class_weight,
+        max_iter=MAX_ITER,
+        random_state=seed,
+        **penalty_params(penalty),
+    )
+    return Pipeline([("scaler", StandardScaler()), ("model", model)])
+
+
+_WORKER = {}
+
+
+def _init_worker(X, y, folds, seed):
+    # One BLAS thread per process: the pool already uses every core
+    from threadpoolctl import threadpool_limits
+
+    _WORKER["limits"] = threadpool_limits(1)
+    _WORKER["X"], _WORKER["y"], _WORKER["folds"], _WORKER["seed"] = X, y, folds, seed
+
+
+def _fit_fold(task):
+    """Fit one (candidate, fold) pair; returns its scores, fit time and solver iterations."""
+    candidate, fold = task
+    X, y, seed = _WORKER["X"], _WORKER["y"], _WORKER["seed"]
+    train, test = _WORKER["folds"][fold]
+    pipeline = make_pipeline(*candidate, seed)
+
+    start = time.perf_counter()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ConvergenceWarning)  # reported through n_iter instead
+        pipeline.fit(X[train], y[train])
+    fit_s = time.perf_counter() - start
+
+    pred = pipeline.predict(X[test])
+    scores = {name: float(metric(y[test], pred)) for name, metric in METRICS.items()}
+    return candidate, fold, scores, fit_s, int(np.max(pipeline[-1].n_iter_))
+
+
+def run_search(X, y, candidates, folds, seed, workers) -> pd.DataFrame:
+    """Every candidate on every fold; one row per candidate, in candidate order whatever the completion order."""
+    tasks = [(candidate, fold) for candidate in candidates for fold in range(len(folds))]
+    if workers > 1:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(X, y, folds, seed)) as pool:
+            results = list(pool.map(_fit_fold, tasks, chunksize=1))
+    else:
+        _init_worker(X, y, folds, seed)
+        results = [_fit_fold(task) for task in tasks]
+
+    by_candidate = {candidate: [] for candidate in candidates}
+    for candidate, fold, scores, fit_s, n_iter in results:
+        by_candidate[candidate].append((scores, fit_s, n_iter))
+
+    rows = []
+    for (C, penalty, class_weight), fits in by_candidate.items():
+        row = {"C": C, "penalty": penalty, "class_weight": class_weight}
+        for name in METRICS:
+            values = [scores[name] for scores, _, _ in fits]
+            row[f"mean_{name}"] = float(np.mean(values))
+            row[f"std_{name}"] = float(np.std(values))
+        row["mean_fit_s"] = float(np.mean([fit_s for _, fit_s, _ in fits]))
+        row["total_fit_s"] = float(np.sum([fit_s for _, fit_s, _ in fits]))
+        row["max_iter_used"] = max(n_iter for _, _, n_iter in fits)
+        row["converged"] = row["max_iter_used"] < MAX_ITER
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def rank(leaderboard: pd.DataFrame, metric: str) -> pd.DataFrame:
+    """Best mean score first; ties keep grid order, so the result does not depend on the worker count."""
+    ranked = leaderboard.sort_values(f"mean_{metric}", ascending=False, kind="stable").reset_index(drop=True)
+    ranked.insert(0, "rank", np.arange(1, len(ranked) + 1))
+    return ranked
+
+
+def main():
+    args = parse_args()
+    workers = args.workers or os.cpu_count()
+
+    data = load_questionnaire(args.data)
+    if data.y is None:
+        raise ValueError(f"{args.data} has no stress_level target column")
+    X, y = data.X, data.y
+    folds = list(StratifiedKFold(args.folds, shuffle=True, random_state=args.seed).split(X, y))
+    candidates = list(product(args.C, args.penalties, args.class_weights))
+    print(f"Searching {len(candidates)} candidates x {args.folds} folds on {len(y):,} rows "
+          f"({args.data.name}) with {workers} workers")
+
+    start = time.perf_counter()
+    leaderboard = rank(run_search(X, y, candidates, folds, args.seed, workers), args.metric)
+    search_s = time.perf_counter() - start
+
+    # Refit the winner on every row; a DataFrame keeps feature_names_in_ on the pipeline
+    best = leaderboard.iloc[0]
+    pipeline = make_pipeline(float(best["C"]), best["penalty"], best["class_weight"], args.seed)
+    start = time.perf_counter()
+    pipeline.fit(pd.DataFrame(X, columns=data.feature_names), y)
+    refit_s = time.perf_counter() - start
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(pipeline, args.output)
+
+    args.reports_dir.mkdir(parents=True, exist_ok=True)
+    model = pipeline[-1]
+    coefficients = pd.DataFrame(model.coef_, index=[f"class_{c}" for c in model.classes_], columns=data.feature_names)
+    coefficients.to_csv(args.reports_dir / COEFFICIENTS_FILE)
+    leaderboard.to_csv(args.reports_dir / LEADERBOARD_FILE, index=False, float_format="%.6f")
+
+    print(leaderboard.head(10).to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+    print(f"\nSearch: {search_s:.2f}s wall | {leaderboard['total_fit_s'].sum():.2f}s of fits "
+          f"({leaderboard['total_fit_s'].sum() / max(search_s, 1e-9):.1f}x parallel) | refit: {refit_s:.2f}s")
+    print(f"Best: C={best['C']:g}, penalty={best['penalty']}, class_weight={best['class_weight']} | "
+          f"{args.metric} = {best[f'mean_{args.metric}']:.4f} ± {best[f'std_{args.metric}']:.4f}")
+    print("✅ Model saved to:", args.output)
+    print("✅ Coefficients saved to:", args.reports_dir / COEFFICIENTS_FILE)
+    print("✅ Leaderboard saved to:", args.reports_dir / LEADERBOARD_FILE)
+    print("Next: python src/models/02_export_compiled_model.py (or 05_publish_model.py for a new version)")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except ValueError as exc:
+        raise SystemExit(f"❌ {exc}")
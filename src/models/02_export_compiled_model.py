@@ -0,0 +1,37 @@
+import sys
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT_DIR / "src" / "app"))
+
+from utils.constants import MODEL_PATH, COMPILED_MODEL_PATH, DATA_PATH  # noqa: E402
+from utils.scoring import compile_pipeline, export_compiled_model, open_compiled_model  # noqa: E402
+
+
+def main():
+    pipeline = joblib.load(MODEL_PATH)
+    feature_names = list(getattr(pipeline, "feature_names_in_", []))
+    if not feature_names:
+        feature_names = [c for c in pd.read_csv(DATA_PATH, nrows=0).columns if c != "stress_level"]
+
+    compiled = compile_pipeline(pipeline, feature_names)
+    checksum = export_compiled_model(compiled, COMPILED_MODEL_PATH, source=MODEL_PATH.name)
+
+    # Round-trip check against the sklearn pipeline on the processed dataset
+    reloaded = open_compiled_model(COMPILED_MODEL_PATH)
+    X = pd.read_csv(DATA_PATH)[feature_names]
+    pred, proba, _ = reloaded.score(X.to_numpy())
+    max_diff = np.abs(proba - pipeline.predict_proba(X)).max()
+    agree = (pred == pipeline.predict(X)).mean()
+
+    print("✅ Compiled model saved to:", COMPILED_MODEL_PATH)
+    print("SHA-256:", checksum)
+    print(f"Class agreement with pipeline: {agree:.2%} | max |Δp| = {max_diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT_DIR / "src" / "app"))
+
+from utils.constants import MODEL_PATH, COMPILED_MODEL_PATH, STRESS_LABELS  # noqa: E402
+from utils.dataset import iter_questionnaire, partition_questionnaire  # noqa: E402
+from utils.scoring import (  # noqa: E402
+    attach_compiled_model, load_scorer, share_compiled_model, top_k_contributions
+)
+
+CHUNK_SIZE = 100_000
+TOP_K = 6
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Score a questionnaire CSV in fixed-size chunks.")
+    parser.add_argument("input", help="CSV or columnar (.col) file with the stress_clean.csv feature columns")
+    parser.add_argument("output", help="Destination CSV for predictions")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Rows per chunk")
+    parser.add_argument("--top-k", type=int, default=TOP_K, help="Contributions to keep per row")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes (0 = all cores); each scores one byte-range partition")
+    return parser.parse_args()
+
+
+def score_chunk(scorer, data, top_k):
+    """Score one QuestionnaireData chunk and return the output frame (pass-through columns first)."""
+    # uint8 answers go straight into the scorer; they are only up-cast inside the matmul
+    pred, proba, contrib = scorer.score(data.X)
+    top_idx, top_val = top_k_contributions(contrib, top_k)
+
+    out = data.passthrough.reset_index(drop=True)
+    out["pred_class"] = pred
+    out["pred_label"] = pd.Categorical.from_codes(pred, [STRESS_LABELS[c] for c in scorer.classes])
+    for j, c in enumerate(scorer.classes):
+        out[f"prob_{STRESS_LABELS[c].lower()}"] = proba[:, j]
+
+    names = pd.Index(scorer.feature_names)
+    for i in range(top_idx.shape[1]):
+        out[f"top{i + 1}_feature"] = names[top_idx[:, i]]
+        out[f"top{i + 1}_contribution"] = top_val[:, i]
+    return out
+
+
+def score_stream(scorer, chunks, out, top_k, header=True):
+    """Score every QuestionnaireData chunk into the open file `out`; returns the row count."""
+    rows = 0
+    for data in chunks:
+        score_chunk(scorer, data, top_k).to_csv(
+            out, header=header and rows == 0, index=False, float_format="%.6f"
+        )
+        rows += len(data.X)
+    return rows
+
+
+_WORKER = {}
+
+
+def _init_worker(spec):
+    # Weights come from the parent's shared-memory segment, not a fresh unpickle
+    _WORKER["shm"], _WORKER["scorer"] = attach_compiled_model(spec)
+
+
+def _score_partition(task):
+    path, start, end, part_path, chunk_size, top_k, header = task
+    scorer = _WORKER["scorer"]
+    chunks = iter_questionnaire(path, chunk_size, scorer.feature_names, start, end)
+    with open(part_path, "w", newline="", encoding="utf-8") as out:
+        return score_stream(scorer, chunks, out, top_k, header)
+
+
+def score_parallel(scorer, args, workers):
+    """Score input partitions in a process pool and concatenate them in input order."""
+    ranges = partition_questionnaire(args.input, workers)
+    shm, spec = share_compiled_model(scorer)
+    try:
+        with tempfile.TemporaryDirectory(dir=Path(args.output).parent) as tmp:
+            tasks = [
+                (args.input, a, b, Path(tmp) / f"part-{i:05d}.csv", args.chunk_size, args.top_k, i == 0)
+                for i, (a, b) in enumerate(ranges)
+            ]
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(spec,)) as pool:
+                rows = sum(pool.map(_score_partition, tasks))
+            with open(args.output, "wb") as out:
+                for task in tasks:
+                    with open(task[3], "rb") as part:
+                        shutil.copyfileobj(part, out)
+    finally:
+        shm.close()
+        shm.unlink()
+    return rows
+
+
+def main():
+    args = parse_args()
+    scorer = load_scorer(COMPILED_MODEL_PATH, MODEL_PATH)
+    workers = args.workers or os.cpu_count()
+
+    start = time.perf_counter()
+    if workers > 1:
+        rows = score_parallel(scorer, args, workers)
+    else:
+        chunks = iter_questionnaire(args.input, args.chunk_size, scorer.feature_names)
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            rows = score_stream(scorer, chunks, f, args.top_k)
+
+    elapsed = time.perf_counter() - start
+    print("✅ Scored predictions saved to:", args.output)
+    print(f"Rows: {rows:,} | workers: {workers} | {elapsed:.2f}s | {rows / max(elapsed, 1e-9):,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except ValueError as exc:
+        raise SystemExit(f"❌ {exc}")
@@ -0,0 +1,168 @@
+import argparse
+import csv
+import io
+import json
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT_DIR / "src" / "app"))
+
+from utils.batching import MicroBatcher  # noqa: E402
+from utils.constants import MODEL_PATH, COMPILED_MODEL_PATH, STRESS_LABELS  # noqa: E402
+from utils.scoring import load_scorer  # noqa: E402
+
+HOST = "127.0.0.1"
+PORT = 8765
+REQUEST_TIMEOUT_S = 30
+
+
+class ScoringServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Default listen backlog (5) resets connections under bursty clients
+    request_queue_size = 1024
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Local HTTP scoring service with micro-batching.")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--max-batch-size", type=int, default=256, help="Rows per micro-batch")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0, help="Longest a request waits for a batch")
+    parser.add_argument("--top-k", type=int, default=6, help="Contributions returned per row")
+    parser.add_argument("--load-test", type=int, default=0, metavar="N",
+                        help="Send N single-row requests to the server, print the report and exit")
+    parser.add_argument("--concurrency", type=int, default=32, help="Client threads for --load-test")
+    return parser.parse_args()
+
+
+def parse_rows(body: bytes, content_type: str, features: list):
+    """Decode a JSON ({"rows": [...]} or [...]) or CSV body into an (n, n_features) array."""
+    if "csv" in content_type:
+        records = list(csv.DictReader(io.StringIO(body.decode("utf-8"))))
+    else:
+        payload = json.loads(body or b"[]")
+        records = payload["rows"] if isinstance(payload, dict) else payload
+        if isinstance(records, dict):
+            records = [records]
+    if not records:
+        raise ValueError("No rows supplied.")
+
+    missing = [f for f in features if f not in records[0]]
+    if missing:
+        raise ValueError(f"Missing feature columns: {missing}")
+    return np.array([[float(r[f]) for f in features] for r in records])
+
+
+def format_results(scorer, pred, proba, top_idx, top_val):
+    labels = [STRESS_LABELS[c] for c in scorer.classes]
+    return [
+        {
+            "pred_class": int(scorer.classes[p]),
+            "pred_label": labels[p],
+            "probabilities": dict(zip(labels, np.round(probs, 6).tolist())),
+            "top_contributions": [
+                {"feature": scorer.feature_names[i], "contribution": round(float(v), 6)}
+                for i, v in zip(idx, vals)
+            ],
+        }
+        for p, probs, idx, vals in zip(pred, proba, top_idx, top_val)
+    ]
+
+
+def make_handler(batcher):
+    scorer = batcher.scorer
+
+    class ScoringHandler(BaseHTTPRequestHandler):
+        def _send(self, status, payload):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/health":
+                self._send(200, {"status": "ok", "model": scorer.fingerprint})
+            elif self.path == "/stats":
+                self._send(200, batcher.stats.report())
+            else:
+                self._send(404, {"error": "Not found"})
+
+        def do_POST(self):
+            if self.path != "/score":
+                self._send(404, {"error": "Not found"})
+                return
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                X = parse_rows(self.rfile.read(length), self.headers.get("Content-Type", ""), scorer.feature_names)
+            except (ValueError, KeyError, TypeError) as exc:
+                self._send(400, {"error": str(exc)})
+                return
+            try:
+                result = batcher.submit(X).result(timeout=REQUEST_TIMEOUT_S)
+            except Exception as exc:
+                self._send(500, {"error": str(exc)})
+                return
+            self._send(200, {"results": format_results(scorer, *result)})
+
+        def log_message(self, format, *args):
+            pass
+
+    return ScoringHandler
+
+
+def run_load_test(port, n_requests, concurrency, features):
+    """Fire single-row requests at the server from a thread pool."""
+    rng = np.random.default_rng(42)
+    url = f"http://{HOST}:{port}/score"
+    bodies = [
+        json.dumps([dict(zip(features, row.tolist()))]).encode()
+        for row in rng.integers(1, 6, (n_requests, len(features)))
+    ]
+
+    def one(body):
+        req = urllib.request.Request(url, body, {"Content-Type": "application/json"})
+        with urllib.request.urlopen(req) as resp:
+            resp.read()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(one, bodies))
+    return time.perf_counter() - start
+
+
+def main():
+    args = parse_args()
+    scorer = load_scorer(COMPILED_MODEL_PATH, MODEL_PATH)
+    batcher = MicroBatcher(scorer, args.max_batch_size, args.max_wait_ms, args.top_k).start()
+    server = ScoringServer((HOST, args.port), make_handler(batcher))
+
+    print(f"✅ Scoring service on http://{HOST}:{args.port} (POST /score, GET /stats, GET /health)")
+    print(f"max_batch_size={args.max_batch_size} | max_wait_ms={args.max_wait_ms}")
+
+    if args.load_test:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        elapsed = run_load_test(args.port, args.load_test, args.concurrency, scorer.feature_names)
+        server.shutdown()
+        print(f"\n--- Load test: {args.load_test} requests, {args.concurrency} clients, {elapsed:.2f}s ---")
+    else:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        server.server_close()
+
+    batcher.stop()
+    print(json.dumps(batcher.stats.report(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
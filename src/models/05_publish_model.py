@@ -0,0 +1,70 @@
+import argparse
+import shutil
+import sys
+from pathlib import Path
+
+import joblib
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT_DIR / "src" / "app"))
+
+from utils.constants import MODEL_PATH, MODEL_REGISTRY_PATH  # noqa: E402
+from utils.registry import read_registry, register_version, write_registry  # noqa: E402
+from utils.scoring import compile_pipeline, export_compiled_model  # noqa: E402
+
+VERSIONS_DIR = MODEL_REGISTRY_PATH.parent / "versions"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Publish a trained pipeline as a new model version, or switch the active version."
+    )
+    parser.add_argument("--pipeline", type=Path, default=MODEL_PATH, help="Trained sklearn pipeline (.joblib)")
+    parser.add_argument("--version", help="Version label (default: next vN)")
+    parser.add_argument("--no-activate", action="store_true", help="Register without switching traffic to it")
+    parser.add_argument("--activate", metavar="VERSION", help="Only point the registry at an existing version")
+    return parser.parse_args()
+
+
+def next_version(registry: dict) -> str:
+    numbers = [int(v[1:]) for v in registry.get("versions", {}) if v[:1] == "v" and v[1:].isdigit()]
+    return f"v{max(numbers, default=0) + 1}"
+
+
+def main():
+    args = parse_args()
+    registry = read_registry(MODEL_REGISTRY_PATH) if MODEL_REGISTRY_PATH.exists() else {"versions": {}}
+
+    if args.activate:
+        if args.activate not in registry["versions"]:
+            raise SystemExit(f"❌ Unknown version {args.activate!r}. Known: {', '.join(registry['versions'])}")
+        registry["active"] = args.activate
+        write_registry(registry, MODEL_REGISTRY_PATH)
+        print("✅ Active model version:", args.activate)
+        return
+
+    version = args.version or next_version(registry)
+    if version in registry["versions"]:
+        raise SystemExit(f"❌ Version {version!r} already exists; published artifacts are immutable.")
+
+    # Each version gets its own directory: running apps memory-map the previous
+    # artifact, so it must never be overwritten in place
+    target = VERSIONS_DIR / version
+    target.mkdir(parents=True)
+    pipeline_path = target / args.pipeline.name
+    shutil.copy2(args.pipeline, pipeline_path)
+
+    compiled = compile_pipeline(joblib.load(pipeline_path))
+    artifact_path = target / (pipeline_path.stem + ".bin")
+    checksum = export_compiled_model(compiled, artifact_path, source=pipeline_path.name)
+
+    registry = register_version(
+        MODEL_REGISTRY_PATH, version, artifact_path, pipeline_path, checksum, activate=not args.no_activate
+    )
+    print("✅ Published model version:", version, "->", artifact_path)
+    print("SHA-256:", checksum)
+    print("Active model version:", registry["active"])
+
+
+if __name__ == "__main__":
+    main()
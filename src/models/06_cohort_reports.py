@@ -0,0 +1,171 @@
+import argparse
+import os
+import re
+import sys
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT_DIR / "src" / "app"))
+
+from utils.constants import MODEL_PATH, COMPILED_MODEL_PATH, MODEL_REGISTRY_PATH  # noqa: E402
+from utils.dataset import iter_questionnaire  # noqa: E402
+from utils.registry import ModelRegistry  # noqa: E402
+from utils.reports import REPORT_FORMATS, render_report  # noqa: E402
+from utils.results import PredictionRecord, suggestion_ids_for  # noqa: E402
+from utils.scoring import attach_compiled_model, share_compiled_model, top_k_contributions  # noqa: E402
+
+CHUNK_SIZE = 2_000
+TOP_K = 6
+CHUNKS_IN_FLIGHT = 2  # per worker: bounds rendered-but-unwritten reports to a few chunks
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Score a cohort and stream one report per student into a ZIP archive."
+    )
+    parser.add_argument("input", help="CSV or columnar (.col) file with the stress_clean.csv feature columns")
+    parser.add_argument("output", help="Destination .zip archive")
+    parser.add_argument("--formats", default="txt",
+                        help=f"Comma-separated report formats ({', '.join(REPORT_FORMATS)})")
+    parser.add_argument("--id-column", help="Column with student ids (default: row numbers)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Students per worker task")
+    parser.add_argument("--top-k", type=int, default=TOP_K, help="Contributing factors per report")
+    parser.add_argument("--workers", type=int, default=0, help="Rendering processes (0 = all cores)")
+    parser.add_argument("--store", action="store_true",
+                        help="Store reports uncompressed (faster; the archive is ~3x larger)")
+    args = parser.parse_args()
+
+    args.formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    unknown = [f for f in args.formats if f not in REPORT_FORMATS]
+    if unknown or not args.formats:
+        parser.error(f"unknown report format(s): {', '.join(unknown) or '(none)'}")
+    return args
+
+
+def archive_name(subject: str) -> str:
+    """Safe file stem for a student id inside the archive."""
+    return re.sub(r"[^\w.-]+", "_", subject).strip("._") or "student"
+
+
+def render_chunk(scorer, version, X, subjects, formats, top_k, generated) -> list:
+    """Score one chunk and render its reports; returns (archive name, bytes) pairs in row order."""
+    pred, proba, contrib = scorer.score(X)
+    top_idx, top_val = top_k_contributions(contrib, top_k)
+    names = scorer.feature_names
+
+    members = []
+    for row, subject in enumerate(subjects):
+        indices = tuple(int(i) for i in top_idx[row])
+        record = PredictionRecord(
+            model_version=version,
+            pred_class=int(scorer.classes[pred[row]]),
+            probabilities=tuple(float(p) for p in proba[row]),
+            top_indices=indices,
+            top_values=tuple(float(v) for v in top_val[row]),
+            suggestion_ids=suggestion_ids_for(names[i] for i in indices),
+        )
+        stem = archive_name(subject)
+        for fmt in formats:
+            report = render_report(record, names, fmt, generated, subject)
+            members.append((stem + REPORT_FORMATS[fmt].extension, report.encode("utf-8")))
+    return members
+
+
+_WORKER = {}
+
+
+def _init_worker(spec, version, generated):
+    # Weights come from the parent's shared-memory segment, not a fresh unpickle
+    _WORKER["shm"], _WORKER["scorer"] = attach_compiled_model(spec)
+    _WORKER["version"], _WORKER["generated"] = version, generated
+
+
+def _render_task(task):
+    X, subjects, formats, top_k = task
+    return render_chunk(_WORKER["scorer"], _WORKER["version"], X, subjects, formats, top_k, _WORKER["generated"])
+
+
+def iter_tasks(args, feature_names):
+    """(answers, student ids, formats, top_k) per input chunk."""
+    seen = set()
+    row = 0
+    for data in iter_questionnaire(args.input, args.chunk_size, feature_names):
+        if args.id_column:
+            if args.id_column not in data.passthrough.columns:
+                raise ValueError(f"Id column {args.id_column!r} not found in {args.input}")
+            subjects = data.passthrough[args.id_column].astype(str).tolist()
+            stems = [archive_name(s) for s in subjects]
+            duplicates = seen.intersection(stems) or (len(set(stems)) < len(stems))
+            if duplicates:
+                raise ValueError(f"Student ids in {args.id_column!r} must be unique (as file names)")
+            seen.update(stems)
+        else:
+            subjects = [f"student_{row + i + 1:06d}" for i in range(len(data.X))]
+        row += len(data.X)
+        yield data.X, subjects, args.formats, args.top_k
+
+
+def bounded_map(pool, fn, tasks, in_flight):
+    """`pool.map` that keeps at most `in_flight` tasks submitted, yielding results in task order."""
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.submit(fn, task))
+        if len(pending) >= in_flight:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def write_archive(path, chunks, store=False) -> int:
+    """Append every rendered chunk to a new ZIP as it arrives; returns the number of reports."""
+    compression = zipfile.ZIP_STORED if store else zipfile.ZIP_DEFLATED
+    count = 0
+    with zipfile.ZipFile(path, "w", compression=compression) as archive:
+        for members in chunks:
+            for name, data in members:
+                archive.writestr(name, data)
+            count += len(members)
+    return count
+
+
+def main():
+    args = parse_args()
+    snapshot = ModelRegistry(MODEL_REGISTRY_PATH, COMPILED_MODEL_PATH, MODEL_PATH).current()
+    scorer, version = snapshot.scorer, snapshot.version
+    workers = args.workers or os.cpu_count()
+    generated = datetime.now().strftime("%Y-%m-%d %H:%M")
+    tasks = iter_tasks(args, scorer.feature_names)
+
+    start = time.perf_counter()
+    if workers > 1:
+        shm, spec = share_compiled_model(scorer)
+        try:
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(spec, version, generated)) as pool:
+                chunks = bounded_map(pool, _render_task, tasks, workers * CHUNKS_IN_FLIGHT)
+                reports = write_archive(args.output, chunks, args.store)
+        finally:
+            shm.close()
+            shm.unlink()
+    else:
+        chunks = (render_chunk(scorer, version, *task, generated) for task in tasks)
+        reports = write_archive(args.output, chunks, args.store)
+
+    elapsed = time.perf_counter() - start
+    size_mb = Path(args.output).stat().st_size / 1e6
+    print("✅ Cohort reports saved to:", args.output)
+    print(
+        f"Reports: {reports:,} ({', '.join(args.formats)}) | model {version} | workers: {workers} | "
+        f"{elapsed:.2f}s | {reports / max(elapsed, 1e-9):,.0f} reports/s | {size_mb:.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except ValueError as exc:
+        raise SystemExit(f"❌ {exc}")